@@ -0,0 +1,105 @@
+# measures full-window repaint and resize cost of the curling ICE.jpg background drawn by a
+# stylesheet `background-image` against the cached pre-scaled pixmap in
+# views/media/background.py
+#
+# run from the repo root:
+#   python exploratory_code/benchmark_background.py --repeats 50
+
+# imports
+import os
+import sys
+import time
+import argparse
+import statistics
+
+# run headless and make the views package importable
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.append(os.getcwd())
+
+# PyQt imports
+from PyQt5.QtGui import QPainter
+from PyQt5.QtWidgets import QApplication, QMainWindow
+
+# cached pre-scaled background
+from views.media.background import ScaledBackground
+
+# the curling window background
+ICE_BACKGROUND_PATH = os.path.join("views", "curling", "graphics", "ICE.jpg")
+
+# the stylesheet the curling view used before the cached background
+STYLESHEET = """
+    StylesheetWindow {
+        background-image: url("%s");
+        background-repeat: no-repeat;
+        background-position: center;
+    }
+""" % ICE_BACKGROUND_PATH.replace(os.sep, "/")
+
+
+class StylesheetWindow(QMainWindow):
+    """background drawn by the style sheet engine"""
+    pass
+
+
+class CachedWindow(QMainWindow):
+    """background drawn from the cached pre-scaled pixmap"""
+
+    def __init__(self):
+        super().__init__()
+        self.background = ScaledBackground(ICE_BACKGROUND_PATH)
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        self.background.paint(painter, self.rect(), self.devicePixelRatioF())
+        painter.end()
+
+
+def time_repaints(window, repeats):
+    """returns the median seconds of a synchronous full-window repaint"""
+    times = []
+    for i in range(repeats):
+        start = time.perf_counter()
+        window.repaint()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def time_resizes(window, sizes, repeats):
+    """returns the median seconds of a resize followed by a full-window repaint"""
+    times = []
+    for i in range(repeats):
+        (w, h) = sizes[i % len(sizes)]
+        start = time.perf_counter()
+        window.resize(w, h)
+        window.repaint()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+if __name__ == '__main__':
+    # construct the argument parser and parse the arguments
+    ap = argparse.ArgumentParser()
+    ap.add_argument("-r", "--repeats", type=int, default=50,
+        help="repaints / resizes per window")
+    ap.add_argument("--width", type=int, default=1920,
+        help="window width")
+    ap.add_argument("--height", type=int, default=1080,
+        help="window height")
+    args = vars(ap.parse_args())
+
+    app = QApplication(sys.argv)
+    app.setStyleSheet(STYLESHEET)
+    sizes = [(args["width"], args["height"]), (args["width"] - 200, args["height"] - 100)]
+
+    print("{:>12} {:>12} {:>12}".format("window", "repaint ms", "resize ms"))
+    for cls in (StylesheetWindow, CachedWindow):
+        window = cls()
+        window.resize(args["width"], args["height"])
+        window.show()
+        app.processEvents()
+
+        repaint = time_repaints(window, args["repeats"])
+        resize = time_resizes(window, sizes, args["repeats"])
+        print("{:>12} {:12.2f} {:12.2f}".format(cls.__name__.replace("Window", ""),
+            repaint * 1000, resize * 1000))
+        window.close()
@@ -0,0 +1,86 @@
+# benchmarks the legacy OpenCV + imutils logo loading path (`load_logo_qImg` before the
+# pixmap cache) against the QImageReader scaled decode used by views/media/pixmapcache.py
+#
+# run from the repo root:
+#   python exploratory_code/benchmark_image_decode.py --width 200
+
+# imports
+import os
+import sys
+import time
+import argparse
+import statistics
+
+# run headless and make the views package importable
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.append(os.getcwd())
+
+# PyQt imports
+from PyQt5.QtGui import QGuiApplication, QImage, QImageReader
+
+# Qt-native scaled decode
+from views.media.pixmapcache import decode_source_image
+
+# other imports
+import cv2
+import imutils
+from imutils import paths
+
+
+def load_logo_qImg_legacy(pngPath, width):
+    """the original loader: full-size OpenCV decode, channel swap, then imutils resize"""
+    logo = cv2.imread(pngPath, cv2.IMREAD_UNCHANGED)
+    if logo.ndim == 2:
+        logo = cv2.cvtColor(logo, cv2.COLOR_GRAY2RGBA)
+    elif logo.shape[2] == 3:
+        logo = cv2.cvtColor(logo, cv2.COLOR_BGR2RGBA)
+    else:
+        logo = cv2.cvtColor(logo, cv2.COLOR_BGRA2RGBA)
+    logo = imutils.resize(logo, width=width)
+    height, width, channel = logo.shape
+    qImg = QImage(logo.data, width, height, channel * width, QImage.Format_RGBA8888)
+    return qImg.copy()
+
+
+def time_it(func, path, width, repeats):
+    """returns the median seconds of `repeats` calls"""
+    times = []
+    for i in range(repeats):
+        start = time.perf_counter()
+        func(path, width)
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+if __name__ == '__main__':
+    # construct the argument parser and parse the arguments
+    ap = argparse.ArgumentParser()
+    ap.add_argument("-d", "--dir", default="views",
+        help="directory of images to benchmark")
+    ap.add_argument("-w", "--width", type=int, default=200,
+        help="target width in pixels (e.g. TOP_LEFT_LOGO_SIZE)")
+    ap.add_argument("-r", "--repeats", type=int, default=5,
+        help="decodes per image per loader")
+    args = vars(ap.parse_args())
+
+    # image plugins (jpeg, etc.) are loaded through the application
+    app = QGuiApplication(sys.argv)
+
+    total_legacy = 0
+    total_qt = 0
+    print("{:>9} {:>9} {:>7} {:>10}  {}".format("cv2 ms", "qt ms", "speedup", "full MB",
+        "image"))
+    for path in sorted(paths.list_images(args["dir"])):
+        legacy = time_it(load_logo_qImg_legacy, path, args["width"], args["repeats"])
+        qt = time_it(decode_source_image, path, args["width"], args["repeats"])
+        total_legacy += legacy
+        total_qt += qt
+
+        # the full-size RGBA buffer the legacy path allocates before resizing
+        size = QImageReader(path).size()
+        full_mb = size.width() * size.height() * 4 / (1024 * 1024)
+        print("{:9.2f} {:9.2f} {:6.1f}x {:10.1f}  {}".format(legacy * 1000, qt * 1000,
+            legacy / max(qt, 1e-9), full_mb, path))
+
+    print("total: cv2 + imutils {:.1f} ms, QImageReader {:.1f} ms ({:.1f}x)".format(
+        total_legacy * 1000, total_qt * 1000, total_legacy / max(total_qt, 1e-9)))
@@ -0,0 +1,118 @@
+# CPU cost of a reaction: GIF (QMovie / frame cache) vs. video clip (QMediaPlayer)
+#
+# plays each reaction in the scoreboard's overlay windows and measures the CPU time used
+# while it's on screen, so the two formats can be compared on the box that runs the
+# scoreboard (a Raspberry Pi, say).  Two numbers are reported for each play:
+#   gui      CPU time of the GUI thread alone (painting, QMovie decoding on a frame
+#            cache miss, handing video frames to the window)
+#   process  CPU time of the whole process: the GUI thread plus the frame cache's decode
+#            thread and the media backend's threads
+# The cold play is the first one, with nothing warmed (a GIF plays with QMovie while its
+# frames decode in the background, a clip is loaded when pressed); the warm plays come
+# after `OverlayPool.warm()` has finished, like a press of a prefetched reaction.
+# Video clips play to their end, so their share of a core is over the clip's length.
+#
+# run from the repo root:
+#   python exploratory_code/benchmark_reactions.py --gif animations/good_shot/<name>.gif \
+#       --video animations/good_shot/<name>.mp4 --seconds 5 --repeats 3
+
+# imports
+import os
+import sys
+import time
+import argparse
+import statistics
+
+# make the views package importable
+sys.path.append(os.getcwd())
+
+# PyQt imports
+from PyQt5.QtWidgets import QApplication
+
+
+def run_reaction(app, overlays, path, seconds):
+    """
+    plays one reaction (a GIF for `seconds`, a clip to its end); returns (wall seconds,
+    GUI thread CPU seconds, process CPU seconds)
+    """
+    from views.media.animation import Animation
+    animation = Animation(path, overlays, timeout=seconds)
+    done = []
+    animation.finished.connect(lambda: done.append(True))
+
+    wall = time.perf_counter()
+    gui = time.thread_time()
+    cpu = time.process_time()
+    animation.start()
+    while not done:
+        app.processEvents()
+        time.sleep(0.001)
+    return (time.perf_counter() - wall, time.thread_time() - gui,
+        time.process_time() - cpu)
+
+
+def wait_for_warm(app):
+    # the frame decode runs on a worker; a clip loads in the media backend
+    from views.media.framecache import FRAME_CACHE
+    deadline = time.perf_counter() + 30
+    while FRAME_CACHE._pending and time.perf_counter() < deadline:
+        app.processEvents()
+        time.sleep(0.01)
+    end = time.perf_counter() + 1
+    while time.perf_counter() < end:
+        app.processEvents()
+        time.sleep(0.01)
+
+
+def report(name, path, label, runs):
+    wall = statistics.median(r[0] for r in runs)
+    gui = statistics.median(r[1] for r in runs)
+    cpu = statistics.median(r[2] for r in runs)
+    print("{:>6} {:>40} {:>11}  gui {:7.0f} ms  process {:7.0f} ms  over {:5.1f} s  "
+          "({:4.1f}% of a core)".format(name, os.path.basename(path), label, gui * 1000,
+              cpu * 1000, wall, 100 * cpu / wall))
+
+
+def benchmark(app, overlays, name, path, args):
+    from views.media.framecache import FRAME_CACHE
+
+    # nothing decoded or loaded ahead of the first play
+    FRAME_CACHE.clear()
+    for player in overlays.clips.players:
+        player.unload()
+    report(name, path, "cold", [run_reaction(app, overlays, path, args["seconds"])])
+
+    runs = []
+    for i in range(args["repeats"]):
+        overlays.warm(path)
+        wait_for_warm(app)
+        runs.append(run_reaction(app, overlays, path, args["seconds"]))
+    report(name, path, "warm median", runs)
+
+
+if __name__ == '__main__':
+    # construct the argument parser and parse the arguments
+    ap = argparse.ArgumentParser()
+    ap.add_argument("-g", "--gif", action="append", default=[],
+        help="GIF reaction to play (repeatable)")
+    ap.add_argument("-v", "--video", action="append", default=[],
+        help="video clip reaction to play (repeatable)")
+    ap.add_argument("-s", "--seconds", type=float, default=5,
+        help="how long each GIF reaction is shown (clips play to their end)")
+    ap.add_argument("-r", "--repeats", type=int, default=3,
+        help="warm plays per reaction")
+    args = vars(ap.parse_args())
+
+    app = QApplication(sys.argv)
+    from views.media.screen import SCREEN_PROFILE
+    from views.media.overlay import OverlayPool
+    SCREEN_PROFILE.update(app.primaryScreen())
+    overlays = OverlayPool()
+
+    print("CPU time while a reaction is on screen (GIFs {} s each, clips to their end)"
+        .format(args["seconds"]))
+    for path in args["gif"]:
+        benchmark(app, overlays, "gif", path, args)
+    for path in args["video"]:
+        benchmark(app, overlays, "video", path, args)
+    overlays.close()
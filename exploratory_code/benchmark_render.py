@@ -0,0 +1,234 @@
+# headless render benchmark for the bocce and curling MainWindows
+#
+# runs each window offscreen with Google Sheets, the TV remote and sounds/animations
+# stubbed out, drives a scripted sequence of state changes (score cycles, indicator
+# toggles, card moves, stone throws) and reports the render latency of each operation
+# plus the full-window paint time distribution
+#
+# run from the repo root:
+#   python exploratory_code/benchmark_render.py --game both --repeats 50
+#   python exploratory_code/benchmark_render.py --game curling --view canvas
+
+# imports
+import os
+import sys
+import time
+import types
+import argparse
+import statistics
+from unittest import mock
+
+# run headless and make the model / views packages importable
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.append(os.getcwd())
+
+# PyQt imports
+from PyQt5.QtCore import QObject, pyqtSignal
+from PyQt5.QtWidgets import QApplication
+
+
+class FakeGSheet:
+    """stands in for the Google Sheet: a handful of teams and one court schedule"""
+
+    def __init__(self):
+        self.writes = 0
+
+    def get_values(self, range_name):
+        if range_name.startswith("teams"):
+            return [["Team {}".format(i)] for i in range(1, 17)]
+        return [[str(court), "6:{}0".format(court), "Team {}".format(2 * court - 1),
+            "Team {}".format(2 * court), "0", "0"] for court in range(1, 7)]
+
+    def set_values(self, range_name, values):
+        self.writes += 1
+
+
+class FakeATI(QObject):
+    """stands in for the ATI remote receiver (the benchmark uses the keyboard remote)"""
+    newUniqueKeyPress = pyqtSignal(object)
+
+    def connect(self):
+        pass
+
+    def run(self):
+        pass
+
+
+def install_stubs():
+    """replaces the Sheets, remote and sound modules before the views import them"""
+    gsheet = types.ModuleType("model.googlesheets.gsheet")
+    gsheet.GSheet = FakeGSheet
+    sys.modules["model.googlesheets.gsheet"] = gsheet
+
+    ati = types.ModuleType("model.remotes.ati")
+    ati.ATI = FakeATI
+    sys.modules["model.remotes.ati"] = ati
+
+    playsound = types.ModuleType("playsound")
+    playsound.playsound = lambda *args, **kwargs: None
+    sys.modules["playsound"] = playsound
+
+
+def percentile(values, pct):
+    values = sorted(values)
+    idx = min(len(values) - 1, int(round(pct / 100.0 * (len(values) - 1))))
+    return values[idx]
+
+
+def report(title, timings):
+    """prints count / median / p95 / max milliseconds for each named list of seconds"""
+    print("\n{}".format(title))
+    print("{:>28} {:>6} {:>9} {:>9} {:>9}".format("operation", "n", "median", "p95",
+        "max"))
+    for name, seconds in timings.items():
+        ms = [s * 1000 for s in seconds]
+        print("{:>28} {:6d} {:9.2f} {:9.2f} {:9.2f}".format(name, len(ms),
+            statistics.median(ms), percentile(ms, 95), max(ms)))
+
+
+def settle(app, window):
+    """lets the background preload (and any queued paints) finish"""
+    deadline = time.perf_counter() + 30
+    while not window.preloader.is_ready() and time.perf_counter() < deadline:
+        app.processEvents()
+        time.sleep(0.01)
+    app.processEvents()
+
+
+def run_script(app, operations, repeats):
+    """
+    times each operation through to pixels: the state change plus the one frame Qt
+    paints its posted updates in
+    """
+    timings = {name: [] for name, op in operations}
+    for i in range(repeats):
+        for name, op in operations:
+            start = time.perf_counter()
+            op(i)
+            app.processEvents()
+            timings[name].append(time.perf_counter() - start)
+    return timings
+
+
+def time_full_paints(window, repeats):
+    """synchronous full-window repaints"""
+    times = []
+    for i in range(repeats):
+        start = time.perf_counter()
+        window.repaint()
+        times.append(time.perf_counter() - start)
+    return {"full window repaint": times}
+
+
+def bocce_operations(win):
+    home, away = win.homeTeam, win.awayTeam
+
+    def score_cycle(i):
+        win.increment_score(home)
+        win.decrement_score(home)
+
+    def temp_points(i):
+        home.temp_points = i % 4
+        win.update_score_widget(home, showTempPoints=True)
+
+    def indicator_toggle(i):
+        home.ballFlag.cycle_up()
+        away.ballFlag.cycle_down()
+        win.draw_ball_indicator(home)
+        win.draw_ball_indicator(away)
+
+    def lock_and_cancel_frame(i):
+        # fewer than 4 points, so no casino animation plays
+        home.temp_points = 1
+        away.temp_points = 0
+        win.lock_in_frame_score()
+        win.cancel_previous_frame_score()
+
+    return [("score cycle", score_cycle), ("temp points", temp_points),
+        ("indicator toggle", indicator_toggle), ("lock + cancel frame", lock_and_cancel_frame)]
+
+
+def curling_operations(win):
+    num_cards = len(win.card_start_positions)
+
+    def card_select(i):
+        win.select_card(i % num_cards + 1)
+
+    def card_move(i):
+        # move a card to a blank end slot and back
+        card = i % num_cards + 1
+        start = win.card_start_positions[card - 1]
+        blank = win.blank_end_positions[card - 1]
+        win.draw_card(card, "clear_it", start)
+        win.draw_card(card, "gray", blank)
+        win.draw_card(card, "clear_it", blank)
+        win.draw_card(card, "white", start)
+        win.card_place_color_map[card] = [start, "white", False]
+
+    def stone_throw(i):
+        win.teamA_num_stones = 7 - i % 8
+        win.teamB_num_stones = 7 - i % 8
+        win.draw_stones(win.teamA)
+        win.draw_stones(win.teamB)
+
+    def hammer(i):
+        win.clear_hammer()
+
+    return [("card select", card_select), ("card move", card_move),
+        ("stone throw", stone_throw), ("hammer / team logos", hammer)]
+
+
+def benchmark(app, game, view, args):
+    clargs = {"game": game, "view": view, "remote": "sparkfun", "media_overlay": False}
+    if game == "bocce":
+        import views.bocce.bocceui as gameui
+        ui = os.path.join(os.getcwd(), "views", "bocce", "digital_scoreboard.ui")
+        operations = bocce_operations
+    else:
+        import views.curling.curlingui as gameui
+        ui = os.path.join(os.getcwd(), "views", "curling", "curlingui_leelanau.ui")
+        operations = curling_operations
+
+    # no sounds or animations
+    with mock.patch.object(gameui, "play_random_sound", lambda *args, **kwargs: None), \
+            mock.patch.object(gameui.MainWindow, "play_random_animation",
+                lambda *args, **kwargs: None):
+        start = time.perf_counter()
+        win = gameui.MainWindow(ui, clargs)
+        win.showNormal()
+        win.resize(args["width"], args["height"])
+        settle(app, win)
+        print("\n{} ({}) window ready in {:.0f} ms".format(game, view,
+            (time.perf_counter() - start) * 1000))
+
+        report("{} operations (ms)".format(game), run_script(app, operations(win),
+            args["repeats"]))
+        report("{} paints (ms)".format(game), time_full_paints(win, args["repeats"]))
+
+    from views.media.render import REDRAW_TRACKER, RENDER_SCHEDULER
+    REDRAW_TRACKER.log_stats()
+    RENDER_SCHEDULER.log_stats()
+    win.hide()
+    win.deleteLater()
+
+
+if __name__ == '__main__':
+    # construct the argument parser and parse the arguments
+    ap = argparse.ArgumentParser()
+    ap.add_argument("-g", "--game", default="both", choices=["bocce", "curling", "both"],
+        help="which scoreboard to benchmark")
+    ap.add_argument("-v", "--view", default="leelanau", choices=["leelanau", "canvas"],
+        help="curling view")
+    ap.add_argument("-r", "--repeats", type=int, default=50,
+        help="iterations of the scripted sequence")
+    ap.add_argument("--width", type=int, default=1920,
+        help="window width")
+    ap.add_argument("--height", type=int, default=1080,
+        help="window height")
+    args = vars(ap.parse_args())
+
+    install_stubs()
+    app = QApplication(sys.argv)
+    games = ["bocce", "curling"] if args["game"] == "both" else [args["game"]]
+    for game in games:
+        benchmark(app, game, "digital" if game == "bocce" else args["view"], args)
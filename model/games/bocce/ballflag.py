@@ -1,11 +1,27 @@
+# imports
+from enum import IntEnum
+
+class Flag(IntEnum):
+    """compact ball flag states (cheap to compare and to use as lookup table keys)"""
+    NOT_THROWN = 0
+    OUT = 1
+    IN = 2
+    HOT_SHOT = 3
+    KISS = 4
+    MEASUREMENT = 5
+    CASINO = 6
+
+    def __str__(self):
+        return self.name.replace("_", " ").title()
+
 class BallFlag:
-    NOT_THROWN = "Not Thrown"
-    OUT = "Out"
-    IN = "In"
-    HOT_SHOT = "Hot Shot"
-    KISS = "Kiss"
-    MEASUREMENT = "Measurement"
-    CASINO = "Casino"
+    NOT_THROWN = Flag.NOT_THROWN
+    OUT = Flag.OUT
+    IN = Flag.IN
+    HOT_SHOT = Flag.HOT_SHOT
+    KISS = Flag.KISS
+    MEASUREMENT = Flag.MEASUREMENT
+    CASINO = Flag.CASINO
 
     BALL_FLAG_CYCLE = [OUT, IN]
 
@@ -8,10 +8,12 @@ import os
 ap = argparse.ArgumentParser()
 ap.add_argument("-g", "--game", default="bocce", choices=["bocce", "curling"],
     help="what game are you playing?")
-ap.add_argument("-v", "--view", default="digital", choices=["digital", "leelanau"],
+ap.add_argument("-v", "--view", default="digital", choices=["digital", "leelanau", "canvas"],
     help="which ui do you want to run?")
 ap.add_argument("-r", "--remote", default="sparkfun", choices=["ati", "sparkfun"],
     help="which remote do you want to use")
+ap.add_argument("--media-overlay", action="store_true",
+    help="show decoded media memory usage in the corner of the window")
 args = vars(ap.parse_args())
 
 # initialize ui
@@ -39,13 +41,12 @@ elif args["game"] == "croquet":
     raise NotImplementedError
 elif args["game"] == "curling":
     from views.curling.curlingui import MainWindow
-    if args["view"] == "leelanau":
+    # the canvas view paints the leelanau layout in a single widget
+    if args["view"] in ("leelanau", "canvas"):
         ui = os.path.join(os.getcwd(), "views", "curling", "curlingui_leelanau.ui")
+        # (the ICE.jpg background is drawn from a cached pixmap by the MainWindow)
         stylesheet = """
             MainWindow {
-                background-image: url("views/curling/graphics/ICE.jpg"); 
-                background-repeat: no-repeat; 
-                background-position: center;
                 font-family: "Luckiest Guy";font-size: 40pt;
             }
             QLabel{font-family: "Luckiest Guy";font-size: 40pt;};
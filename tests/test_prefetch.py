@@ -0,0 +1,87 @@
+# imports
+import os
+import sys
+import time
+
+import pytest
+
+# the media catalog watches directories with Qt
+pytest.importorskip("PyQt5.QtCore")
+
+# make the views package importable
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+# PyQt imports
+from PyQt5.QtCore import QCoreApplication
+
+from views.media.catalog import MEDIA_CATALOG
+from views.media.prefetch import MediaPrefetcher
+
+
+# the watcher's notifications need an application (kept alive for the whole module)
+APP = QCoreApplication.instance() or QCoreApplication([])
+
+# how long the file system watcher is given to notice a change
+WATCH_TIMEOUT_S = 5
+
+
+def make_reactions(directory, names):
+    for name in names:
+        (directory / name).write_bytes(b"GIF89a")
+    return [str(directory / name) for name in names]
+
+
+def make_prefetcher():
+    warmed = []
+    unwarmed = []
+    return MediaPrefetcher((".gif",), warmed.append, unwarmed.append), warmed, unwarmed
+
+
+def test_take_hands_back_the_warmed_pick_and_warms_the_next(tmp_path):
+    files = make_reactions(tmp_path, ["a.gif", "b.gif", "c.gif"])
+    prefetch, warmed, unwarmed = make_prefetcher()
+
+    prefetch.prime([str(tmp_path)])
+    assert len(warmed) == 1
+
+    # each press plays what the previous one warmed; a bag goes through every file
+    taken = []
+    for i in range(3):
+        taken.append(prefetch.take(str(tmp_path)))
+        assert taken[-1] == warmed[i]
+        assert len(warmed) == i + 2
+    assert sorted(taken) == files
+    assert unwarmed == []
+
+
+def test_a_pick_removed_from_disk_is_skipped(tmp_path):
+    make_reactions(tmp_path, ["a.gif", "b.gif", "c.gif"])
+    prefetch, warmed, unwarmed = make_prefetcher()
+
+    # removed before the catalog has noticed
+    prefetch.prime([str(tmp_path)])
+    os.remove(warmed[0])
+    item = prefetch.take(str(tmp_path))
+    assert item != warmed[0] and os.path.isfile(item)
+    assert prefetch.misses == 1
+
+
+def test_a_dropped_pick_is_unwarmed(tmp_path):
+    make_reactions(tmp_path, ["a.gif", "b.gif"])
+    prefetch, warmed, unwarmed = make_prefetcher()
+
+    # the catalog rescans the directory once it notices the pick was removed
+    prefetch.prime([str(tmp_path)])
+    dropped = warmed[0]
+    rescans = MEDIA_CATALOG.rescans
+    os.remove(dropped)
+    deadline = time.monotonic() + WATCH_TIMEOUT_S
+    while MEDIA_CATALOG.rescans == rescans and time.monotonic() < deadline:
+        APP.processEvents()
+        time.sleep(0.01)
+    assert MEDIA_CATALOG.rescans > rescans, "the catalog didn't notice the removal"
+
+    item = prefetch.take(str(tmp_path))
+    assert unwarmed == [dropped]
+    assert item != dropped and item in warmed
@@ -9,9 +9,9 @@ sys.path.append(os.path.abspath(os.pardir))
 # PyQt imports
 from PyQt5 import QtCore, QtWidgets
 from PyQt5 import uic, QtGui, QtTest
-from PyQt5.QtGui import QImage, QPixmap, QColor, QPainter, QMovie
-from PyQt5.QtCore import QThread, QTimer, QRect, Qt, QSize
-from PyQt5.QtWidgets import QInputDialog, QWidget, QDialog, QLabel, QMessageBox
+from PyQt5.QtGui import QImage, QPixmap, QColor, QPainter
+from PyQt5.QtCore import QThread, QTimer, QRect
+from PyQt5.QtWidgets import QInputDialog, QWidget, QMessageBox
 
 # bocce game imports
 from model.games.bocce.team import Team
@@ -24,18 +24,54 @@ from model.remotes.ati import ATI
 # Google sheet interface import
 from model.googlesheets.gsheet import GSheet
 
+# shared decoded pixmap cache and background preloader
+from views.media.pixmapcache import PIXMAP_CACHE, load_pixmap
+from views.media.preloader import AssetPreloader
+
+# timed sponsor logo rotation
+from views.media.rotation import SponsorRotation
+
+# non-blocking GIF animations in persistent overlay windows
+from views.media.animation import Animation
+from views.media.overlay import OverlayPool, VIDEO_TYPES
+from views.media.framecache import FRAME_CACHE
+
+# in-memory index of the sound and animation files
+from views.media.catalog import MEDIA_CATALOG
+
+# reactions chosen and decoded before the button press
+from views.media.prefetch import MediaPrefetcher, warm_sound
+
+# one overlay, many things that want it
+from views.media.scheduler import AnimationScheduler, MediaRequest, REACTION, \
+    GAME_STATUS, ANNOUNCEMENT
+
+# idle-time photo slideshow
+from views.media.screensaver import Screensaver
+
+# pooled RGBA pixel buffers
+from views.media.buffers import BUFFER_POOL
+
+# label redraws that skip unchanged content
+from views.media.render import REDRAW_TRACKER, RENDER_SCHEDULER, draw_pixmap, clear_label
+
+# scale of the screen the scoreboard is shown on
+from views.media.screen import SCREEN_PROFILE
+
+# decoded media accounting
+from views.media.budget import MEDIA_BUDGET, MediaBudgetOverlay
+
 # color constant imports
 from .colors import *
 
+# pre-rendered ball indicators
+from .indicators import BallIndicators, make_ball
+
 # other imports
-import numpy as np
-import cv2
-import imutils
 from imutils import paths
 import argparse
 from playsound import playsound
 from tinytag import TinyTag
-import random
 import threading
 from collections import deque
 
@@ -67,10 +103,61 @@ SOUND_TYPES = (".m4a", ".mp3", ".wav", ".WAV")
 # ANIMATION TYPES
 ANIMATION_TYPES = (".gif", ".GIF")
 
+# REACTION TYPES (GIFs or short video clips)
+REACTION_TYPES = ANIMATION_TYPES + VIDEO_TYPES
+
+# REACTIONS (each has a sounds/ and an animations/ directory)
+REACTIONS = ["good_shot", "bad_shot", "too_long", "too_short", "casino",
+    "shot_clock_warning"]
+
+# the next random sound of each directory is chosen and warmed ahead of time
+SOUND_PREFETCH = MediaPrefetcher(SOUND_TYPES, warm_sound)
+
 ###### SET ME!!!!!!!!!!!!!!!!!!! ####################
 RFID_READER_CONNECTED = False
 #####################################################
 
+# GRAPHICS DIRECTORIES
+GRAPHICS_DIR = os.path.join("views", "oddball_graphics")
+BALL_INDICATORS_DIR = os.path.join(GRAPHICS_DIR, "ball_indicators")
+
+# top left logos drawn by the MainWindow
+TOP_LEFT_LOGOS = (
+    os.path.join(GRAPHICS_DIR, "cut_assets", "Mark-1C-Yellow.png"),
+    os.path.join(GRAPHICS_DIR, "select_game.png"),
+    os.path.join(GRAPHICS_DIR, "cloud.png"),
+    os.path.join(GRAPHICS_DIR, "clock.png"),
+    os.path.join(GRAPHICS_DIR, "paused.png"),
+    os.path.join(GRAPHICS_DIR, "stopped.png"),
+    os.path.join(GRAPHICS_DIR, "lightning.png"),
+    os.path.join(GRAPHICS_DIR, "gsheet_updated.png"),
+)
+
+# sponsor logos the bottom advertisement rotates through
+BOTTOM_SPONSOR_LOGOS = (
+    os.path.join("views", "packaworldintegration", "long_white.png"),
+    os.path.join(GRAPHICS_DIR, "ODDBALLSPORTS.TV.png"),
+)
+
+def preload_manifest():
+    """lists every (path, width) graphic the bocce MainWindow is known to draw"""
+    assets = [(path, TOP_LEFT_LOGO_SIZE) for path in TOP_LEFT_LOGOS]
+
+    # ball indicators are drawn at indicator size and some also in the top left
+    for path in sorted(paths.list_images(BALL_INDICATORS_DIR)):
+        assets.append((path, BALL_INDICATOR_SIZE))
+        assets.append((path, TOP_LEFT_LOGO_SIZE))
+
+    # top right logo (bottom sponsor logos are preloaded by the sponsor rotation)
+    assets.append((os.path.join(GRAPHICS_DIR, "down_and_back.png"), TOP_RIGHT_LOGO_SIZE))
+
+    return assets
+
+def asset_manifest():
+    """lists every (path, width) graphic that belongs in the on-disk asset cache"""
+    sponsors = [(path, BOTTOM_LOGO_WIDTH) for path in BOTTOM_SPONSOR_LOGOS]
+    return preload_manifest() + sponsors
+
 def soundfile_duration(path):
     tag = TinyTag.get(path)
     seconds = tag.duration
@@ -78,56 +165,27 @@ def soundfile_duration(path):
 
 
 def list_sounds(dir, contains=None):
-    """grabs all sound file paths in a directory"""
-    return list(paths.list_files(dir, validExts=SOUND_TYPES, contains=contains))
+    """grabs all sound file paths in a directory (from the in-memory media catalog)"""
+    return MEDIA_CATALOG.files(dir, SOUND_TYPES, contains=contains)
 
 def play_random_sound(sound_dir):
     """plays a random sound in a directory"""
     # play a random sound
-    sounds = list_sounds(sound_dir)
-    if len(sounds) == 0:
+    sound_filename = SOUND_PREFETCH.take(sound_dir)
+    if sound_filename is None:
         return
-    sound_filename = random.choice(sounds)
     threading.Thread(target=playsound, args=(sound_filename,)).start()
 
 def list_animations(dir, contains=None):
-    """grabs all animations in a directory path"""
-    return list(paths.list_files(dir, validExts=ANIMATION_TYPES, contains=contains))
+    """grabs all animations in a directory path (from the in-memory media catalog)"""
+    return MEDIA_CATALOG.files(dir, REACTION_TYPES, contains=contains)
 
 def sleep(timeout):
     """PyQt friendly non-blocking sleep (alternative to `time.sleep()`)"""
+    # show pending label updates before waiting
+    RENDER_SCHEDULER.flush()
     QtTest.QTest.qWait(timeout * 1000)
 
-class Animation():
-    """Plays GIF animations nearly fullscreen"""
-    # todo grab screen resolution and adjust the window size programmatically
-
-    def __init__(self, gif_path, timeout=8):
-        #super(Animation, self).__init__()
-        self.timeout=timeout
-        self.dlg = QDialog()
-        self.dlg.setWindowTitle("animation")
-        self.dlg.setWindowModality(False)
-        self.dlg.setFixedSize(800, 800)
-        self.dlg.setWindowFlags(Qt.WindowStaysOnTopHint | Qt.CustomizeWindowHint)
-        self.label_animation = QLabel(self.dlg)
-        self.movie = QMovie(gif_path)
-        self.movie.setScaledSize(QSize(self.dlg.width(), self.dlg.height()))
-        self.label_animation.setMovie(self.movie)
-
-    def start(self):
-        self.run()
-
-    def run(self):
-        self.movie.start()
-        self.dlg.show()
-        sleep(self.timeout)
-        self.quit()
-
-    def quit(self):
-        self.movie.stop()
-        self.dlg.done(0)
-
 class MainWindow(QtWidgets.QMainWindow):
 
     def __init__(self, ui, clargs, *args, **kwargs):
@@ -145,6 +203,9 @@ class MainWindow(QtWidgets.QMainWindow):
         # maximize the window
         self.showMaximized()
 
+        # size graphics for the screen the window is on
+        SCREEN_PROFILE.attach(self)
+
         # game timer and down/back setting
         self.GAME_MINUTES = DEFAULT_GAME_MINUTES
         self.GAME_WARMUP_MINUTES = DEFAULT_WARMUP_MINUTES
@@ -163,6 +224,9 @@ class MainWindow(QtWidgets.QMainWindow):
         self.clock_edit_mode = False
         self.wait_for_clock_edit_or_start = False
 
+        # the entry announcements are queued and the game timer isn't running yet
+        self.game_starting = False
+
         # minimal game info
         self.homeTeam = Team("TeamA")
         self.homeTeam.teamBallColor = TEAL
@@ -199,15 +263,36 @@ class MainWindow(QtWidgets.QMainWindow):
         # update the top left corner logo to indicating that the pallino needs to be thrown
         qImg = self.load_logo_qImg('views/oddball_graphics/cut_assets/Mark-1C-Yellow.png', TOP_LEFT_LOGO_SIZE)
         self.draw_rgba_qimg(self.label_logoadvertisement, qImg)
-        
+
+        # render every ball indicator once
+        self.ballIndicators = BallIndicators(BALL_INDICATORS_DIR, BALL_INDICATOR_SIZE,
+            TOP_LEFT_LOGO_SIZE)
+
         # draw ball indicators
-        self.draw_rgba_qimg(self.label_homeballindicator, self.cv2img_to_qImg(self.make_ball(color=(0, 0, 0)), BALL_INDICATOR_SIZE))
-        self.draw_rgba_qimg(self.label_awayballindicator, self.cv2img_to_qImg(self.make_ball(color=(0, 0, 0)), BALL_INDICATOR_SIZE))
+        self.draw_rgba_qimg(self.label_homeballindicator, self.ballIndicators.empty)
+        self.draw_rgba_qimg(self.label_awayballindicator, self.ballIndicators.empty)
         
         # draw the bottom logo
-        qImg = self.load_logo_qImg('views/packaworldintegration/long_white.png', BOTTOM_LOGO_WIDTH)
+        qImg = self.load_logo_qImg(BOTTOM_SPONSOR_LOGOS[0], BOTTOM_LOGO_WIDTH)
         self.draw_rgba_qimg(self.label_bottomadvertisement, qImg)
 
+        # the reaction animation on screen (if any) and the windows animations play in
+        self.animation = None
+        self.overlays = OverlayPool()
+
+        # the next random animation of each directory is chosen and warmed (decoded, or
+        # loaded in an idle overlay's video player) ahead of time
+        self.animation_prefetch = MediaPrefetcher(REACTION_TYPES, self.overlays.warm,
+            self.overlays.unwarm)
+
+        # decides which announcement / reaction gets the overlay
+        self.scheduler = AnimationScheduler(parent=self)
+
+        # rotate the bottom sponsor logos (the top left logo shows game status instead)
+        self.sponsors = SponsorRotation(parent=self)
+        self.sponsors.add_slot(self.label_bottomadvertisement, BOTTOM_SPONSOR_LOGOS,
+            BOTTOM_LOGO_WIDTH)
+
         # run the TV remote receiver task (it is threaded with signals)
         self.enableKeyPressEventHandler = False
         self.add_points_mode = False
@@ -235,21 +320,84 @@ class MainWindow(QtWidgets.QMainWindow):
         self.lcdNumber_game_time_remaining_sec.display(
             str(self.time_sec_left).zfill(2))
 
+        # decode the rest of the graphics in the background
+        self.preloader = AssetPreloader(preload_manifest(), parent=self)
+        self.preloader.start()
+
+        # index the sounds and animations once; new files are picked up as they land
+        MEDIA_CATALOG.index(["sounds", "animations", MEDIA_DIR])
+
+        # pick and decode the first reaction of each kind before it's asked for
+        SOUND_PREFETCH.prime([os.path.join("sounds", r) for r in REACTIONS])
+        self.animation_prefetch.prime([os.path.join("animations", r) for r in REACTIONS])
+        self.sponsors.start()
+
+        # re-render the pre-drawn graphics if the window moves to another screen
+        SCREEN_PROFILE.add_listener(self.screen_changed)
+
+        # log decoded media usage (and show it in a corner with --media-overlay)
+        MEDIA_BUDGET.start_logging()
+        self.media_overlay = None
+        if clargs.get("media_overlay"):
+            self.media_overlay = MediaBudgetOverlay(self)
+
+        # show the photo slideshow when the scoreboard sits idle between games
+        self.screensaver = Screensaver(is_idle=lambda: not self.game_in_progress())
+
         # set the window focus
         self.setFocus()
 
+    def screen_changed(self):
+        """
+        re-renders the ball indicator table and redraws the graphics on screen at the new
+        screen scale (the sponsor rotation redraws its own slots)
+        """
+        previous = self.ballIndicators
+        self.ballIndicators = BallIndicators(BALL_INDICATORS_DIR, BALL_INDICATOR_SIZE,
+            TOP_LEFT_LOGO_SIZE)
+
+        # each label shows either an indicator or a logo from the pixmap cache
+        for label in (self.label_homeballindicator, self.label_awayballindicator,
+                      self.label_logoadvertisement, self.label_downandback):
+            pixmap = label.pixmap()
+            if pixmap is None or pixmap.isNull():
+                continue
+            redrawn = self.ballIndicators.rescaled(previous, pixmap)
+            if redrawn is None:
+                redrawn = PIXMAP_CACHE.rescaled(pixmap)
+            if redrawn is not None:
+                self.draw_rgba_qimg(label, redrawn)
+
     def load_animation(self, gif_path, timeout=8):
         logging.info("loading animation")
-        self.animation = Animation(gif_path, timeout)
+
+        # a new reaction preempts the one on screen
+        if self.animation is not None:
+            self.animation.quit()
+
+        animation = Animation(gif_path, self.overlays, timeout, parent=self)
+        animation.finished.connect(lambda: self.animation_finished(animation))
+        self.animation = animation
+
+        # don't crossfade sponsor logos while the animation plays
+        self.sponsors.pause()
         self.animation.start()
         logging.info("animation started")
         self.setFocus()
         logging.info("window focus set back to main window")
+        return animation
+
+    def animation_finished(self, animation):
+        self.sponsors.resume()
+        if self.animation is animation:
+            self.animation = None
+        animation.deleteLater()
 
 
     def stop_animation(self):
         logging.info("stopping animation")
-        self.animation.quit()
+        if self.animation is not None:
+            self.animation.quit()
         self.animation = None
         logging.info("animation stopped and set to None")
         self.setFocus()
@@ -264,26 +412,41 @@ class MainWindow(QtWidgets.QMainWindow):
         event.ignore()
 
         if result == QMessageBox.Yes:
+            self.scheduler.clear()
             try:
                 self.animation.quit()
             except AttributeError:
                 pass
+            self.overlays.close()
             event.accept()
         logging.info("window closed")
+        REDRAW_TRACKER.log_stats()
+        RENDER_SCHEDULER.log_stats()
+        BUFFER_POOL.log_stats()
+        FRAME_CACHE.log_stats()
+        self.animation_prefetch.log_stats()
+        self.scheduler.log_stats()
+        MEDIA_BUDGET.log_usage()
         logging.info("most recent {} buttons = {}".format(str(len(self.buttonHistory)), str(self.buttonHistory)))
 
     def play_random_animation(self, gif_dir, timeout=5):
         logging.info("playing random animation")
-        animations = list_animations(gif_dir)
-        if len(animations)== 0:
-            return
-        gif_filename = random.choice(animations)
-        self.load_animation(gif_path=gif_filename, timeout=timeout)
+        gif_filename = self.animation_prefetch.take(gif_dir)
+        if gif_filename is None:
+            return None
+        return self.load_animation(gif_path=gif_filename, timeout=timeout)
 
     def play_animation(self, path, timeout=5):
         logging.info("playing animation located at {}".format(str(path)))
         gif_filename = path
-        self.load_animation(gif_path=gif_filename, timeout=timeout)
+        return self.load_animation(gif_path=gif_filename, timeout=timeout)
+
+    def react(self, reaction, priority=REACTION):
+        """plays a random sound and animation for a reaction through the scheduler"""
+        def play():
+            play_random_sound(os.path.join("sounds", reaction))
+            return self.play_random_animation(os.path.join("animations", reaction))
+        self.scheduler.submit(MediaRequest(priority, reaction, play))
 
     def _stop_animation(self, button):
         if self.animation is not None:
@@ -393,43 +556,45 @@ class MainWindow(QtWidgets.QMainWindow):
                     rfids_required[player[RFID_COLUMN]] = False
             return rfids_required
 
+        def announce(player):
+            # play sound
+            seconds = None
+            try:
+                if player[AUDIO_COLUMN] == "random":
+                    logging.info("playing random game announcement")
+                    sound_filepath = os.path.join(MEDIA_DIR, "announcement_game", "random")
+                    seconds = soundfile_duration(sound_filepath)
+                    play_random_sound(sound_filepath)
+                else:
+                    logging.info("playing {} game announcement".format(player[AUDIO_COLUMN]))
+                    sound_filepath = os.path.join(MEDIA_DIR, "announcement_game", "lastname_firstname", player[AUDIO_COLUMN])
+                    seconds = soundfile_duration(sound_filepath)
+                    threading.Thread(target=playsound, args=(sound_filepath,)).start()
+            except:
+                logging.warning("couldn't find sound media file")
+
+            # play a random animation for as long as the sound plays (a chosen one for 3s)
+            if seconds is not None:
+                timeout = seconds
+            else:
+                timeout = 3
+            try:
+                if player[GIF_COLUMN] == "random":
+                    logging.info("playing random game announcement gif")
+                    return self.play_random_animation(os.path.join(MEDIA_DIR, "announcement_game", "random"), timeout=timeout)
+                else:
+                    logging.info("playing {} game announcement gif".format(player[GIF_COLUMN]))
+                    gif_path = os.path.join(MEDIA_DIR, "announcement_game", "lastname_firstname", player[GIF_COLUMN])
+                    return self.play_animation(gif_path, timeout=3)
+            except:
+                logging.warning("couldn't find gif media file")
+
         def play_team_player_name(team_player_name):
             for player in player_info:
                 if player[NAME_COLUMN] == team_player_name:
-                    # play sound
-                    seconds = None
-                    try:
-                        if player[AUDIO_COLUMN] == "random":
-                            logging.info("playing random game announcement")
-                            sound_filepath = os.path.join(MEDIA_DIR, "announcement_game", "random")
-                            seconds = soundfile_duration(sound_filepath)
-                            play_random_sound(sound_filepath)
-                        else:
-                            logging.info("playing {} game announcement".format(player[AUDIO_COLUMN]))
-                            sound_filepath = os.path.join(MEDIA_DIR, "announcement_game", "lastname_firstname", player[AUDIO_COLUMN])
-                            seconds = soundfile_duration(sound_filepath)
-                            threading.Thread(target=playsound, args=(sound_filepath,)).start()
-                    except:
-                        logging.WARNING("couldn't find sound media file")
-
-                    # play animation
-                    try:
-                        if seconds is not None:
-                            timeout = seconds
-                        else:
-                            timeout = 3
-                        if player[GIF_COLUMN] == "random":
-                            logging.info("playing random game announcement gif")
-                            self.play_random_animation(os.path.join(MEDIA_DIR, "announcement_game", "random"), timeout=timeout)
-                        else:
-                            logging.info("playing {} game announcement gif".format(player[GIF_COLUMN]))
-                            gif_path = os.path.join(MEDIA_DIR, "announcement_game", "lastname_firstname", player[GIF_COLUMN])
-                            self.play_animation(gif_path, timeout=3)
-                    except:
-                        logging.WARNING("couldn't find gif media file")
-
-                    # wait N seconds before playing the next sound
-                    sleep(2.3)
+                    # queue the announcement; wait N seconds before playing the next one
+                    self.scheduler.submit(MediaRequest(ANNOUNCEMENT, team_player_name,
+                        lambda player=player: announce(player), gap=2.3, duration=3))
 
 
 
@@ -499,23 +664,27 @@ class MainWindow(QtWidgets.QMainWindow):
                                                    TOP_LEFT_LOGO_SIZE)
                         self.draw_rgba_qimg(self.label_logoadvertisement, qImg)
                     elif not self.timer_paused:
-                        self.label_logoadvertisement.clear()
-                        self.label_logoadvertisement.repaint()
+                        self.clear_label(self.label_logoadvertisement)
 
 
             elif self.wait_for_clock_edit_or_start:
                 # start the game
                 if not self.game_in_progress():
                     self.play_entry_announcement(RFID_READER_CONNECTED)
-                    sleep(2)
-
-                    # todo play game start sound
-                    sound_filename = os.path.join("sounds", "game_status",
-                                                  "lets_roll.m4a")
-                    threading.Thread(target=playsound, args=(sound_filename,)).start()
 
+                    # once the announcements are done, play the game start sound and
                     # start the timer
-                    self.start_game_timer(self.GAME_MINUTES)
+                    def start_game():
+                        self.game_starting = False
+                        sound_filename = os.path.join("sounds", "game_status",
+                                                      "lets_roll.m4a")
+                        threading.Thread(target=playsound, args=(sound_filename,)).start()
+                        self.start_game_timer(self.GAME_MINUTES)
+                    self.game_starting = True
+                    if not self.scheduler.submit(MediaRequest(GAME_STATUS, "lets_roll",
+                            start_game)):
+                        # dropped from a full queue; start right away rather than never
+                        start_game()
 
                     # reset modes
                     self.add_points_mode = False
@@ -559,8 +728,7 @@ class MainWindow(QtWidgets.QMainWindow):
                     self.awayTeam.ballFlag.toggle_in(False)
                     self.draw_ball_indicator(self.homeTeam)
                     self.draw_ball_indicator(self.awayTeam)
-                    self.label_logoadvertisement.clear()
-                    self.label_logoadvertisement.repaint()
+                    self.clear_label(self.label_logoadvertisement)
                 elif self.add_points_mode:
                     # begin cycling points and clear other team's temp score
                     self.homeTeam.cycle_score()
@@ -590,8 +758,7 @@ class MainWindow(QtWidgets.QMainWindow):
                     self.awayTeam.ballFlag.toggle_in(True)
                     self.draw_ball_indicator(self.homeTeam)
                     self.draw_ball_indicator(self.awayTeam)
-                    self.label_logoadvertisement.clear()
-                    self.label_logoadvertisement.repaint()
+                    self.clear_label(self.label_logoadvertisement)
                 elif self.add_points_mode:
                     # begin cycling points and clear other team's temp score
                     self.awayTeam.cycle_score()
@@ -618,8 +785,7 @@ class MainWindow(QtWidgets.QMainWindow):
         elif self.clock_edit_mode:
             self.clock_edit_mode = False
             self.wait_for_clock_edit_or_start = False
-            self.label_logoadvertisement.clear()
-            self.label_logoadvertisement.repaint()
+            self.clear_label(self.label_logoadvertisement)
 
     def handle_key_RETURN(self):
         # sequence: C + Return
@@ -636,33 +802,43 @@ class MainWindow(QtWidgets.QMainWindow):
                 AUDIO_COLUMN = 5
                 player_info = self.gs.get_values("players!A2:F")
 
+                def announce(player):
+                    # play sound
+                    sound_filename = os.path.join("sounds", "player_announcement",
+                                                  player[AUDIO_COLUMN])
+                    threading.Thread(target=playsound,
+                                     args=(sound_filename,)).start()
+
+                    # play animation
+                    if player[GIF_COLUMN] == "random":
+                        return self.play_random_animation(
+                            os.path.join("animations", "player_announcement"),
+                            timeout=2.4)
+                    else:
+                        gif_path = os.path.join("animations",
+                                                "player_announcement",
+                                                player[GIF_COLUMN])
+                        return self.play_animation(gif_path, timeout=2.2)
+
                 def play_team_player_name(team_player_name):
                     for player in player_info:
                         if player[NAME_COLUMN] == team_player_name:
-                            # play sound
-                            sound_filename = os.path.join("sounds", "player_announcement",
-                                                          player[AUDIO_COLUMN])
-                            threading.Thread(target=playsound,
-                                             args=(sound_filename,)).start()
-
-                            # play animation
-                            if player[GIF_COLUMN] == "random":
-                                self.play_random_animation(
-                                    os.path.join("animations", "player_announcement"),
-                                    timeout=2.4)
-                            else:
-                                gif_path = os.path.join("animations",
-                                                        "player_announcement",
-                                                        player[GIF_COLUMN])
-                                self.play_animation(gif_path, timeout=2.2)
-
-                            sleep(1.5)
+                            # queued behind the winner call
+                            self.scheduler.submit(MediaRequest(GAME_STATUS,
+                                team_player_name, lambda player=player: announce(player),
+                                gap=1.5, duration=2.4))
+
+                def play_game_status(sound_filename, seconds):
+                    def play():
+                        threading.Thread(target=playsound, args=(sound_filename,)).start()
+                    self.scheduler.submit(MediaRequest(GAME_STATUS, sound_filename, play,
+                        duration=seconds))
 
                 # play the tie game
                 if self.homeTeam.score == self.awayTeam.score:
                     sound_filename = os.path.join("sounds", "game_status",
                                                   "finishedinatie.m4a")
-                    threading.Thread(target=playsound, args=(sound_filename,)).start()
+                    play_game_status(sound_filename, 0)
 
                 # home team wins
                 elif self.homeTeam.score > self.awayTeam.score:
@@ -670,8 +846,7 @@ class MainWindow(QtWidgets.QMainWindow):
                     p2 = str(self.homeTeam).split(" & ")[1]
                     sound_filename = os.path.join("sounds", "game_status",
                                                   "winnerwinnerchickendinner.m4a")
-                    threading.Thread(target=playsound, args=(sound_filename,)).start()
-                    sleep(4)
+                    play_game_status(sound_filename, 4)
                     play_team_player_name(p1)
                     play_team_player_name(p2)
 
@@ -682,8 +857,7 @@ class MainWindow(QtWidgets.QMainWindow):
                     p2 = str(self.awayTeam).split(" & ")[1]
                     sound_filename = os.path.join("sounds", "game_status",
                                                   "winnerwinnerchickendinner.m4a")
-                    threading.Thread(target=playsound, args=(sound_filename,)).start()
-                    sleep(.5)
+                    play_game_status(sound_filename, .5)
                     play_team_player_name(p1)
                     play_team_player_name(p2)
 
@@ -703,8 +877,7 @@ class MainWindow(QtWidgets.QMainWindow):
                 self.stop_game_timer()
 
                 # clear the down and back indicator
-                self.label_downandback.clear()
-                self.label_downandback.repaint()
+                self.clear_label(self.label_downandback)
 
                 # reset prev button and return
                 self._prevButton = None
@@ -728,14 +901,9 @@ class MainWindow(QtWidgets.QMainWindow):
                 return
 
             elif not self.timer_paused and self.game_in_progress():
-                try:
-                    self.stop_animation()
-                except:
-                    pass
                 # play "shot_clock_warning"
                 # play a random sound and gif
-                play_random_sound("sounds/shot_clock_warning")
-                self.play_random_animation("animations/shot_clock_warning")
+                self.react("shot_clock_warning", priority=GAME_STATUS)
 
     def handle_key_UP(self):
         # increment minutes in clock edit mode
@@ -744,13 +912,8 @@ class MainWindow(QtWidgets.QMainWindow):
 
         # play "too long"
         else:
-            try:
-                self.stop_animation()
-            except:
-                pass
             # play a random sound and gif
-            play_random_sound("sounds/too_long")
-            self.play_random_animation("animations/too_long")
+            self.react("too_long")
 
     def handle_key_DOWN(self):
         # decrement minutes in clock edit mode
@@ -759,13 +922,8 @@ class MainWindow(QtWidgets.QMainWindow):
 
         # play "too short"
         else:
-            try:
-                self.stop_animation()
-            except:
-                pass
             # play a random sound and gif
-            play_random_sound("sounds/too_short")
-            self.play_random_animation("animations/too_short")
+            self.react("too_short")
 
     def handle_key_LEFT(self):
         if self.clock_edit_mode and not self.game_in_progress():
@@ -776,14 +934,9 @@ class MainWindow(QtWidgets.QMainWindow):
             self.game_time_ui_update()
 
         else:
-            try:
-                self.stop_animation()
-            except:
-                pass
             # play "bad shot"
             # play a random sound and gif
-            play_random_sound("sounds/bad_shot")
-            self.play_random_animation("animations/bad_shot")
+            self.react("bad_shot")
 
     def handle_key_RIGHT(self):
         if self.clock_edit_mode and not self.game_in_progress():
@@ -795,14 +948,9 @@ class MainWindow(QtWidgets.QMainWindow):
 
 
         else:
-            try:
-                self.stop_animation()
-            except:
-                pass
             # play "good shot"
             # play a random sound and gif
-            play_random_sound("sounds/good_shot")
-            self.play_random_animation("animations/good_shot")
+            self.react("good_shot")
 
     # END KEYPRESSES ##################################################################
 
@@ -832,6 +980,11 @@ class MainWindow(QtWidgets.QMainWindow):
             logging.CRITICAL("key is not being handled")
             return
 
+        # nothing can be scored until the announcements finish and the timer starts
+        if self.game_starting:
+            logging.info("game is starting, ignoring key")
+            return
+
         # play a beep
         threading.Thread(target=playsound, args=("sounds/beep/beep_padded.mp3",)).start()
 
@@ -860,6 +1013,15 @@ class MainWindow(QtWidgets.QMainWindow):
         self._prevButton = event.key()
 
     def handle_ati_remote_button_press(self, button):
+        # a button press that dismisses the screensaver does nothing else
+        if self.screensaver.wake():
+            return
+
+        # nothing can be scored until the announcements finish and the timer starts
+        if self.game_starting:
+            logging.info("game is starting, ignoring button {}".format(str(button)))
+            return
+
         # grab the button string
         button_str = str(button)
 
@@ -883,32 +1045,28 @@ class MainWindow(QtWidgets.QMainWindow):
             self.awayTeam.ballFlag.toggle_in(False)
             self.draw_ball_indicator(self.homeTeam)
             self.draw_ball_indicator(self.awayTeam)
-            self.label_logoadvertisement.clear()
-            self.label_logoadvertisement.repaint()
+            self.clear_label(self.label_logoadvertisement)
 
         elif button_str == "VOL_DOWN":
             self.homeTeam.ballFlag.toggle_in(False)
             self.awayTeam.ballFlag.toggle_in(True)
             self.draw_ball_indicator(self.homeTeam)
             self.draw_ball_indicator(self.awayTeam)
-            self.label_logoadvertisement.clear()
-            self.label_logoadvertisement.repaint()
+            self.clear_label(self.label_logoadvertisement)
 
         elif button_str == "CH_UP":
             self.homeTeam.ballFlag.toggle_in(False)
             self.awayTeam.ballFlag.toggle_in(True)
             self.draw_ball_indicator(self.homeTeam)
             self.draw_ball_indicator(self.awayTeam)
-            self.label_logoadvertisement.clear()
-            self.label_logoadvertisement.repaint()
+            self.clear_label(self.label_logoadvertisement)
 
         elif button_str == "CH_DOWN":
             self.homeTeam.ballFlag.toggle_in(True)
             self.awayTeam.ballFlag.toggle_in(False)
             self.draw_ball_indicator(self.homeTeam)
             self.draw_ball_indicator(self.awayTeam)
-            self.label_logoadvertisement.clear()
-            self.label_logoadvertisement.repaint()
+            self.clear_label(self.label_logoadvertisement)
 
         # Top left logos - GENERIC (no team)
         elif button_str == "FM":
@@ -1011,32 +1169,20 @@ class MainWindow(QtWidgets.QMainWindow):
 
         # sounds
         elif button_str == "D_UP":
-            # play a random sound
-            play_random_sound("sounds/too_long")
-
-            # open a random gif
-            self.play_random_animation("animations/too_long")
+            # play a random sound and gif
+            self.react("too_long")
 
         elif button_str == "D_DOWN":
-            # play a random sound
-            play_random_sound("sounds/too_short")
-
-            # open a random gif
-            self.play_random_animation("animations/too_short")
+            # play a random sound and gif
+            self.react("too_short")
 
         elif button_str == "D_LEFT":
-            # play a random sound
-            play_random_sound("sounds/bad_shot")
-
-            # open a random gif
-            self.play_random_animation("animations/bad_shot")
+            # play a random sound and gif
+            self.react("bad_shot")
 
         elif button_str == "D_RIGHT":
-            # play a random sound
-            play_random_sound("sounds/good_shot")
-
-            # open a random gif
-            self.play_random_animation("animations/good_shot")
+            # play a random sound and gif
+            self.react("good_shot")
 
         elif button_str == "C":
             # ball drawing bottom left and bottom right
@@ -1045,11 +1191,8 @@ class MainWindow(QtWidgets.QMainWindow):
             self.draw_ball_indicator(self.homeTeam)
             self.draw_ball_indicator(self.awayTeam)
 
-            # play a random sound
-            play_random_sound('sounds/casino')
-
-            # open a random gif
-            self.play_random_animation("animations/casino")
+            # play a random sound and gif
+            self.react("casino")
 
         elif button_str == "D":
             # ball drawing bottom left and bottom right
@@ -1058,18 +1201,12 @@ class MainWindow(QtWidgets.QMainWindow):
             self.draw_ball_indicator(self.homeTeam)
             self.draw_ball_indicator(self.awayTeam)
 
-            # play a random sound
-            play_random_sound("sounds/casino")
-
-            # open a random gif
-            self.play_random_animation("animations/casino")
+            # play a random sound and gif
+            self.react("casino")
 
         elif button_str == "E":
-            # play a random sound
-            play_random_sound("sounds/shot_clock_warning")
-
-            # open a random gif
-            self.play_random_animation("animations/shot_clock_warning")
+            # play a random sound and gif
+            self.react("shot_clock_warning", priority=GAME_STATUS)
 
         # set the previous button
         self._prevButton_str = button_str
@@ -1099,8 +1236,7 @@ class MainWindow(QtWidgets.QMainWindow):
             self.draw_ball_indicator(self.awayTeam)
 
             # play a random sound and gif
-            play_random_sound("sounds/casino")
-            self.play_random_animation("animations/casino")
+            self.react("casino")
 
         elif self.awayTeam.temp_points == 4:
             # ball drawing bottom left and bottom right
@@ -1110,8 +1246,7 @@ class MainWindow(QtWidgets.QMainWindow):
             self.draw_ball_indicator(self.awayTeam)
 
             # play a random sound and gif
-            play_random_sound("sounds/casino")
-            self.play_random_animation("animations/casino")
+            self.react("casino")
 
         self.homeTeam.add_points()
         self.awayTeam.add_points()
@@ -1129,10 +1264,8 @@ class MainWindow(QtWidgets.QMainWindow):
         self.draw_rgba_qimg(self.label_logoadvertisement, qImg)
 
         # repaint
-        self.label_homeballindicator.clear()
-        self.label_homeballindicator.repaint()
-        self.label_awayballindicator.clear()
-        self.label_awayballindicator.repaint()
+        self.clear_label(self.label_homeballindicator)
+        self.clear_label(self.label_awayballindicator)
 
     def cancel_previous_frame_score(self):
         # todo there is a bug in here that needs to be resolved (previous frame points are
@@ -1154,12 +1287,9 @@ class MainWindow(QtWidgets.QMainWindow):
         print("canceled previous frame points")
 
         # repaint
-        self.label_homeballindicator.clear()
-        self.label_homeballindicator.repaint()
-        self.label_awayballindicator.clear()
-        self.label_awayballindicator.repaint()
-        self.label_logoadvertisement.clear()
-        self.label_logoadvertisement.repaint()
+        self.clear_label(self.label_homeballindicator)
+        self.clear_label(self.label_awayballindicator)
+        self.clear_label(self.label_logoadvertisement)
 
 
     def other_team(self, team):
@@ -1205,144 +1335,64 @@ class MainWindow(QtWidgets.QMainWindow):
 
     def load_logo_qImg(self, pngPath, width):
         """
-        load the Obie logo
+        load a logo as a QPixmap resized to a known width (decoded once and shared via the
+        pixmap cache)
         """
-        # load the logo and read all channels (including alpha transparency)
-        logo = cv2.imread(pngPath, cv2.IMREAD_UNCHANGED)
-
-        # swap color channels for Qt
-        logo = cv2.cvtColor(logo, cv2.COLOR_BGRA2RGBA)
-
-        # resize to a known width maintaining aspect ratio
-        logo = imutils.resize(logo, width=width)
-
-        # extract the dimensions of the image and set the bytes per line
-        height, width, channel = logo.shape
-        bytesPerLine = channel * width
-
-        # create a QImage and ensure to use the alpha transparency format
-        qImg = QImage(logo.data, width, height, bytesPerLine, QImage.Format_RGBA8888)
-
-        return qImg
+        return load_pixmap(pngPath, width)
 
     def cv2img_to_qImg(self, image, width):
         """
-        converts a BGRA OpenCV image to qImage RGBA format (A is the alpha transparency
-        channel
+        converts a BGRA OpenCV image to an RGBA QPixmap (A is the alpha transparency
+        channel) through pooled buffers, so no QImage is left pointing at freed memory
         """
-        # swap color channels for Qt
-        image = cv2.cvtColor(image, cv2.COLOR_BGRA2RGBA)
+        return BUFFER_POOL.bgra_to_pixmap(image, width)
 
-        # resize to a known width maintaining aspect ratio
-        image = imutils.resize(image, width=width)
-
-        # extract the dimensions of the image and set the bytes per line
-        height, width, channel = image.shape
-        bytesPerLine = channel * width
-
-        # create a QImage and ensure to use the alpha transparency format
-        qImg = QImage(image.data, width, height, bytesPerLine, QImage.Format_RGBA8888)
+    def draw_rgba_qimg(self, label, qImg):
+        # cached logos are already pixmaps
+        if isinstance(qImg, QImage):
+            qImg = QPixmap.fromImage(qImg)
 
-        return qImg
+        # set the logo in the GUI (skipped if the label already shows it)
+        draw_pixmap(label, qImg)
 
-    def draw_rgba_qimg(self, label, qImg):
-        # set the logo in the GUI
-        label.setPixmap(QPixmap(qImg))
-        label.repaint()
+    def clear_label(self, label):
+        # clear the label (skipped if it's already empty)
+        clear_label(label)
 
     def make_ball(self, color=GRAY):
         """
         This simply draws a solid color ball indicator
         """
-        # create a white box for the circle to reside in; NOTE: this box has an alpha channel
-        image = np.zeros(shape=[BALL_INDICATOR_SIZE, BALL_INDICATOR_SIZE, 4], dtype=np.uint8)
-        colorWithAlpha = (color[0], color[1], color[2], 255)
-
-        # extract the dimensions
-        (height, width) = image.shape[:2]
-
-        # draw the filled in circle in the box
-        center = (int(width/2), int(height/2))
-        radius = int(width/2) - 40
-        cv2.circle(image, center, radius, colorWithAlpha, -1)
-
-        return image
+        return make_ball(color, BALL_INDICATOR_SIZE)
 
     def draw_ball_indicator(self, team):
         # initializations
         ballFlag = None
         ballIndicator = None
-        color = None
         shortTeamString = None
 
         # repaint the top left area
-        self.label_logoadvertisement.clear()
-        self.label_logoadvertisement.repaint()
+        self.clear_label(self.label_logoadvertisement)
 
         # select the team
         if team is self.homeTeam:
             ballFlag = self.homeTeam.ballFlag.get_flag()
             ballIndicator = self.label_homeballindicator
-            color = self.homeTeam.teamObieColor
             shortTeamString = "home"
 
         elif team is self.awayTeam:
             ballFlag = self.awayTeam.ballFlag.get_flag()
             ballIndicator = self.label_awayballindicator
-            color = self.awayTeam.teamObieColor
             shortTeamString = "away"
 
-        # handle ball flags
-        # the ball isn't thrown
-        if ballFlag == BallFlag.NOT_THROWN:
-            color = GRAY
-            image = self.make_ball(color)
-            qImg = self.cv2img_to_qImg(image, BALL_INDICATOR_SIZE)
-            self.draw_rgba_qimg(ballIndicator, qImg)
-
-        # the ball is out
-        elif ballFlag == BallFlag.OUT:
-            qImg = self.load_logo_qImg(
-                'views/oddball_graphics/ball_indicators/out_{}.png'.format(
-                    shortTeamString), BALL_INDICATOR_SIZE)
-            self.draw_rgba_qimg(ballIndicator, qImg)
-
-        # the ball is in
-        elif ballFlag == BallFlag.IN:
-            qImg = self.load_logo_qImg(
-                'views/oddball_graphics/ball_indicators/in_{}.png'.format(
-                    shortTeamString), BALL_INDICATOR_SIZE)
-            self.draw_rgba_qimg(ballIndicator, qImg)
+        # every (team, ball flag) indicator was rendered at startup
+        self.draw_rgba_qimg(ballIndicator,
+            self.ballIndicators.indicator(shortTeamString, ballFlag))
 
-        # the ball is in
-        elif ballFlag == BallFlag.KISS:
-            qImg = self.load_logo_qImg(
-                'views/oddball_graphics/ball_indicators/kiss.png', BALL_INDICATOR_SIZE)
-            self.draw_rgba_qimg(ballIndicator, qImg)
-
-        # terrible shot; you need a hot shot
-        elif ballFlag == BallFlag.HOT_SHOT:
-            qImg = self.load_logo_qImg(
-                'views/oddball_graphics/ball_indicators/hotshot.png', BALL_INDICATOR_SIZE)
-            self.draw_rgba_qimg(ballIndicator, qImg)
-
-        # need a measurement
-        elif ballFlag == BallFlag.MEASUREMENT:
-            qImg = self.load_logo_qImg(
-                'views/oddball_graphics/ball_indicators/measurement.png', BALL_INDICATOR_SIZE)
-            self.draw_rgba_qimg(ballIndicator, qImg)
-
-        # you earned yourself a casino
-        elif ballFlag == BallFlag.CASINO:
-            # draw the team casino and the top left casino
-            qImg = self.load_logo_qImg(
-                'views/oddball_graphics/ball_indicators/casino_{}.png'.format(shortTeamString),
-                BALL_INDICATOR_SIZE)
-            self.draw_rgba_qimg(ballIndicator, qImg)
-            qImg = self.load_logo_qImg(
-                'views/oddball_graphics/ball_indicators/casino_{}.png'.format(
-                    shortTeamString), TOP_LEFT_LOGO_SIZE)
-            self.draw_rgba_qimg(self.label_logoadvertisement , qImg)
+        # you earned yourself a casino; draw the top left casino too
+        if ballFlag == BallFlag.CASINO:
+            self.draw_rgba_qimg(self.label_logoadvertisement,
+                self.ballIndicators.casino_top_left(shortTeamString))
 
     def time_tick(self):
         """
@@ -1415,9 +1465,8 @@ class MainWindow(QtWidgets.QMainWindow):
             self.clock_count_down = False
             self.clock_count_up = True
 
-        # repaint the down and back area
+        # reset the down and back area
         self.down_and_back = False
-        self.label_downandback.repaint()
 
         # reset the score at the start of a game
         self.homeTeam.score = 0
@@ -1426,10 +1475,8 @@ class MainWindow(QtWidgets.QMainWindow):
         self.update_score_widget(self.awayTeam)
 
         # clear ball indicators (just in case a game just finished)
-        self.label_homeballindicator.clear()
-        self.label_homeballindicator.repaint()
-        self.label_awayballindicator.clear()
-        self.label_awayballindicator.repaint()
+        self.clear_label(self.label_homeballindicator)
+        self.clear_label(self.label_awayballindicator)
 
 
         # repaint the top left logo to Yello
@@ -1450,7 +1497,7 @@ class MainWindow(QtWidgets.QMainWindow):
         self.lcdNumber_framenumber.display(str(self.frame_count))
 
         # clear the down and back top right image
-        self.label_downandback.clear()
+        self.clear_label(self.label_downandback)
 
     def increment_frame_count(self):
         self.frame_count += 1
@@ -1472,10 +1519,8 @@ class MainWindow(QtWidgets.QMainWindow):
             self.time_sec_left = 0
             self.game_time_ui_update()
             self.GAME_MINUTES = DEFAULT_GAME_MINUTES
-            self.label_homeballindicator.clear()
-            self.label_homeballindicator.repaint()
-            self.label_awayballindicator.clear()
-            self.label_awayballindicator.repaint()
+            self.clear_label(self.label_homeballindicator)
+            self.clear_label(self.label_awayballindicator)
             self.frame_count = 0
             self.lcdNumber_framenumber.display(str(self.frame_count))
 
@@ -0,0 +1,128 @@
+# imports
+import os
+
+# bocce game imports
+from model.games.bocce.ballflag import Flag
+
+# shared decoded pixmap cache
+from views.media.pixmapcache import load_pixmap
+
+# scale of the screen the scoreboard is shown on
+from views.media.screen import SCREEN_PROFILE
+
+# pooled RGBA pixel buffers
+from views.media.buffers import BUFFER_POOL
+
+# color constant imports
+from .colors import GRAY
+
+# other imports
+import numpy as np
+import cv2
+
+# TEAMS (as used in the indicator file names, e.g. in_home.png)
+TEAM_KEYS = ("home", "away")
+
+# indicator graphic for each flag ("{}" is replaced with the team key)
+FLAG_GRAPHICS = {
+    Flag.OUT: "out_{}.png",
+    Flag.IN: "in_{}.png",
+    Flag.KISS: "kiss.png",
+    Flag.HOT_SHOT: "hotshot.png",
+    Flag.MEASUREMENT: "measurement.png",
+    Flag.CASINO: "casino_{}.png",
+}
+
+
+def make_ball(color, size, image=None):
+    """
+    This simply draws a solid color ball indicator (BGRA), optionally into a given
+    (size, size, 4) buffer (the caller owns it, e.g. one from the buffer pool)
+    """
+    # create a box for the circle to reside in; NOTE: this box has an alpha channel
+    if image is None:
+        image = np.zeros(shape=[size, size, 4], dtype=np.uint8)
+    else:
+        image.fill(0)
+    colorWithAlpha = (color[0], color[1], color[2], 255)
+
+    # draw the filled in circle in the box (with a 40px margin at 200px)
+    center = (int(size/2), int(size/2))
+    radius = int(size/2) - int(size/5)
+    cv2.circle(image, center, radius, colorWithAlpha, -1)
+
+    return image
+
+
+def ball_pixmap(color, size):
+    """renders a solid color ball indicator (design size) straight to a screen pixmap"""
+    device_size = SCREEN_PROFILE.device(size)
+
+    # draw and swap channels in pooled buffers
+    bgra = make_ball(color, device_size, BUFFER_POOL.acquire(device_size, device_size))
+    rgba = BUFFER_POOL.acquire(device_size, device_size)
+    cv2.cvtColor(bgra, cv2.COLOR_BGRA2RGBA, dst=rgba)
+    BUFFER_POOL.release(bgra)
+
+    pixmap = BUFFER_POOL.to_pixmap(rgba)
+    BUFFER_POOL.release(rgba)
+    pixmap.setDevicePixelRatio(SCREEN_PROFILE.dpr)
+    return pixmap
+
+
+class BallIndicators:
+    """
+    Table of every (team, ball flag) indicator, rendered once
+
+    After construction an indicator update is a dictionary lookup; nothing is decoded or
+    drawn with OpenCV on a button press.
+    """
+
+    def __init__(self, indicators_dir, size, top_left_size):
+        self.size = size
+        self.top_left_size = top_left_size
+
+        # the draw and channel swap buffers for this indicator size
+        device_size = SCREEN_PROFILE.device(size)
+        BUFFER_POOL.reserve(device_size, device_size, count=2)
+
+        # the "not thrown" ball looks the same for both teams; a black ball is shown
+        # before the first throw
+        not_thrown = ball_pixmap(GRAY, size)
+        self.empty = ball_pixmap((0, 0, 0), size)
+
+        # (team key, flag) -> pixmap
+        self.table = {}
+        self.top_left = {}
+        for team in TEAM_KEYS:
+            self.table[(team, Flag.NOT_THROWN)] = not_thrown
+            for flag, filename in FLAG_GRAPHICS.items():
+                path = os.path.join(indicators_dir, filename.format(team))
+                self.table[(team, flag)] = load_pixmap(path, size)
+
+            # a casino is also shown in the top left corner
+            path = os.path.join(indicators_dir, FLAG_GRAPHICS[Flag.CASINO].format(team))
+            self.top_left[team] = load_pixmap(path, top_left_size)
+
+    def indicator(self, team, flag):
+        """grabs the ball indicator for a team key ("home" / "away") and flag"""
+        return self.table[(team, flag)]
+
+    def casino_top_left(self, team):
+        """grabs the top left corner casino graphic for a team key"""
+        return self.top_left[team]
+
+    def rescaled(self, previous, pixmap):
+        """
+        the graphic in this table that `pixmap` (from the `previous` table, rendered at
+        another screen scale) shows, or None if it isn't an indicator
+        """
+        key = pixmap.cacheKey()
+        if key == previous.empty.cacheKey():
+            return self.empty
+        for table, ours in ((previous.table, self.table),
+                            (previous.top_left, self.top_left)):
+            for name, drawn in table.items():
+                if drawn.cacheKey() == key:
+                    return ours[name]
+        return None
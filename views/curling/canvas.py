@@ -0,0 +1,151 @@
+# PyQt imports
+from PyQt5.QtCore import QPoint, QRect, QSize, Qt
+from PyQt5.QtGui import QPainter, QPalette
+from PyQt5.QtWidgets import QLabel, QStyle, QWidget
+
+# logging
+import logging
+
+
+class CanvasSlot:
+    """
+    A spot on the scoreboard canvas that stands in for one QLabel of the .ui file
+
+    Slots support the parts of the QLabel API the scoreboard uses (pixmaps, text,
+    clear and repaint), so game logic, StoneRow and the redraw tracker work on them
+    unchanged.  Changing a slot only invalidates its own rectangle of the canvas.
+    """
+
+    def __init__(self, canvas, name, rect, alignment, font, color, scaled=False):
+        self.canvas = canvas
+        self.name = name
+        self.alignment = alignment
+        self.scaled = scaled
+        self.font = font
+        self.color = color
+        self._pixmap = None
+        self._text = ""
+
+        # the rect in the captured layout and the rect on the canvas right now
+        self.design_rect = QRect(rect)
+        self.rect = QRect(rect)
+
+    def objectName(self):
+        return self.name
+
+    def window(self):
+        return self.canvas.window()
+
+    def hasScaledContents(self):
+        return self.scaled
+
+    def setScaledContents(self, scaled):
+        self.scaled = scaled
+        self.update()
+
+    def pixmap(self):
+        return self._pixmap
+
+    def setPixmap(self, pixmap):
+        self._pixmap = pixmap
+        self._text = ""
+        self.update()
+
+    def text(self):
+        return self._text
+
+    def setText(self, text):
+        if text == self._text and self._pixmap is None:
+            return
+        self._pixmap = None
+        self._text = text
+        self.update()
+
+    def clear(self):
+        self._pixmap = None
+        self._text = ""
+        self.update()
+
+    def update(self):
+        """invalidates the slot's rectangle (painted at the canvas' next paint event)"""
+        self.canvas.update(self.rect)
+
+    def repaint(self):
+        # the canvas coalesces every dirty slot into one paint event
+        self.update()
+
+    def paint(self, painter):
+        if self._pixmap is not None and not self._pixmap.isNull():
+            # like QLabel's scaledContents, stretch the pixmap over the whole slot
+            if self.scaled:
+                painter.drawPixmap(self.rect, self._pixmap)
+                return
+            size = self._pixmap.size() / self._pixmap.devicePixelRatio()
+            target = QStyle.alignedRect(Qt.LeftToRight, self.alignment, size, self.rect)
+            painter.drawPixmap(target.topLeft(), self._pixmap)
+        elif self._text:
+            painter.setFont(self.font)
+            painter.setPen(self.color)
+            painter.drawText(self.rect, int(self.alignment), self._text)
+
+
+class ScoreboardCanvas(QWidget):
+    """
+    Draws every label of a scoreboard window in one widget's paintEvent
+
+    `replace_labels()` lays out the window's .ui file once, records where each QLabel
+    ended up, and swaps the labels (and their layouts) for CanvasSlots painted here.
+    Slots keep their place relative to the canvas when it's resized, and only the
+    rectangles of slots that changed are repainted.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.slots = []
+        self.design_size = QSize(1, 1)
+        self.paint_events = 0
+
+    @classmethod
+    def replace_labels(cls, window):
+        """swaps every QLabel in a QMainWindow's central widget for a slot on a canvas"""
+        central = window.centralWidget()
+        central.layout().activate()
+
+        canvas = cls()
+        canvas.design_size = central.size()
+        for label in central.findChildren(QLabel):
+            name = label.objectName()
+            rect = QRect(label.mapTo(central, QPoint(0, 0)), label.size())
+            slot = CanvasSlot(canvas, name, rect, label.alignment(), label.font(),
+                label.palette().color(QPalette.WindowText), label.hasScaledContents())
+            slot._text = label.text()
+            if label.pixmap() is not None and not label.pixmap().isNull():
+                slot._pixmap = label.pixmap()
+            canvas.slots.append(slot)
+
+            # game logic refers to labels by their .ui names
+            setattr(window, name, slot)
+
+        # the old central widget takes its labels and layouts with it
+        window.setCentralWidget(canvas)
+        logging.info("scoreboard canvas replaced {} labels".format(len(canvas.slots)))
+        return canvas
+
+    def resizeEvent(self, event):
+        # keep each slot in the same place relative to the canvas
+        sx = self.width() / float(max(1, self.design_size.width()))
+        sy = self.height() / float(max(1, self.design_size.height()))
+        for slot in self.slots:
+            r = slot.design_rect
+            slot.rect = QRect(int(r.x() * sx), int(r.y() * sy), int(r.width() * sx),
+                int(r.height() * sy))
+        super().resizeEvent(event)
+
+    def paintEvent(self, event):
+        self.paint_events += 1
+        dirty = event.rect()
+        painter = QPainter(self)
+        for slot in self.slots:
+            if slot.rect.intersects(dirty):
+                slot.paint(painter)
+        painter.end()
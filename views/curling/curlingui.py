@@ -9,12 +9,50 @@ sys.path.append(os.path.abspath(os.pardir))
 # PyQt imports
 from PyQt5 import QtCore, QtWidgets
 from PyQt5 import uic, QtGui, QtTest
-from PyQt5.QtGui import QImage, QPixmap, QColor, QPainter, QMovie, QFont
+from PyQt5.QtGui import QImage, QPixmap, QColor, QPainter, QFont
 from PyQt5.QtCore import QThread, QTimer, QRect, Qt, QSize, QUrl
-from PyQt5.QtWidgets import QInputDialog, QWidget, QDialog, QLabel, QMessageBox, QGridLayout, QVBoxLayout, QLineEdit, QHBoxLayout, QPushButton, QSizePolicy, QSlider, QStyle
+from PyQt5.QtWidgets import QInputDialog, QWidget, QLabel, QMessageBox, QGridLayout, QVBoxLayout, QLineEdit, QHBoxLayout, QPushButton, QSizePolicy, QSlider, QStyle
 from PyQt5.QtMultimedia import QMediaContent, QMediaPlayer
 from PyQt5.QtMultimediaWidgets import QVideoWidget
 
+# shared decoded pixmap cache and background preloader
+from views.media.pixmapcache import PIXMAP_CACHE, load_pixmap
+from views.media.preloader import AssetPreloader
+
+# timed sponsor logo rotation
+from views.media.rotation import SponsorRotation
+
+# non-blocking GIF animations in persistent overlay windows
+from views.media.animation import Animation
+from views.media.overlay import OverlayPool, VIDEO_TYPES
+from views.media.framecache import FRAME_CACHE
+
+# in-memory index of the sound and animation files
+from views.media.catalog import MEDIA_CATALOG
+
+# reactions chosen and decoded before the button press
+from views.media.prefetch import MediaPrefetcher, warm_sound
+
+# one overlay, many things that want it
+from views.media.scheduler import AnimationScheduler, MediaRequest, ANNOUNCEMENT
+
+# idle-time photo slideshow
+from views.media.screensaver import Screensaver
+from views.media.atlas import SpriteAtlas
+from views.media.background import ScaledBackground
+
+# pooled RGBA pixel buffers
+from views.media.buffers import BUFFER_POOL
+
+# label redraws that skip unchanged content
+from views.media.render import REDRAW_TRACKER, RENDER_SCHEDULER, draw_pixmap, clear_label
+
+# scale of the screen the scoreboard is shown on
+from views.media.screen import SCREEN_PROFILE
+
+# decoded media accounting
+from views.media.budget import MEDIA_BUDGET, MediaBudgetOverlay
+
 # bocce game imports
 from model.games.curling.team import Team, Player
 
@@ -24,10 +62,14 @@ from model.remotes.ati import ATI
 # color constant imports
 from .colors import *
 
+# remaining stone indicators
+from .stones import StoneRow
+
+# single widget scoreboard view
+from .canvas import ScoreboardCanvas
+
 # other imports
 import numpy as np
-import cv2
-import imutils
 from imutils import paths
 import argparse
 from playsound import playsound
@@ -60,10 +102,23 @@ STONE_WIDTH = 80
 # HAMMER WIDTH
 HAMMER_WIDTH = 150
 
+# GRAPHICS DIRECTORIES
+CURLING_GRAPHICS_DIR = os.path.join("views", "curling", "graphics")
+CARDS_DIR = os.path.join(CURLING_GRAPHICS_DIR, "cards")
+ODDBALL_GRAPHICS_DIR = os.path.join("views", "oddball_graphics")
+
+# WINDOW BACKGROUND
+ICE_BACKGROUND_PATH = os.path.join(CURLING_GRAPHICS_DIR, "ICE.jpg")
+
 # TEAM LOGOS
 TEAM_A_LOGO_PATH = os.path.join("views", "curling", "graphics", "blueobie.png")
 TEAM_B_LOGO_PATH = os.path.join("views", "curling", "graphics", "greenobie.png")
 
+# STONES AND HAMMER
+TEAM_A_STONE_PATH = os.path.join(CURLING_GRAPHICS_DIR, "curling_stone_blue.png")
+TEAM_B_STONE_PATH = os.path.join(CURLING_GRAPHICS_DIR, "curling_stone_green.png")
+HAMMER_PATH = os.path.join(CURLING_GRAPHICS_DIR, "hammer.png")
+
 TEAM_LOGO_SIZE = 150
 
 # DEFAULT MINUTES
@@ -78,6 +133,20 @@ BUTTON_HISTORY_LENGTH = 20
 # MEDIA for ABC
 MEDIA_DIR = os.path.join(os.getcwd(), "..", "media-leelanaucurlingclub")
 ANNOUNCEMENT_DIR = os.path.join(MEDIA_DIR, "announcement_game", "lastname_firstname")
+
+# sponsor logos each top label rotates through
+TOP_LEFT_SPONSOR_LOGOS = (
+    os.path.join(MEDIA_DIR, "graphics", "broomstack_logo.png"),
+    os.path.join(ODDBALL_GRAPHICS_DIR, "cut_assets", "Mark-Primary.png"),
+)
+TOP_CENTER_SPONSOR_LOGOS = (
+    os.path.join(ODDBALL_GRAPHICS_DIR, "ODDBALLSPORTS.TV.png"),
+    os.path.join(ODDBALL_GRAPHICS_DIR, "cut_assets", "Logo-Primary.png"),
+)
+TOP_RIGHT_SPONSOR_LOGOS = (
+    os.path.join(MEDIA_DIR, "graphics", "leelanau_logo.png"),
+    os.path.join(ODDBALL_GRAPHICS_DIR, "cut_assets", "Mark-2C-Teal.png"),
+)
 # PLAYERS = {
 #     # "RFID": ("Name", Skip?, entry_video.mp4)
 #     "e4bce79c": ("David Gersenson", True, os.path.join(ANNOUNCEMENT_DIR, "Gersenson_David.mp4")),
@@ -86,10 +155,14 @@ ANNOUNCEMENT_DIR = os.path.join(MEDIA_DIR, "announcement_game", "lastname_firstn
 #     "b0e751fd": ("Jim Halpert", False, os.path.join(ANNOUNCEMENT_DIR, "Jim_Halpert.mp4"))
 # }
 
-# load the json file
-PLAYERS = None
-with open(os.path.join(MEDIA_DIR, "players.json")) as f:
-  PLAYERS = json.load(f)
+# load the json file (the club media checkout isn't on every machine, e.g. when
+# benchmarking, so a missing file just means no known players)
+PLAYERS = {}
+try:
+    with open(os.path.join(MEDIA_DIR, "players.json")) as f:
+        PLAYERS = json.load(f)
+except FileNotFoundError:
+    logging.warning("no players.json in {}".format(MEDIA_DIR))
 
 # SOUND FILE TYPES
 SOUND_TYPES = (".m4a", ".mp3", ".wav", ".WAV")
@@ -97,10 +170,54 @@ SOUND_TYPES = (".m4a", ".mp3", ".wav", ".WAV")
 # ANIMATION TYPES
 ANIMATION_TYPES = (".gif", ".GIF")
 
+# REACTION TYPES (GIFs or short video clips)
+REACTION_TYPES = ANIMATION_TYPES + VIDEO_TYPES
+
+# the next random sound of each directory is chosen and warmed ahead of time
+SOUND_PREFETCH = MediaPrefetcher(SOUND_TYPES, warm_sound)
+
+# VIDEO PLAYER SIZE (in 1920x1080 design pixels)
+VIDEO_WIDTH = 1280
+VIDEO_HEIGHT = 720
+
+# decoded frames a playing video is assumed to hold (for media accounting)
+VIDEO_BUFFERED_FRAMES = 3
+
 ###### SET ME!!!!!!!!!!!!!!!!!!! ####################
 RFID_READER_CONNECTED = False
 #####################################################
 
+def preload_manifest():
+    """
+    lists every (path, width) graphic the curling MainWindow is known to draw (end cards
+    come from the card atlas instead)
+    """
+    # stones, hammer, and team logos
+    assets = [(TEAM_A_STONE_PATH, STONE_WIDTH)]
+    assets.append((TEAM_B_STONE_PATH, STONE_WIDTH))
+    assets.append((HAMMER_PATH, HAMMER_WIDTH))
+    assets.append((TEAM_A_LOGO_PATH, TEAM_LOGO_SIZE))
+    assets.append((TEAM_B_LOGO_PATH, TEAM_LOGO_SIZE))
+
+    # bottom left logo (top sponsor logos are preloaded by the sponsor rotation)
+    assets.append((os.path.join(ODDBALL_GRAPHICS_DIR, "numbers.png"), BOTTOM_LEFT_LOGO_WIDTH))
+
+    # rfid badge in indicators
+    assets.append((os.path.join(CURLING_GRAPHICS_DIR, "skip.png"), RFID_INDICATOR_WIDTH))
+    for name in ("Mark-Primary.png", "Mark-2C-Teal.png"):
+        assets.append((os.path.join(ODDBALL_GRAPHICS_DIR, "cut_assets", name),
+            RFID_INDICATOR_WIDTH))
+
+    return assets
+
+def asset_manifest():
+    """lists every (path, width) graphic that belongs in the on-disk asset cache"""
+    cards = [(path, CARD_WIDTH) for path in sorted(paths.list_images(CARDS_DIR))]
+    sponsors = [(path, TOP_LEFT_LOGO_WIDTH) for path in TOP_LEFT_SPONSOR_LOGOS]
+    sponsors += [(path, TOP_CENTER_LOGO_WIDTH) for path in TOP_CENTER_SPONSOR_LOGOS]
+    sponsors += [(path, TOP_RIGHT_LOGO_WIDTH) for path in TOP_RIGHT_SPONSOR_LOGOS]
+    return cards + preload_manifest() + sponsors
+
 def soundfile_duration(path):
     tag = TinyTag.get(path)
     seconds = tag.duration
@@ -108,72 +225,48 @@ def soundfile_duration(path):
 
 
 def list_sounds(dir, contains=None):
-    """grabs all sound file paths in a directory"""
-    return list(paths.list_files(dir, validExts=SOUND_TYPES, contains=contains))
+    """grabs all sound file paths in a directory (from the in-memory media catalog)"""
+    return MEDIA_CATALOG.files(dir, SOUND_TYPES, contains=contains)
 
 def play_random_sound(sound_dir):
     """plays a random sound in a directory"""
     # play a random sound
-    sounds = list_sounds(sound_dir)
-    if len(sounds) == 0:
+    sound_filename = SOUND_PREFETCH.take(sound_dir)
+    if sound_filename is None:
         return
-    sound_filename = random.choice(sounds)
     threading.Thread(target=playsound, args=(sound_filename,)).start()
 
 def list_animations(dir, contains=None):
-    """grabs all animations in a directory path"""
-    return list(paths.list_files(dir, validExts=ANIMATION_TYPES, contains=contains))
+    """grabs all animations in a directory path (from the in-memory media catalog)"""
+    return MEDIA_CATALOG.files(dir, REACTION_TYPES, contains=contains)
 
 def sleep(timeout):
     """PyQt friendly non-blocking sleep (alternative to `time.sleep()`)"""
+    # show pending label updates before waiting
+    RENDER_SCHEDULER.flush()
     QtTest.QTest.qWait(timeout * 1000)
 
 def load_png_qImg(pngPath, width):
     """
-    load the Obie logo
+    load a png as a QPixmap resized to a known width (decoded once and shared via the
+    pixmap cache)
     """
-    # load the logo and read all channels (including alpha transparency)
-    logo = cv2.imread(pngPath, cv2.IMREAD_UNCHANGED)
-
-    # swap color channels for Qt
-    logo = cv2.cvtColor(logo, cv2.COLOR_BGRA2RGBA)
-
-    # resize to a known width maintaining aspect ratio
-    logo = imutils.resize(logo, width=width)
-
-    # extract the dimensions of the image and set the bytes per line
-    height, width, channel = logo.shape
-    bytesPerLine = channel * width
-
-    # create a QImage and ensure to use the alpha transparency format
-    qImg = QImage(logo.data, width, height, bytesPerLine, QImage.Format_RGBA8888)
-
-    return qImg
+    return load_pixmap(pngPath, width)
 
 def cv2img_to_qImg(image, width):
     """
-    converts a BGRA OpenCV image to qImage RGBA format (A is the alpha transparency
-    channel
+    converts a BGRA OpenCV image to an RGBA QPixmap (A is the alpha transparency
+    channel) through pooled buffers, so no QImage is left pointing at freed memory
     """
-    # swap color channels for Qt
-    image = cv2.cvtColor(image, cv2.COLOR_BGRA2RGBA)
-
-    # resize to a known width maintaining aspect ratio
-    image = imutils.resize(image, width=width)
-
-    # extract the dimensions of the image and set the bytes per line
-    height, width, channel = image.shape
-    bytesPerLine = channel * width
-
-    # create a QImage and ensure to use the alpha transparency format
-    qImg = QImage(image.data, width, height, bytesPerLine, QImage.Format_RGBA8888)
-
-    return qImg
+    return BUFFER_POOL.bgra_to_pixmap(image, width)
 
 def draw_rgba_qimg(label, qImg):
-    # set the logo in the GUI
-    label.setPixmap(QPixmap(qImg))
-    label.repaint()
+    # cached logos are already pixmaps
+    if isinstance(qImg, QImage):
+        qImg = QPixmap.fromImage(qImg)
+
+    # set the logo in the GUI (skipped if the label already shows it)
+    draw_pixmap(label, qImg)
 
 
 class VideoPlayer(QWidget):
@@ -217,8 +310,9 @@ class VideoPlayer(QWidget):
         self.mediaPlayer.error.connect(self.handleError)
 
         # set size
-        self.resize(1280, 720)
+        self.resize(SCREEN_PROFILE.logical(VIDEO_WIDTH), SCREEN_PROFILE.logical(VIDEO_HEIGHT))
         self.error = False
+        self._charged = 0
 
     def openFile(self, video_path):
         self.mediaPlayer.setMedia(
@@ -232,10 +326,17 @@ class VideoPlayer(QWidget):
             self.errorLabel.setText("")
             self.playButton.setEnabled(True)
             self.error = False
+            if not self._charged:
+                self._charged = SCREEN_PROFILE.device(VIDEO_WIDTH) \
+                    * SCREEN_PROFILE.device(VIDEO_HEIGHT) * 4 * VIDEO_BUFFERED_FRAMES
+                MEDIA_BUDGET.charge("videos", self._charged)
             self.mediaPlayer.play()
 
 
     def mediaStateChanged(self, state):
+        if state == QMediaPlayer.StoppedState and self._charged:
+            MEDIA_BUDGET.release("videos", self._charged)
+            self._charged = 0
         if self.mediaPlayer.state() == QMediaPlayer.PlayingState:
             self.playButton.setIcon(
                     self.style().standardIcon(QStyle.SP_MediaPause))
@@ -262,37 +363,7 @@ class VideoPlayer(QWidget):
         # self.error = True
 
     def sizeHint(self):
-        return QSize(1280, 720)
-
-class Animation():
-    """Plays GIF animations nearly fullscreen"""
-    # todo grab screen resolution and adjust the window size programmatically
-
-    def __init__(self, gif_path, timeout=8):
-        #super(Animation, self).__init__()
-        self.timeout=timeout
-        self.dlg = QDialog()
-        self.dlg.setWindowTitle("animation")
-        self.dlg.setWindowModality(False)
-        self.dlg.setFixedSize(800, 800)
-        self.dlg.setWindowFlags(Qt.WindowStaysOnTopHint | Qt.CustomizeWindowHint)
-        self.label_animation = QLabel(self.dlg)
-        self.movie = QMovie(gif_path)
-        self.movie.setScaledSize(QSize(self.dlg.width(), self.dlg.height()))
-        self.label_animation.setMovie(self.movie)
-
-    def start(self):
-        self.run()
-
-    def run(self):
-        self.movie.start()
-        self.dlg.show()
-        sleep(self.timeout)
-        self.quit()
-
-    def quit(self):
-        self.movie.stop()
-        self.dlg.done(0)
+        return QSize(SCREEN_PROFILE.logical(VIDEO_WIDTH), SCREEN_PROFILE.logical(VIDEO_HEIGHT))
 
 class PlayerRFID(QWidget):
     """Waits for Num Players and displays names"""
@@ -467,29 +538,45 @@ class MainWindow(QtWidgets.QMainWindow):
         # load the user interface
         uic.loadUi(ui, self)
 
+        # the ice background is scaled to the window once per geometry change
+        self.background = ScaledBackground(ICE_BACKGROUND_PATH)
+
         # MainWindow settings
         # set the window title
         self.setWindowTitle("Obie's Scoreboard - {} - {}".format(clargs["game"], clargs["view"]))
         # maximize the window
         self.showMaximized()
 
+        # size graphics for the screen the window is on
+        SCREEN_PROFILE.attach(self)
+
+        # the canvas view draws every label of the .ui file in one widget
+        self.canvas = None
+        if clargs["view"] == "canvas":
+            self.canvas = ScoreboardCanvas.replace_labels(self)
+
+        # the reaction animation on screen (if any) and the windows animations play in
+        self.animation = None
+        self.overlays = OverlayPool()
+
+        # the next random animation of each directory is chosen and warmed (decoded, or
+        # loaded in an idle overlay's video player) ahead of time
+        self.animation_prefetch = MediaPrefetcher(REACTION_TYPES, self.overlays.warm,
+            self.overlays.unwarm)
+
+        # decides which announcement / reaction gets the overlay
+        self.scheduler = AnimationScheduler(parent=self)
 
         # TOP LOGOS
-        # draw the top left logo
-        qImg = self.load_png_qImg(os.path.join(MEDIA_DIR, "graphics", "broomstack_logo.png"),
-                                   TOP_LEFT_LOGO_WIDTH)
-        self.draw_rgba_qimg(self.label_sponsor_top_left, qImg)
-
-        # draw the top center logo
-        qImg = self.load_png_qImg(
-            os.path.join(os.getcwd(), "views", "oddball_graphics", "ODDBALLSPORTS.TV.png"),
-                                   TOP_CENTER_LOGO_WIDTH)
-        self.draw_rgba_qimg(self.label_sponsor_top_center, qImg)
-
-        # draw the top right logo
-        qImg = self.load_png_qImg(
-            os.path.join(MEDIA_DIR, "graphics", "leelanau_logo.png"), TOP_RIGHT_LOGO_WIDTH)
-        self.draw_rgba_qimg(self.label_sponsor_top_right, qImg)
+        # the top sponsor logos rotate; draw the first logo (that's on disk) of each
+        self.sponsors = SponsorRotation(parent=self)
+        self.sponsors.add_slot(self.label_sponsor_top_left, TOP_LEFT_SPONSOR_LOGOS,
+            TOP_LEFT_LOGO_WIDTH)
+        self.sponsors.add_slot(self.label_sponsor_top_center, TOP_CENTER_SPONSOR_LOGOS,
+            TOP_CENTER_LOGO_WIDTH)
+        self.sponsors.add_slot(self.label_sponsor_top_right, TOP_RIGHT_SPONSOR_LOGOS,
+            TOP_RIGHT_LOGO_WIDTH)
+        self.sponsors.show_first()
 
         # # BOTTOM LOGOS
         # #draw the bottom left logo
@@ -620,15 +707,97 @@ class MainWindow(QtWidgets.QMainWindow):
         # stones
         self.teamA_num_stones = 8
         self.teamB_num_stones = 8
+        self.teamA_stones = StoneRow([
+            self.label_teamA_stone1,
+            self.label_teamA_stone2,
+            self.label_teamA_stone3,
+            self.label_teamA_stone4,
+            self.label_teamA_stone5,
+            self.label_teamA_stone6,
+            self.label_teamA_stone7,
+            self.label_teamA_stone8
+        ], TEAM_A_STONE_PATH, STONE_WIDTH)
+        self.teamB_stones = StoneRow([
+            self.label_teamB_stone1,
+            self.label_teamB_stone2,
+            self.label_teamB_stone3,
+            self.label_teamB_stone4,
+            self.label_teamB_stone5,
+            self.label_teamB_stone6,
+            self.label_teamB_stone7,
+            self.label_teamB_stone8
+        ], TEAM_B_STONE_PATH, STONE_WIDTH)
 
         self.rfid_window = None
 
+        # all end cards live in one atlas so selecting and moving cards never decodes
+        self.card_atlas = SpriteAtlas(CARDS_DIR, CARD_WIDTH, parent=self)
+
         # clearing the hammer draws team logos
         self.clear_hammer()
 
+        # decode the rest of the graphics in the background before the first game
+        self.preloader = AssetPreloader(preload_manifest(), parent=self)
+        self.preloader.start()
+
+        # index the sounds and animations once; new files are picked up as they land
+        MEDIA_CATALOG.index(["sounds", "animations", MEDIA_DIR])
+        self.sponsors.start()
+
+        # re-render the pre-drawn graphics if the window moves to another screen
+        SCREEN_PROFILE.add_listener(self.screen_changed)
+
+        # log decoded media usage (and show it in a corner with --media-overlay)
+        MEDIA_BUDGET.start_logging()
+        self.media_overlay = None
+        if clargs.get("media_overlay"):
+            self.media_overlay = MediaBudgetOverlay(self)
+
+        # show the photo slideshow when the scoreboard sits idle between games
+        self.screensaver = Screensaver(is_idle=lambda: not self.game_in_progress)
+
         # set the window focus
         self.setFocus()
 
+    def paintEvent(self, event):
+        # draw the cached, pre-scaled background (children paint over it)
+        painter = QPainter(self)
+        self.background.paint(painter, self.rect(), self.devicePixelRatioF())
+        painter.end()
+
+    def screen_changed(self):
+        """
+        re-renders the card atlas and stone rows and redraws the graphics on screen at the
+        new screen scale (the sponsor rotation redraws its own slots)
+        """
+        # remember which sprite each card shows before the old sprites are dropped
+        shown = []
+        for label, _, _ in self.card_place_color_map.values():
+            pixmap = label.pixmap()
+            if pixmap is None or pixmap.isNull():
+                continue
+            name = self.card_atlas.name_of(pixmap)
+            if name is not None:
+                shown.append((label, name))
+
+        self.card_atlas.build()
+        self.teamA_stones.reload()
+        self.teamB_stones.reload()
+
+        # redraw the end cards from the new atlas
+        for label, name in shown:
+            self.draw_rgba_qimg(label, self.card_atlas.sprite(name))
+
+        # the team logos / hammer and the bottom left graphic come from the pixmap cache
+        for label in (self.label_teamA_graphic, self.label_teamB_graphic,
+                      self.label_sponsor_bottom_left):
+            pixmap = label.pixmap()
+            if pixmap is None or pixmap.isNull():
+                continue
+            redrawn = PIXMAP_CACHE.rescaled(pixmap)
+            if redrawn is not None:
+                self.draw_rgba_qimg(label, redrawn)
+
     def game_launch_steps(self):
 
         # step #0 - wait for PWR key
@@ -961,20 +1130,16 @@ class MainWindow(QtWidgets.QMainWindow):
         elif color == "blue":
             letter = "b"
         elif color == "clear_it":
-            label.clear()
-            label.repaint()
+            self.clear_label(label)
             self.card_place_color_map[card_num] = [label, "clear", False]
             return
         else:
             raise ValueError("invalid card color")
 
         logging.info("drawing end card {} {}".format(str(card_num), color))
-        filename = "{}{}.png".format(str(card_num), letter)
-        path = os.path.join("views", "curling", "graphics", "cards", filename)
-        logging.info("attempting to draw card at {}".format(path))
-        qImg = self.load_png_qImg(path, width=CARD_WIDTH)
-        self.draw_rgba_qimg(label, qImg)
-        logging.info("success: drew card at {}".format(path))
+        sprite = "{}{}".format(str(card_num), letter)
+        self.draw_rgba_qimg(label, self.card_atlas.sprite(sprite))
+        logging.info("success: drew card {}".format(sprite))
 
     def display_all_end_cards_at_top(self):
         logging.info("drawing all end cards at top")
@@ -1050,7 +1215,7 @@ class MainWindow(QtWidgets.QMainWindow):
 
                         # todo determine length of video
 
-                        self.load_animation(media_path, timeout=8)
+                        self.announce_entry(name, media_path)
 
                     # if error, play random media
                     except:
@@ -1063,7 +1228,7 @@ class MainWindow(QtWidgets.QMainWindow):
 
                         # todo determine length of video
 
-                        self.load_animation(media_path, timeout=8)
+                        self.announce_entry(name, media_path)
 
                     prevReadTime = readTime
                 except Exception as e:
@@ -1094,16 +1259,34 @@ class MainWindow(QtWidgets.QMainWindow):
 
     def load_animation(self, gif_path, timeout=8):
         logging.info("loading animation")
-        self.animation = Animation(gif_path, timeout)
+
+        # a new reaction preempts the one on screen
+        if self.animation is not None:
+            self.animation.quit()
+
+        animation = Animation(gif_path, self.overlays, timeout, parent=self)
+        animation.finished.connect(lambda: self.animation_finished(animation))
+        self.animation = animation
+
+        # don't crossfade sponsor logos while the animation plays
+        self.sponsors.pause()
         self.animation.start()
         logging.info("animation started")
         self.setFocus()
         logging.info("window focus set back to main window")
+        return animation
+
+    def animation_finished(self, animation):
+        self.sponsors.resume()
+        if self.animation is animation:
+            self.animation = None
+        animation.deleteLater()
 
 
     def stop_animation(self):
         logging.info("stopping animation")
-        self.animation.quit()
+        if self.animation is not None:
+            self.animation.quit()
         self.animation = None
         logging.info("animation stopped and set to None")
         self.setFocus()
@@ -1118,10 +1301,12 @@ class MainWindow(QtWidgets.QMainWindow):
         event.ignore()
 
         if result == QMessageBox.Yes:
+            self.scheduler.clear()
             try:
                 self.animation.quit()
             except AttributeError:
                 pass
+            self.overlays.close()
             try:
                 self.rfid.quit()
             except AttributeError:
@@ -1129,20 +1314,31 @@ class MainWindow(QtWidgets.QMainWindow):
             event.accept()
         logging.info("window closed")
         logging.info("most recent {} buttons = {}".format(str(len(self.buttonHistory)), str(self.buttonHistory)))
+        REDRAW_TRACKER.log_stats()
+        RENDER_SCHEDULER.log_stats()
+        BUFFER_POOL.log_stats()
+        FRAME_CACHE.log_stats()
+        self.animation_prefetch.log_stats()
+        self.scheduler.log_stats()
+        MEDIA_BUDGET.log_usage()
         sys.exit()
 
+    def announce_entry(self, name, media_path):
+        """queues a player's entry media behind any other announcements"""
+        self.scheduler.submit(MediaRequest(ANNOUNCEMENT, name,
+            lambda: self.load_animation(media_path, timeout=8)))
+
     def play_random_animation(self, gif_dir, timeout=5):
         logging.info("playing random animation")
-        animations = list_animations(gif_dir)
-        if len(animations)== 0:
-            return
-        gif_filename = random.choice(animations)
-        self.load_animation(gif_path=gif_filename, timeout=timeout)
+        gif_filename = self.animation_prefetch.take(gif_dir)
+        if gif_filename is None:
+            return None
+        return self.load_animation(gif_path=gif_filename, timeout=timeout)
 
     def play_animation(self, path, timeout=5):
         logging.info("playing animation located at {}".format(str(path)))
         gif_filename = path
-        self.load_animation(gif_path=gif_filename, timeout=timeout)
+        return self.load_animation(gif_path=gif_filename, timeout=timeout)
 
     def _stop_animation(self, button):
         if self.animation is not None:
@@ -1153,6 +1349,16 @@ class MainWindow(QtWidgets.QMainWindow):
                 self._prevButton = None
 
 
+    def handle_ati_remote_button_press(self, button):
+        # a button press that dismisses the screensaver does nothing else
+        if self.screensaver.wake():
+            return
+
+        # curling is driven by the keyboard handlers; the ATI remote has no bindings yet
+        button_str = str(button)
+        logging.info("ATI remote button pressed: {}".format(button_str))
+        self.buttonHistory.append(button_str)
+
     def waitForRemoteButtonPressSignal(self, remote):
         if remote.lower() == "ati":
             logging.info("using ATI remote so starting a QThread worker to listen")
@@ -1233,8 +1439,7 @@ class MainWindow(QtWidgets.QMainWindow):
                 self.lock_in_end_score(self.teamB)
                 # reset mode
                 self.add_points_mode = False
-                self.label_sponsor_bottom_left.clear()
-                self.label_sponsor_bottom_left.repaint()
+                self.clear_label(self.label_sponsor_bottom_left)
 
             # if we're not adding points, activate add points mode
             elif not self.add_points_mode:
@@ -1249,8 +1454,7 @@ class MainWindow(QtWidgets.QMainWindow):
             self.teamA_num_stones -= 1
             self.draw_stones(self.teamA)
             if not self.hammer_set:
-                hammer_path = os.path.join("views", "curling", "graphics", "hammer.png")
-                qImg = load_png_qImg(hammer_path, width=HAMMER_WIDTH)
+                qImg = load_png_qImg(HAMMER_PATH, width=HAMMER_WIDTH)
                 draw_rgba_qimg(self.label_teamB_graphic, qImg)
 
                 # draw team logo A
@@ -1265,8 +1469,7 @@ class MainWindow(QtWidgets.QMainWindow):
             self.teamB_num_stones -=1
             self.draw_stones(self.teamB)
             if not self.hammer_set:
-                hammer_path = os.path.join("views", "curling", "graphics", "hammer.png")
-                qImg = load_png_qImg(hammer_path, width=HAMMER_WIDTH)
+                qImg = load_png_qImg(HAMMER_PATH, width=HAMMER_WIDTH)
                 draw_rgba_qimg(self.label_teamA_graphic, qImg)
                 # draw team logo B
                 qImg = load_png_qImg(TEAM_B_LOGO_PATH, TEAM_LOGO_SIZE)
@@ -1391,50 +1594,20 @@ class MainWindow(QtWidgets.QMainWindow):
     # formerly load_png_qImg
     def load_png_qImg(self, pngPath, width):
         """
-        load the Obie logo
+        load a png as a QPixmap resized to a known width (decoded once and shared via the
+        pixmap cache)
         """
-        # load the logo and read all channels (including alpha transparency)
-        logo = cv2.imread(pngPath, cv2.IMREAD_UNCHANGED)
-
-        # swap color channels for Qt
-        logo = cv2.cvtColor(logo, cv2.COLOR_BGRA2RGBA)
-
-        # resize to a known width maintaining aspect ratio
-        logo = imutils.resize(logo, width=width)
-
-        # extract the dimensions of the image and set the bytes per line
-        height, width, channel = logo.shape
-        bytesPerLine = channel * width
-
-        # create a QImage and ensure to use the alpha transparency format
-        qImg = QImage(logo.data, width, height, bytesPerLine, QImage.Format_RGBA8888)
-
-        return qImg
+        return load_png_qImg(pngPath, width)
 
     def cv2img_to_qImg(self, image, width):
-        """
-        converts a BGRA OpenCV image to qImage RGBA format (A is the alpha transparency
-        channel
-        """
-        # swap color channels for Qt
-        image = cv2.cvtColor(image, cv2.COLOR_BGRA2RGBA)
-
-        # resize to a known width maintaining aspect ratio
-        image = imutils.resize(image, width=width)
-
-        # extract the dimensions of the image and set the bytes per line
-        height, width, channel = image.shape
-        bytesPerLine = channel * width
-
-        # create a QImage and ensure to use the alpha transparency format
-        qImg = QImage(image.data, width, height, bytesPerLine, QImage.Format_RGBA8888)
-
-        return qImg
+        return cv2img_to_qImg(image, width)
 
     def draw_rgba_qimg(self, label, qImg):
-        # set the logo in the GUI
-        label.setPixmap(QPixmap(qImg))
-        label.repaint()
+        draw_rgba_qimg(label, qImg)
+
+    def clear_label(self, label):
+        # clear the label (skipped if it's already empty)
+        clear_label(label)
 
     def show_team_change_popup(self, team):
         teamText = None
@@ -1458,48 +1631,21 @@ class MainWindow(QtWidgets.QMainWindow):
     def draw_stones(self, team):
         # initialize vars
         num_stones = None
-        stone_graphics = None
-        stone_png = None
+        stone_row = None
 
         # set vars depending on team
         if team is self.teamA:
             num_stones = self.teamA_num_stones
-            stone_graphics = [
-                self.label_teamA_stone1,
-                self.label_teamA_stone2,
-                self.label_teamA_stone3,
-                self.label_teamA_stone4,
-                self.label_teamA_stone5,
-                self.label_teamA_stone6,
-                self.label_teamA_stone7,
-                self.label_teamA_stone8
-            ]
-            stone_png = os.path.join("views", "curling", "graphics", "curling_stone_blue.png")
+            stone_row = self.teamA_stones
         elif team is self.teamB:
             num_stones = self.teamB_num_stones
-            stone_graphics = [
-                self.label_teamB_stone1,
-                self.label_teamB_stone2,
-                self.label_teamB_stone3,
-                self.label_teamB_stone4,
-                self.label_teamB_stone5,
-                self.label_teamB_stone6,
-                self.label_teamB_stone7,
-                self.label_teamB_stone8
-            ]
-            stone_png = os.path.join("views", "curling", "graphics", "curling_stone_green.png")
+            stone_row = self.teamB_stones
 
         # logging
         logging.info("drawing {} stones for {}".format(num_stones, str(team)))
 
-        # draw stones
-        for i, stone in enumerate(stone_graphics):
-            if i < num_stones:
-                qImg = load_png_qImg(stone_png, width=STONE_WIDTH)
-                draw_rgba_qimg(stone, qImg)
-            else:
-                stone.clear()
-                stone.repaint()
+        # draw stones (only the labels that changed are touched)
+        stone_row.set_remaining(num_stones)
 
 
 
@@ -15,6 +15,12 @@ from PyQt5.QtWidgets import QInputDialog, QWidget, QDialog, QLabel, QMessageBox,
 from PyQt5.QtMultimedia import QMediaContent, QMediaPlayer
 from PyQt5.QtMultimediaWidgets import QVideoWidget
 
+# shared decoded pixmap cache
+from views.media.pixmapcache import load_pixmap
+
+# pooled RGBA pixel buffers
+from views.media.buffers import BUFFER_POOL
+
 # bocce game imports
 #from model.games.curling.team import Team, Player
 
@@ -26,8 +32,6 @@ from PyQt5.QtMultimediaWidgets import QVideoWidget
 
 # other imports
 import numpy as np
-import cv2
-import imutils
 from imutils import paths
 import argparse
 from playsound import playsound
@@ -130,49 +134,25 @@ def sleep(timeout):
 
 def load_png_qImg(pngPath, width):
     """
-    load the Obie logo
+    load a png as a QPixmap resized to a known width (decoded once and shared via the
+    pixmap cache)
     """
-    # load the logo and read all channels (including alpha transparency)
-    logo = cv2.imread(pngPath, cv2.IMREAD_UNCHANGED)
-
-    # swap color channels for Qt
-    logo = cv2.cvtColor(logo, cv2.COLOR_BGRA2RGBA)
-
-    # resize to a known width maintaining aspect ratio
-    logo = imutils.resize(logo, width=width)
-
-    # extract the dimensions of the image and set the bytes per line
-    height, width, channel = logo.shape
-    bytesPerLine = channel * width
-
-    # create a QImage and ensure to use the alpha transparency format
-    qImg = QImage(logo.data, width, height, bytesPerLine, QImage.Format_RGBA8888)
-
-    return qImg
+    return load_pixmap(pngPath, width)
 
 def cv2img_to_qImg(image, width):
     """
-    converts a BGRA OpenCV image to qImage RGBA format (A is the alpha transparency
-    channel
+    converts a BGRA OpenCV image to an RGBA QPixmap (A is the alpha transparency
+    channel) through pooled buffers, so no QImage is left pointing at freed memory
     """
-    # swap color channels for Qt
-    image = cv2.cvtColor(image, cv2.COLOR_BGRA2RGBA)
-
-    # resize to a known width maintaining aspect ratio
-    image = imutils.resize(image, width=width)
-
-    # extract the dimensions of the image and set the bytes per line
-    height, width, channel = image.shape
-    bytesPerLine = channel * width
-
-    # create a QImage and ensure to use the alpha transparency format
-    qImg = QImage(image.data, width, height, bytesPerLine, QImage.Format_RGBA8888)
-
-    return qImg
+    return BUFFER_POOL.bgra_to_pixmap(image, width)
 
 def draw_rgba_qimg(label, qImg):
+    # cached logos are already pixmaps
+    if isinstance(qImg, QImage):
+        qImg = QPixmap.fromImage(qImg)
+
     # set the logo in the GUI
-    label.setPixmap(QPixmap(qImg))
+    label.setPixmap(qImg)
     label.repaint()
 
 
@@ -1377,50 +1357,16 @@ class MainWindow(QtWidgets.QMainWindow):
     # formerly load_png_qImg
     def load_png_qImg(self, pngPath, width):
         """
-        load the Obie logo
+        load a png as a QPixmap resized to a known width (decoded once and shared via the
+        pixmap cache)
         """
-        # load the logo and read all channels (including alpha transparency)
-        logo = cv2.imread(pngPath, cv2.IMREAD_UNCHANGED)
-
-        # swap color channels for Qt
-        logo = cv2.cvtColor(logo, cv2.COLOR_BGRA2RGBA)
-
-        # resize to a known width maintaining aspect ratio
-        logo = imutils.resize(logo, width=width)
-
-        # extract the dimensions of the image and set the bytes per line
-        height, width, channel = logo.shape
-        bytesPerLine = channel * width
-
-        # create a QImage and ensure to use the alpha transparency format
-        qImg = QImage(logo.data, width, height, bytesPerLine, QImage.Format_RGBA8888)
-
-        return qImg
+        return load_png_qImg(pngPath, width)
 
     def cv2img_to_qImg(self, image, width):
-        """
-        converts a BGRA OpenCV image to qImage RGBA format (A is the alpha transparency
-        channel
-        """
-        # swap color channels for Qt
-        image = cv2.cvtColor(image, cv2.COLOR_BGRA2RGBA)
-
-        # resize to a known width maintaining aspect ratio
-        image = imutils.resize(image, width=width)
-
-        # extract the dimensions of the image and set the bytes per line
-        height, width, channel = image.shape
-        bytesPerLine = channel * width
-
-        # create a QImage and ensure to use the alpha transparency format
-        qImg = QImage(image.data, width, height, bytesPerLine, QImage.Format_RGBA8888)
-
-        return qImg
+        return cv2img_to_qImg(image, width)
 
     def draw_rgba_qimg(self, label, qImg):
-        # set the logo in the GUI
-        label.setPixmap(QPixmap(qImg))
-        label.repaint()
+        draw_rgba_qimg(label, qImg)
 
     def show_team_change_popup(self, team):
         teamText = None
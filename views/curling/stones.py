@@ -0,0 +1,42 @@
+# shared decoded pixmap cache
+from views.media.pixmapcache import load_pixmap
+
+# label redraws that skip unchanged content
+from views.media.render import draw_pixmap, clear_label
+
+
+class StoneRow:
+    """
+    The row of stone labels showing how many stones a team has left to throw
+
+    Each label's state (stone shown or not) is kept here and one stone pixmap is shared
+    by every label in the row, so throwing a stone updates a single label.
+    """
+
+    def __init__(self, labels, stone_path, width):
+        self.labels = labels
+        self.stone_path = stone_path
+        self.width = width
+        self.num_stones = len(labels)
+        self.reload()
+
+    def reload(self):
+        """grabs the stone pixmap again (e.g. at a new screen scale) and redraws the row"""
+        self.pixmap = load_pixmap(self.stone_path, self.width)
+
+        # nothing has been drawn with this pixmap yet, so the next update draws every label
+        self.shown = [None] * len(self.labels)
+        self.set_remaining(self.num_stones)
+
+    def set_remaining(self, num_stones):
+        """shows the first `num_stones` stones, touching only labels that change"""
+        self.num_stones = num_stones
+        for i, label in enumerate(self.labels):
+            show = i < num_stones
+            if self.shown[i] == show:
+                continue
+            if show:
+                draw_pixmap(label, self.pixmap)
+            else:
+                clear_label(label)
+            self.shown[i] = show
@@ -0,0 +1,85 @@
+# PyQt imports
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+
+# decoded media accounting
+from views.media.budget import MEDIA_BUDGET
+
+# video clips end on their own
+from views.media.overlay import is_video
+
+# logging
+import logging
+
+# a video clip that never reports its end is stopped after this long
+MAX_CLIP_SECONDS = 60
+
+
+class Animation(QObject):
+    """
+    Plays a GIF animation (or video clip) nearly fullscreen without blocking the caller
+
+    `start()` borrows a window from the overlay pool, shows the animation in it and
+    returns right away; a single-shot timer ends a GIF after `timeout` seconds, and a
+    video clip ends when it reaches its end (whatever its length).  `quit()`
+    ends it early (e.g. when a newer reaction preempts it) and is safe to call more than
+    once.  `finished` is emitted exactly once, however the animation ended.
+    """
+    finished = pyqtSignal()
+
+    def __init__(self, gif_path, overlays, timeout=8, parent=None):
+        super().__init__(parent)
+        self.gif_path = gif_path
+        self.overlays = overlays
+        self.timeout = timeout
+        self.window = None
+        self.playing = False
+        self._done = False
+        self._charged = 0
+
+        # ends the animation without a nested event loop
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self.quit)
+
+    def start(self):
+        if self.playing or self._done:
+            return
+        self.playing = True
+        self.window = self.overlays.acquire(self)
+        self.window.ended.connect(self._ended)
+        self.window.play(self.gif_path)
+
+        # a clip that failed to load has already ended
+        if self._done:
+            return
+
+        # the movie keeps its current decoded frame at the scaled size (cached frames
+        # are already counted by the frame cache)
+        self._charged = self.window.frame_bytes()
+        MEDIA_BUDGET.charge("playback", self._charged)
+        timeout = MAX_CLIP_SECONDS if is_video(self.gif_path) else self.timeout
+        self.timer.start(int(timeout * 1000))
+
+    def quit(self):
+        if self._done:
+            return
+        self._done = True
+        self.playing = False
+        self.timer.stop()
+        if self.window is not None:
+            self.window.ended.disconnect(self._ended)
+            self.overlays.release(self.window, self)
+            self.window = None
+        MEDIA_BUDGET.release("playback", self._charged)
+        self._charged = 0
+        logging.debug("animation {} finished".format(self.gif_path))
+        self.finished.emit()
+
+    def is_done(self):
+        """true once the animation has ended (`finished` has been emitted)"""
+        return self._done
+
+    def _ended(self):
+        # ignore a clip that ended after the window was taken over by someone else
+        if self.window is not None and self.window.owner is self:
+            self.quit()
@@ -0,0 +1,172 @@
+# imports
+import os
+import sys
+import mmap
+import ctypes
+import struct
+import hashlib
+import threading
+import argparse
+
+# PyQt imports
+from PyQt5 import sip
+from PyQt5.QtGui import QImage
+
+# logging
+import logging
+
+# ON-DISK ASSET CACHE (relative to the scoreboard's working directory)
+ASSET_CACHE_DIR = os.path.join(".cache", "assets")
+
+# cache file header: magic, version, reserved, width, height, source mtime, source size,
+# source sha1 (padded so the pixel rows that follow are nicely aligned)
+HEADER_FORMAT = "<4sHHIIdQ20s"
+HEADER_SIZE = 64
+MAGIC = b"OBRA"
+VERSION = 2
+
+
+def file_sha1(path):
+    """hashes a source file so a touched-but-unchanged file doesn't invalidate the cache"""
+    sha1 = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            sha1.update(chunk)
+    return sha1.digest()
+
+
+class AssetCache:
+    """
+    On-disk cache of pre-scaled RGBA8888 pixel buffers
+
+    Each (source path, width) pair is stored as a small header followed by raw RGBA rows.
+    Loading memory-maps the file and wraps the mapping in a QImage directly, so there is
+    no decode, resize, or channel swap at runtime.  Entries are invalidated when the
+    source's size changes, or its mtime changes and its sha1 no longer matches.
+    """
+
+    def __init__(self, cache_dir=ASSET_CACHE_DIR):
+        self.cache_dir = cache_dir
+        self.enabled = True
+
+    def cache_path(self, path, width):
+        key = "{}@{}".format(os.path.abspath(path), width)
+        return os.path.join(self.cache_dir, hashlib.sha1(key.encode()).hexdigest() + ".rgba")
+
+    def load(self, path, width):
+        """returns a QImage backed by the memory-mapped cache file, or None on a miss"""
+        if not self.enabled:
+            return None
+        cache_path = self.cache_path(path, width)
+
+        # map the cache file (copy-on-write so Qt gets a writable buffer without a copy)
+        try:
+            with open(cache_path, "rb") as f:
+                mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+        except (OSError, ValueError):
+            return None
+
+        # validate the header against the source file
+        try:
+            (magic, version, _, width_px, height_px, mtime, size, sha1) = \
+                struct.unpack_from(HEADER_FORMAT, mapping, 0)
+            st = os.stat(path)
+        except (struct.error, OSError):
+            return None
+        if magic != MAGIC or version != VERSION:
+            return None
+        if len(mapping) != HEADER_SIZE + width_px * height_px * 4:
+            return None
+        if st.st_size != size:
+            return None
+        if st.st_mtime != mtime:
+            # e.g. a fresh git checkout touches every file without changing it
+            if file_sha1(path) != sha1:
+                return None
+            self._write_header(cache_path, width_px, height_px, st, sha1)
+
+        # wrap the pixels in place; the QImage keeps the mapping alive
+        pixels = ctypes.c_char.from_buffer(mapping, HEADER_SIZE)
+        qImg = QImage(sip.voidptr(ctypes.addressof(pixels)), width_px, height_px,
+            width_px * 4, QImage.Format_RGBA8888)
+        qImg._mapping = (mapping, pixels)
+        return qImg
+
+    def store(self, path, width, qImg):
+        """writes a decoded image to the cache (safe to call from worker threads)"""
+        if not self.enabled:
+            return
+        if qImg.format() != QImage.Format_RGBA8888:
+            qImg = qImg.convertToFormat(QImage.Format_RGBA8888)
+        cache_path = self.cache_path(path, width)
+
+        try:
+            st = os.stat(path)
+            sha1 = file_sha1(path)
+            os.makedirs(self.cache_dir, exist_ok=True)
+
+            # grab the raw rows (RGBA8888 rows are never padded)
+            bits = qImg.constBits()
+            bits.setsize(qImg.byteCount())
+
+            # write to a temporary file and swap it in so readers never see half a file
+            tmp_path = "{}.{}.{}.tmp".format(cache_path, os.getpid(), threading.get_ident())
+            with open(tmp_path, "wb") as f:
+                f.write(self._header(qImg.width(), qImg.height(), st, sha1))
+                f.write(bits.asstring())
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            logging.warning("disabling the on-disk asset cache: {}".format(str(e)))
+            self.enabled = False
+
+    def build(self, assets, decode):
+        """pre-builds cache entries for (path, width) assets that are missing or stale"""
+        built = 0
+        for path, width in assets:
+            if not os.path.isfile(path):
+                logging.warning("skipping missing asset {}".format(path))
+                continue
+            if self.load(path, width) is not None:
+                continue
+            self.store(path, width, decode(path, width))
+            built += 1
+        return built
+
+    def _header(self, width, height, st, sha1):
+        header = struct.pack(HEADER_FORMAT, MAGIC, VERSION, 0, width, height, st.st_mtime,
+            st.st_size, sha1)
+        return header.ljust(HEADER_SIZE, b"\0")
+
+    def _write_header(self, cache_path, width, height, st, sha1):
+        try:
+            with open(cache_path, "r+b") as f:
+                f.write(self._header(width, height, st, sha1))
+        except OSError:
+            pass
+
+
+# the shared on-disk cache used by the pixmap cache
+ASSET_CACHE = AssetCache()
+
+
+if __name__ == '__main__':
+    # construct the argument parser and parse the arguments
+    ap = argparse.ArgumentParser(
+        description="pre-scale every scoreboard graphic into the on-disk asset cache")
+    ap.add_argument("-g", "--game", default="bocce", choices=["bocce", "curling"],
+        help="which game's graphics should be built?")
+    args = vars(ap.parse_args())
+
+    # make the games package imports work when run from the repo root
+    sys.path.append(os.getcwd())
+    logging.basicConfig(level=logging.INFO)
+
+    # the views list what they draw and at which widths
+    from views.media.pixmapcache import decode_source_image
+    if args["game"] == "bocce":
+        from views.bocce.bocceui import asset_manifest
+    elif args["game"] == "curling":
+        from views.curling.curlingui import asset_manifest
+
+    built = ASSET_CACHE.build(asset_manifest(), decode_source_image)
+    logging.info("built {} asset cache entries in {}".format(built, ASSET_CACHE.cache_dir))
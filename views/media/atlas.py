@@ -0,0 +1,145 @@
+# imports
+import os
+import math
+
+# PyQt imports
+from PyQt5.QtCore import QObject, QFileSystemWatcher, QTimer, QRect, Qt, pyqtSignal
+from PyQt5.QtGui import QImage, QPixmap, QPainter
+
+# pre-scaled image decoding
+from views.media.pixmapcache import decode_image
+
+# scale of the screen the scoreboard is shown on
+from views.media.screen import SCREEN_PROFILE
+
+# decoded media accounting
+from views.media.budget import MEDIA_BUDGET
+
+# other imports
+from imutils import paths
+
+# logging
+import logging
+
+# wait for a burst of file changes to settle before rebuilding (milli-seconds)
+ATLAS_REBUILD_DELAY = 500
+
+
+class SpriteAtlas(QObject):
+    """
+    Packs every image in a directory (scaled to one width) into a single atlas pixmap
+
+    Sprites are addressed by file name without the extension (e.g. "7b" for 7b.png) and
+    rects are in physical pixels of the current screen profile.  The atlas is decoded
+    once; a sprite is blitted out of it the first time it is needed and reused after
+    that, so drawing never touches the disk.  A QFileSystemWatcher rebuilds
+    the atlas when an image in the directory is added, removed, or edited.
+    """
+    # emitted after the atlas has been rebuilt from disk
+    rebuilt = pyqtSignal()
+
+    def __init__(self, directory, width, parent=None):
+        super().__init__(parent)
+        self.directory = directory
+        self.width = width
+        self.pixmap = QPixmap()
+        self.rects = {}
+        self._sprites = {}
+        self._charged = 0
+
+        # watch the directory (added / removed files) and each image (edits)
+        self.watcher = QFileSystemWatcher(self)
+        self.watcher.directoryChanged.connect(self._schedule_rebuild)
+        self.watcher.fileChanged.connect(self._schedule_rebuild)
+        self._rebuild_timer = QTimer(self)
+        self._rebuild_timer.setSingleShot(True)
+        self._rebuild_timer.setInterval(ATLAS_REBUILD_DELAY)
+        self._rebuild_timer.timeout.connect(self.build)
+
+        self.build()
+
+    def build(self):
+        """decodes every image in the directory and packs them into a grid"""
+        image_paths = sorted(paths.list_images(self.directory))
+        device_width = SCREEN_PROFILE.device(self.width)
+        images = []
+        for path in image_paths:
+            try:
+                images.append((path, decode_image(path, device_width)))
+            except Exception as e:
+                logging.warning("couldn't add {} to the atlas: {}".format(path, str(e)))
+
+        # every sprite gets a cell as big as the biggest image
+        cell_w = max([img.width() for _, img in images], default=1)
+        cell_h = max([img.height() for _, img in images], default=1)
+        cols = max(1, math.ceil(math.sqrt(len(images))))
+        rows = max(1, math.ceil(len(images) / cols))
+
+        # paint the images into one transparent sheet
+        sheet = QImage(cols * cell_w, rows * cell_h, QImage.Format_ARGB32_Premultiplied)
+        sheet.fill(Qt.transparent)
+        rects = {}
+        painter = QPainter(sheet)
+        for i, (path, img) in enumerate(images):
+            x = (i % cols) * cell_w
+            y = (i // cols) * cell_h
+            painter.drawImage(x, y, img)
+            name = os.path.splitext(os.path.basename(path))[0]
+            rects[name] = QRect(x, y, img.width(), img.height())
+        painter.end()
+
+        self.pixmap = QPixmap.fromImage(sheet)
+        self.pixmap.setDevicePixelRatio(SCREEN_PROFILE.dpr)
+        self.rects = rects
+        self._sprites = {}
+        self._report()
+
+        # (re)watch the images; editors often replace a file, which drops its watch
+        self.watcher.addPath(self.directory)
+        watched = set(self.watcher.files())
+        missing = [path for path in image_paths if path not in watched]
+        if missing:
+            self.watcher.addPaths(missing)
+
+        logging.info("built {} sprite atlas with {} images ({}x{})".format(
+            self.directory, len(rects), self.pixmap.width(), self.pixmap.height()))
+        self.rebuilt.emit()
+
+    def source(self, name):
+        """returns (atlas pixmap, source rect) for painting a sprite directly"""
+        return self.pixmap, self.rects[name]
+
+    def sprite(self, name):
+        """returns the sprite as its own pixmap (blitted from the atlas once)"""
+        sprite = self._sprites.get(name)
+        if sprite is None:
+            sprite = self.pixmap.copy(self.rects[name])
+            sprite.setDevicePixelRatio(self.pixmap.devicePixelRatio())
+            self._sprites[name] = sprite
+            self._report()
+        return sprite
+
+    def name_of(self, pixmap):
+        """the name of the sprite a pixmap was blitted as (None if it isn't one of ours)"""
+        for name, sprite in self._sprites.items():
+            if sprite.cacheKey() == pixmap.cacheKey():
+                return name
+        return None
+
+    def nbytes(self):
+        """bytes held by the atlas and the sprites blitted out of it"""
+        sheets = [self.pixmap] + list(self._sprites.values())
+        return sum([p.width() * p.height() * 4 for p in sheets])
+
+    def _report(self):
+        # the atlas holds its bytes until it is rebuilt, so it is accounted, not evicted
+        nbytes = self.nbytes()
+        if nbytes > self._charged:
+            MEDIA_BUDGET.charge("atlas", nbytes - self._charged)
+        else:
+            MEDIA_BUDGET.release("atlas", self._charged - nbytes)
+        self._charged = nbytes
+
+    def _schedule_rebuild(self, path):
+        logging.info("{} changed, rebuilding the sprite atlas".format(path))
+        self._rebuild_timer.start()
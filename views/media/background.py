@@ -0,0 +1,89 @@
+# PyQt imports
+from PyQt5.QtCore import QRect, QSize, Qt
+from PyQt5.QtGui import QImageIOHandler, QImageReader, QPixmap
+
+# decoded media accounting
+from views.media.budget import MEDIA_BUDGET
+
+# logging
+import logging
+
+
+class ScaledBackground:
+    """
+    A window background image scaled to the window's size
+
+    The scaled pixmap is cached and only rebuilt when the window's geometry (or device
+    pixel ratio) changes, so a repaint is a single unscaled blit.  The full-resolution
+    source isn't kept; a rebuild decodes the file again, straight to the size it's
+    shown at.  The image is scaled to cover the window and centered, cropping whatever
+    overhangs.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.rebuilds = 0
+        self._pixmap = None
+        self._key = None
+
+        # a bad path just leaves the window without a background
+        self.missing = False
+
+    def pixmap(self, size, dpr=1.0):
+        """returns the background for a window of `size` (layout pixels)"""
+        if self.missing:
+            return None
+        key = (size.width(), size.height(), dpr)
+        if key != self._key:
+            self._pixmap = self._scale(size, dpr)
+            if self._pixmap is None:
+                self.missing = True
+                MEDIA_BUDGET.set("background", 0)
+                return None
+            MEDIA_BUDGET.set("background", self._pixmap.width() * self._pixmap.height() * 4)
+            self._key = key
+            self.rebuilds += 1
+        return self._pixmap
+
+    def paint(self, painter, rect, dpr=1.0):
+        """draws the background filling `rect`"""
+        pixmap = self.pixmap(rect.size(), dpr)
+        if pixmap is not None:
+            painter.drawPixmap(rect.topLeft(), pixmap)
+
+    def _scale(self, size, dpr):
+        device = QSize(max(1, int(size.width() * dpr)), max(1, int(size.height() * dpr)))
+        reader = QImageReader(self.path)
+        reader.setAutoTransform(True)
+
+        # decode at the size that covers the window (jpgs are DCT-scaled while decoding)
+        source = reader.size()
+        if source.isValid():
+            # photos may be stored sideways with an EXIF rotation
+            rotated = bool(reader.transformation() & QImageIOHandler.TransformationRotate90)
+            if rotated:
+                source.transpose()
+            covering = source.scaled(device, Qt.KeepAspectRatioByExpanding)
+            if rotated:
+                covering.transpose()
+            reader.setScaledSize(covering)
+
+        image = reader.read()
+        if image.isNull():
+            logging.warning("couldn't load background {}: {}".format(self.path,
+                reader.errorString()))
+            return None
+
+        # formats without a size in the header are scaled after decoding
+        scaled = image.scaled(device, Qt.KeepAspectRatioByExpanding,
+            Qt.SmoothTransformation)
+
+        # center crop to the window
+        x = int((scaled.width() - device.width()) / 2)
+        y = int((scaled.height() - device.height()) / 2)
+        pixmap = QPixmap.fromImage(scaled.copy(QRect(x, y, device.width(),
+            device.height())))
+        pixmap.setDevicePixelRatio(dpr)
+        logging.debug("scaled background {} to {}x{}".format(self.path, device.width(),
+            device.height()))
+        return pixmap
@@ -0,0 +1,190 @@
+# PyQt imports
+from PyQt5.QtCore import QTimer, Qt
+from PyQt5.QtWidgets import QLabel
+
+# logging
+import logging
+
+# GLOBAL BUDGET (bytes of decoded media kept in memory; sized for a 1 GB Raspberry Pi)
+DEFAULT_MEDIA_BUDGET_BYTES = 256 * 1024 * 1024
+
+# PER-CATEGORY LIMITS (None means only the global budget applies)
+DEFAULT_CATEGORY_LIMITS = {
+    "pixmaps": 64 * 1024 * 1024,
+    "atlas": 16 * 1024 * 1024,
+    "buffers": 8 * 1024 * 1024,
+    "background": 16 * 1024 * 1024,
+    "screensaver": 32 * 1024 * 1024,
+    "animations": 96 * 1024 * 1024,
+    # GIFs playing with QMovie (not from the frame cache), one frame per overlay window
+    "playback": 16 * 1024 * 1024,
+    "videos": 48 * 1024 * 1024,
+}
+
+# how often usage is written to the log
+MEDIA_LOG_MINUTES = 5
+
+# how often the debug overlay refreshes
+OVERLAY_REFRESH_MS = 1000
+
+
+def megabytes(nbytes):
+    return nbytes / (1024 * 1024)
+
+
+class MediaCategory:
+    """the decoded bytes one kind of media holds and how to free some of them"""
+
+    def __init__(self, name, limit=None, evict=None):
+        self.name = name
+        self.limit = limit
+        self.evict = evict
+        self.used = 0
+        self.peak = 0
+        self.evicted = 0
+
+
+class MediaBudget:
+    """
+    Central accountant for every byte of decoded media the scoreboard keeps in memory
+
+    Caches report what they hold with `charge()` / `release()` (or `set()` for things
+    rebuilt wholesale like the card atlas).  A category that goes over its own limit is
+    asked to evict through the callback it registered; if the total goes over the global
+    budget, evictable categories are asked in the order they registered.  Categories
+    without an evict callback (e.g. a playing animation) are only accounted for.
+    """
+
+    def __init__(self, max_bytes=DEFAULT_MEDIA_BUDGET_BYTES, limits=DEFAULT_CATEGORY_LIMITS):
+        self.max_bytes = max_bytes
+        self.default_limits = dict(limits)
+        self.categories = {}
+        self._enforcing = False
+        self._log_timer = None
+
+    def register(self, name, limit=None, evict=None):
+        """sets a category's limit (falls back to the default) and evict callback"""
+        category = self.category(name)
+        if limit is not None:
+            category.limit = limit
+        if evict is not None:
+            category.evict = evict
+        return category
+
+    def category(self, name):
+        category = self.categories.get(name)
+        if category is None:
+            category = MediaCategory(name, self.default_limits.get(name))
+            self.categories[name] = category
+        return category
+
+    def set_limit(self, name, limit):
+        self.category(name).limit = limit
+        self._enforce(name)
+
+    def charge(self, name, nbytes):
+        """records `nbytes` more decoded media in a category, evicting if over budget"""
+        category = self.category(name)
+        category.used += nbytes
+        category.peak = max(category.peak, category.used)
+        self._enforce(name)
+
+    def release(self, name, nbytes):
+        """records `nbytes` of a category's media being freed"""
+        category = self.category(name)
+        category.used = max(0, category.used - nbytes)
+
+    def set(self, name, nbytes):
+        """records the total a category holds now"""
+        category = self.category(name)
+        if nbytes > category.used:
+            self.charge(name, nbytes - category.used)
+        else:
+            self.release(name, category.used - nbytes)
+
+    def total(self):
+        return sum(category.used for category in self.categories.values())
+
+    def _enforce(self, name):
+        # evict callbacks release bytes, which must not recurse into more evictions
+        if self._enforcing:
+            return
+        self._enforcing = True
+        try:
+            category = self.categories[name]
+            if category.limit is not None and category.used > category.limit:
+                self._evict(category, category.used - category.limit)
+                if category.used > category.limit:
+                    logging.warning("{} media is {:.1f} MB over its {:.1f} MB limit".format(
+                        name, megabytes(category.used - category.limit),
+                        megabytes(category.limit)))
+
+            excess = self.total() - self.max_bytes
+            for other in self.categories.values():
+                if excess <= 0:
+                    break
+                excess -= self._evict(other, excess)
+            if excess > 0:
+                logging.warning("decoded media is {:.1f} MB over the {:.1f} MB budget".format(
+                    megabytes(excess), megabytes(self.max_bytes)))
+        finally:
+            self._enforcing = False
+
+    def _evict(self, category, nbytes):
+        """asks a category to free `nbytes`; returns how many it freed"""
+        if category.evict is None:
+            return 0
+        before = category.used
+        category.evict(nbytes)
+        freed = max(0, before - category.used)
+        category.evicted += freed
+        return freed
+
+    def summary(self):
+        """one line per category: used / limit (peak)"""
+        lines = ["media {:.1f} / {:.1f} MB".format(megabytes(self.total()),
+            megabytes(self.max_bytes))]
+        for category in sorted(self.categories.values(), key=lambda c: -c.used):
+            limit = "-" if category.limit is None else "{:.1f}".format(
+                megabytes(category.limit))
+            lines.append("{}: {:.1f} / {} MB (peak {:.1f}, evicted {:.1f})".format(
+                category.name, megabytes(category.used), limit, megabytes(category.peak),
+                megabytes(category.evicted)))
+        return lines
+
+    def log_usage(self):
+        for line in self.summary():
+            logging.info(line)
+
+    def start_logging(self, minutes=MEDIA_LOG_MINUTES):
+        """writes the usage to the log every few minutes"""
+        if self._log_timer is None:
+            self._log_timer = QTimer()
+            self._log_timer.timeout.connect(self.log_usage)
+        self._log_timer.start(int(minutes * 60 * 1000))
+
+
+# the shared accountant every media cache reports into
+MEDIA_BUDGET = MediaBudget()
+
+
+class MediaBudgetOverlay(QLabel):
+    """debug overlay in a window's corner showing decoded media usage"""
+
+    def __init__(self, parent, budget=MEDIA_BUDGET):
+        super().__init__(parent)
+        self.budget = budget
+        self.setAttribute(Qt.WA_TransparentForMouseEvents)
+        self.setStyleSheet("QLabel { background-color: rgba(0, 0, 0, 160); color: white; "
+            "font-family: monospace; font-size: 12pt; padding: 4px; }")
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.refresh)
+        self.timer.start(OVERLAY_REFRESH_MS)
+        self.refresh()
+        self.show()
+
+    def refresh(self):
+        self.setText("\n".join(self.budget.summary()))
+        self.adjustSize()
+        self.move(self.parent().width() - self.width() - 10, 10)
+        self.raise_()
@@ -0,0 +1,109 @@
+# PyQt imports
+from PyQt5.QtGui import QImage, QPixmap
+
+# decoded media accounting
+from views.media.budget import MEDIA_BUDGET
+
+# logging
+import logging
+
+# other imports
+import numpy as np
+import cv2
+
+# free buffers kept per size; more than this are handed back to numpy
+MAX_FREE_PER_SIZE = 4
+
+
+class BufferPool:
+    """
+    Owns the RGBA pixel buffers OpenCV graphics are drawn into before becoming pixmaps
+
+    Buffers are (height, width, 4) uint8 arrays pooled by size, so redrawing a graphic at a
+    size that has been drawn before reuses memory instead of allocating.  A QImage is only
+    ever wrapped around a pooled buffer for the single `QPixmap.fromImage` copy, so no
+    QImage outlives the memory it points at.  Idle buffers are reported to the media
+    budget, which can ask the pool to drop them.
+    """
+
+    def __init__(self):
+        # (height, width) -> [free buffers]
+        self._free = {}
+
+        # counters
+        self.allocations = 0
+        self.reuses = 0
+        self.bytes_allocated = 0
+        MEDIA_BUDGET.register("buffers", evict=self.trim)
+
+    def acquire(self, width, height):
+        """returns a (height, width, 4) buffer; its contents are undefined"""
+        free = self._free.get((height, width))
+        if free:
+            self.reuses += 1
+            buffer = free.pop()
+            MEDIA_BUDGET.release("buffers", buffer.nbytes)
+            return buffer
+        self.allocations += 1
+        self.bytes_allocated += width * height * 4
+        logging.debug("allocated a {}x{} RGBA buffer".format(width, height))
+        return np.empty(shape=[height, width, 4], dtype=np.uint8)
+
+    def release(self, buffer):
+        """hands a buffer back to the pool"""
+        height, width = buffer.shape[:2]
+        free = self._free.setdefault((height, width), [])
+        if len(free) < MAX_FREE_PER_SIZE:
+            free.append(buffer)
+            MEDIA_BUDGET.charge("buffers", buffer.nbytes)
+
+    def trim(self, nbytes):
+        """drops idle buffers until `nbytes` are freed"""
+        freed = 0
+        for free in self._free.values():
+            while free and freed < nbytes:
+                buffer = free.pop()
+                MEDIA_BUDGET.release("buffers", buffer.nbytes)
+                freed += buffer.nbytes
+        return freed
+
+    def reserve(self, width, height, count=1):
+        """allocates buffers for a common size up front"""
+        buffers = [self.acquire(width, height) for i in range(count)]
+        for buffer in buffers:
+            self.release(buffer)
+
+    def to_pixmap(self, buffer):
+        """copies an RGBA buffer straight into a new QPixmap"""
+        height, width = buffer.shape[:2]
+        qImg = QImage(buffer.data, width, height, width * 4, QImage.Format_RGBA8888)
+        return QPixmap.fromImage(qImg)
+
+    def bgra_to_pixmap(self, image, width):
+        """
+        converts a BGRA OpenCV image to a QPixmap `width` pixels wide (keeping the aspect
+        ratio) through pooled buffers
+        """
+        (h, w) = image.shape[:2]
+        height = int(h * (width / float(w)))
+
+        # swap color channels for Qt, then resize into a second buffer if needed
+        rgba = self.acquire(w, h)
+        cv2.cvtColor(image, cv2.COLOR_BGRA2RGBA, dst=rgba)
+        if (w, h) != (width, height):
+            resized = self.acquire(width, height)
+            cv2.resize(rgba, (width, height), dst=resized, interpolation=cv2.INTER_AREA)
+            self.release(rgba)
+            rgba = resized
+
+        pixmap = self.to_pixmap(rgba)
+        self.release(rgba)
+        return pixmap
+
+    def log_stats(self):
+        logging.info("RGBA buffers allocated: {} ({:.1f} MB), reused: {}".format(
+            self.allocations, self.bytes_allocated / (1024 * 1024), self.reuses))
+
+
+# the shared pool used by every scoreboard view
+BUFFER_POOL = BufferPool()
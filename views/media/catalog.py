@@ -0,0 +1,129 @@
+# imports
+import os
+import random
+
+# PyQt imports
+from PyQt5.QtCore import QFileSystemWatcher
+
+# logging
+import logging
+
+
+class MediaCatalog:
+    """
+    In-memory index of the sound and animation files under the media directories
+
+    Directories are walked once (at startup, or the first time they're asked about) and
+    watched with a QFileSystemWatcher; when venue staff add or remove files only the
+    directory that changed is rescanned.  Lookups return cached lists, so picking a
+    random reaction is a dict lookup and a `random.choice`, not a walk of the SD card.
+    Paths are absolute.
+    """
+
+    def __init__(self):
+        # abspath -> (file names, subdirectory abspaths) of the files directly inside
+        self._dirs = {}
+
+        # (abspath, extensions, contains) -> every matching file below the directory
+        self._lists = {}
+
+        # created with the first index (after the QApplication exists)
+        self.watcher = None
+        self.rescans = 0
+
+    def index(self, dirs):
+        """walks and watches directories (missing ones are skipped)"""
+        for path in dirs:
+            path = os.path.abspath(path)
+            if path not in self._dirs and os.path.isdir(path):
+                self._scan_tree(path)
+        logging.info("media catalog indexed {} directories".format(len(self._dirs)))
+
+    def files(self, path, exts, contains=None):
+        """every file below `path` ending in one of `exts` (lower case compare)"""
+        path = os.path.abspath(path)
+        key = (path, tuple(exts), contains)
+        files = self._lists.get(key)
+        if files is not None:
+            return files
+
+        # not indexed yet; a directory that doesn't exist yet isn't remembered
+        if path not in self._dirs:
+            if not os.path.isdir(path):
+                return []
+            self._scan_tree(path)
+
+        exts = tuple(ext.lower() for ext in exts)
+        files = []
+        stack = [path]
+        while stack:
+            directory = stack.pop()
+            (names, subdirs) = self._dirs.get(directory, ([], []))
+            for name in names:
+                if contains is not None and name.find(contains) == -1:
+                    continue
+                if name[name.rfind("."):].lower().endswith(exts):
+                    files.append(os.path.join(directory, name))
+            stack.extend(subdirs)
+        files.sort()
+        self._lists[key] = files
+        return files
+
+    def choice(self, path, exts):
+        """a random file below `path`, or None if there aren't any"""
+        files = self.files(path, exts)
+        if len(files) == 0:
+            return None
+        return random.choice(files)
+
+    def _scan_tree(self, path):
+        stack = [path]
+        while stack:
+            stack.extend(self._scan(stack.pop()))
+
+    def _scan(self, path):
+        """indexes one directory; returns subdirectories not indexed yet"""
+        try:
+            entries = list(os.scandir(path))
+        except OSError as e:
+            logging.warning("couldn't index media directory {}: {}".format(path, str(e)))
+            return []
+        names = sorted(e.name for e in entries if e.is_file())
+        subdirs = sorted(e.path for e in entries if e.is_dir())
+        self._dirs[path] = (names, subdirs)
+        self._lists.clear()
+
+        if self.watcher is None:
+            self.watcher = QFileSystemWatcher()
+            self.watcher.directoryChanged.connect(self._directory_changed)
+        self.watcher.addPath(path)
+        return [subdir for subdir in subdirs if subdir not in self._dirs]
+
+    def _forget(self, path):
+        """drops a directory (and everything below it) from the index"""
+        stack = [path]
+        while stack:
+            entry = self._dirs.pop(stack.pop(), None)
+            if entry is not None:
+                stack.extend(entry[1])
+        self._lists.clear()
+
+    def _directory_changed(self, path):
+        self.rescans += 1
+        old_subdirs = self._dirs.get(path, ([], []))[1]
+        if not os.path.isdir(path):
+            logging.info("media directory {} was removed".format(path))
+            self._forget(path)
+            return
+        logging.info("media directory {} changed, rescanning".format(path))
+
+        # the directory itself, then any new subdirectories
+        for subdir in self._scan(path):
+            self._scan_tree(subdir)
+        for subdir in old_subdirs:
+            if subdir not in self._dirs[path][1]:
+                self._forget(subdir)
+
+
+# the shared catalog every scoreboard view picks media from
+MEDIA_CATALOG = MediaCatalog()
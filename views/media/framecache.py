@@ -0,0 +1,245 @@
+# imports
+import os
+from collections import OrderedDict
+
+# PyQt imports
+from PyQt5.QtCore import QRunnable, QSize, QThreadPool
+from PyQt5.QtGui import QImage, QImageReader, QPixmap
+
+# decode task signals
+from views.media.preloader import DecodeSignals
+
+# decoded media accounting
+from views.media.budget import MEDIA_BUDGET
+
+# frame rate cap shared with the GIF transcoder
+from views.media.giftranscode import MAX_GIF_FPS
+
+# logging
+import logging
+
+# DEFAULT FRAME CACHE BUDGET (bytes of decoded frames)
+# measured on the bundled reactions at the 1080p overlay size (800 px) and 15 fps: the
+# biggest are about 119 MB (kendama_tenor) and 115 MB (golffail_tenor), most are
+# 10 - 60 MB, so every reaction fits on its own and the smaller ones a few at a time
+DEFAULT_FRAME_CACHE_BYTES = 128 * 1024 * 1024
+
+# GIFs without a frame delay play at 10 fps
+DEFAULT_FRAME_DELAY_MS = 100
+
+
+class DecodedAnimation:
+    """
+    every frame of an animation at the overlay's size, with how long each is shown;
+    frames are decoded as QImages and each becomes a QPixmap (in place) the first time
+    it's shown
+    """
+
+    def __init__(self, path, frames, delays):
+        self.path = path
+        self.frames = frames
+        self.delays = delays
+        self.nbytes = sum(frame.sizeInBytes() for frame in frames)
+        self.hits = 0
+
+    def pixmap(self, idx, dpr):
+        frame = self.frames[idx]
+        if isinstance(frame, QImage):
+            frame = QPixmap.fromImage(frame)
+            frame.setDevicePixelRatio(dpr)
+            self.frames[idx] = frame
+        return frame
+
+
+class FrameDecodeTask(QRunnable):
+    """decodes every frame of an animation on a QThreadPool worker"""
+
+    def __init__(self, path, size, signals):
+        super().__init__()
+        self.path = path
+        self.size = size
+        self.signals = signals
+
+    def run(self):
+        reader = QImageReader(self.path)
+
+        # scaled (once, smoothly) to fit the overlay, keeping the aspect ratio
+        source = reader.size()
+        if source.isValid():
+            scale = self.size / float(max(source.width(), source.height()))
+            reader.setScaledSize(QSize(max(1, int(round(source.width() * scale))),
+                max(1, int(round(source.height() * scale)))))
+        min_delay = 1000.0 / MAX_GIF_FPS
+        frames = []
+        delays = []
+        since_kept = 0
+        while reader.canRead():
+            qImg = reader.read()
+            if qImg.isNull():
+                break
+            delay = reader.nextImageDelay()
+            delay = delay if delay > 0 else DEFAULT_FRAME_DELAY_MS
+
+            # frames that come too soon after the last kept frame are merged into it
+            if frames and since_kept < min_delay:
+                delays[-1] += delay
+                since_kept += delay
+                continue
+
+            # premultiplied ARGB keeps partial transparency and paints without conversion
+            frames.append(qImg.convertToFormat(QImage.Format_ARGB32_Premultiplied))
+            delays.append(delay)
+            since_kept = delay
+        if not frames:
+            self.signals.failed.emit(self.path, self.size, reader.errorString())
+            return
+        self.signals.decoded.emit(self.path, self.size,
+            DecodedAnimation(self.path, frames, delays))
+
+
+class FrameCache:
+    """
+    Bounded cache of decoded, overlay-sized animation frames
+
+    A miss queues the animation for decoding on a worker thread (the caller plays it
+    with QMovie meanwhile), so the next time it's wanted it plays straight from memory.
+    Frames are kept at the overlay's device size (so showing one is a blit) and at most
+    MAX_GIF_FPS; each becomes a pixmap the first time it's shown.  Over budget, the
+    least used of the less recently used half is evicted, so a reaction that comes up
+    every end outlives one that played once, recently.  Animations requested with `pin`
+    (the prefetched next pick of each reaction) are never evicted until they're played
+    or unpinned, and once pins fill the budget further pinned requests aren't decoded.
+    """
+
+    def __init__(self, max_bytes=DEFAULT_FRAME_CACHE_BYTES, category="animations"):
+        self.max_bytes = max_bytes
+        self.category = category
+        self.bytes_used = 0
+        self.hits = 0
+        self.misses = 0
+
+        # (abspath, device size) -> DecodedAnimation, least -> most recently used
+        self._entries = OrderedDict()
+        self._pending = set()
+
+        # keys that are kept until they're played (they may still be decoding)
+        self._pinned = set()
+        MEDIA_BUDGET.register(category, limit=max_bytes, evict=self.trim)
+
+        # the worker and its signals are created with the first decode (after the
+        # QApplication exists)
+        self.pool = None
+        self.signals = None
+
+    def key(self, path, size):
+        return (os.path.abspath(path), size)
+
+    def get(self, path, size):
+        """returns the decoded animation, or None (and queues a decode) on a miss"""
+        key = self.key(path, size)
+        entry = self._entries.get(key)
+
+        # a pinned animation has done its job once it's asked for
+        self._pinned.discard(key)
+        if entry is not None:
+            self.hits += 1
+            entry.hits += 1
+            self._entries.move_to_end(key)
+            return entry
+        self.misses += 1
+        self.request(path, size)
+        return None
+
+    def request(self, path, size, pin=False):
+        """
+        decodes an animation in the background unless it's cached or on its way; a
+        pinned animation isn't evicted until it's played (see `get`) or unpinned
+        """
+        key = self.key(path, size)
+        if key in self._entries or key in self._pending:
+            if pin:
+                self._pinned.add(key)
+            return
+
+        # warm only what the budget can hold
+        if pin:
+            if self._pinned_bytes() >= self.max_bytes:
+                logging.debug("frame cache is full of pinned animations, not warming "
+                              "{}".format(path))
+                return
+            self._pinned.add(key)
+        if self.pool is None:
+            self.pool = QThreadPool()
+            self.pool.setMaxThreadCount(1)
+            self.signals = DecodeSignals()
+            self.signals.decoded.connect(self._on_decoded)
+            self.signals.failed.connect(self._on_failed)
+        self._pending.add(key)
+        self.pool.start(FrameDecodeTask(key[0], size, self.signals))
+
+    def unpin(self, path, size):
+        self._pinned.discard(self.key(path, size))
+
+    def trim(self, nbytes):
+        """evicts animations until `nbytes` are freed (keeps the most recent and pinned)"""
+        freed = 0
+        while freed < nbytes:
+            # the least used of the older half (oldest first on a tie)
+            keys = [k for k in self._entries if k not in self._pinned]
+            if len(keys) <= 1:
+                break
+            keys = keys[:max(1, int(len(keys) / 2))]
+            key = min(keys, key=lambda k: self._entries[k].hits)
+            entry = self._entries.pop(key)
+            freed += entry.nbytes
+            self._account(-entry.nbytes)
+            logging.debug("frame cache evicted {}".format(key[0]))
+        return freed
+
+    def clear(self):
+        self._entries.clear()
+        self._pinned.clear()
+        MEDIA_BUDGET.release(self.category, self.bytes_used)
+        self.bytes_used = 0
+
+    def log_stats(self):
+        logging.info("frame cache: {} animations, {:.1f} MB, hits: {}, misses: {}".format(
+            len(self._entries), self.bytes_used / (1024 * 1024), self.hits, self.misses))
+
+    def _on_decoded(self, path, size, animation):
+        key = (path, size)
+        self._pending.discard(key)
+        if animation.nbytes > self.max_bytes:
+            logging.info("{} is too big for the frame cache ({:.1f} MB)".format(path,
+                animation.nbytes / (1024 * 1024)))
+            self._pinned.discard(key)
+            return
+
+        # pins can't hold more than the whole budget; past that it's cached like any other
+        if key in self._pinned and \
+                self._pinned_bytes() + animation.nbytes > self.max_bytes:
+            logging.info("frame cache is full of pinned animations, not pinning {}".format(
+                path))
+            self._pinned.discard(key)
+        self._entries[key] = animation
+        self._account(animation.nbytes)
+
+    def _on_failed(self, path, size, error):
+        self._pending.discard((path, size))
+        self._pinned.discard((path, size))
+        logging.warning("couldn't decode animation frames {}: {}".format(path, error))
+
+    def _pinned_bytes(self):
+        return sum(e.nbytes for k, e in self._entries.items() if k in self._pinned)
+
+    def _account(self, nbytes):
+        # the budget may call back into trim() when charged
+        self.bytes_used += nbytes
+        if nbytes > 0:
+            MEDIA_BUDGET.charge(self.category, nbytes)
+        else:
+            MEDIA_BUDGET.release(self.category, -nbytes)
+
+
+# the shared cache the overlay windows play reactions from
+FRAME_CACHE = FrameCache()
@@ -0,0 +1,218 @@
+# imports
+import os
+import sys
+import json
+import hashlib
+import argparse
+
+# source hashing shared with the pixel buffer cache
+from views.media.assetcache import file_sha1
+
+# logging
+import logging
+
+# other imports
+from imutils import paths
+
+# ON-DISK GIF CACHE (relative to the scoreboard's working directory)
+GIF_CACHE_DIR = os.path.join(".cache", "gifs")
+
+# transcode settings: frames closer together than 1/MAX_GIF_FPS are merged, and each
+# frame is reduced to a palette of GIF_COLORS
+MAX_GIF_FPS = 15
+GIF_COLORS = 128
+
+# GIFs without a frame duration play at 10 fps
+DEFAULT_FRAME_MS = 100
+
+# source path -> (mtime, size, sha1) of every GIF the build has hashed
+GIF_INDEX_NAME = "index.json"
+
+
+def fit_size(width, height, size):
+    """the source size scaled down (never up) to fit in `size` x `size`"""
+    scale = min(1.0, size / float(max(width, height)))
+    return max(1, int(round(width * scale))), max(1, int(round(height * scale)))
+
+
+def transcode(src_path, dst_path, size, fps=MAX_GIF_FPS, colors=GIF_COLORS):
+    """
+    writes a copy of a GIF scaled down to fit `size` x `size` (the overlay scales it up
+    when drawing, so small sources stay small) with at most `fps` frames per second,
+    duplicate frames merged and a reduced palette; returns (source frames, written frames)
+    """
+    from PIL import Image, ImageSequence
+
+    min_frame_ms = 1000.0 / fps
+    frames = []
+    durations = []
+    raw = []
+    since_kept = 0
+    src_frames = 0
+    with Image.open(src_path) as im:
+        target = fit_size(im.width, im.height, size)
+        for frame in ImageSequence.Iterator(im):
+            src_frames += 1
+            duration = frame.info.get("duration") or DEFAULT_FRAME_MS
+
+            # merge frames that come too soon after the last kept frame
+            if frames and since_kept < min_frame_ms:
+                durations[-1] += duration
+                since_kept += duration
+                continue
+
+            scaled = frame.convert("RGBA")
+            if scaled.size != target:
+                scaled = scaled.resize(target, Image.LANCZOS)
+
+            # merge frames that don't change anything
+            pixels = scaled.tobytes()
+            if raw and pixels == raw[-1]:
+                durations[-1] += duration
+                since_kept += duration
+                continue
+
+            frames.append(scaled.quantize(colors, method=Image.FASTOCTREE))
+            durations.append(duration)
+            raw = [pixels]
+            since_kept = duration
+
+    if not frames:
+        raise ValueError("no frames could be read from {}".format(src_path))
+
+    # write to a temporary file and swap it in so readers never see half a file
+    tmp_path = "{}.{}.tmp".format(dst_path, os.getpid())
+    frames[0].save(tmp_path, format="GIF", save_all=True, append_images=frames[1:],
+        duration=[int(d) for d in durations], loop=0, disposal=2, optimize=True)
+    os.replace(tmp_path, dst_path)
+    return src_frames, len(frames)
+
+
+class GifCache:
+    """
+    On-disk cache of size-capped, frame-optimized reaction GIFs
+
+    Entries are keyed by the sha1 of the source file and the transcode settings, so an
+    edited GIF gets a new entry and a copied or renamed one reuses the old.  The build
+    writes an index of each source's (mtime, size, sha1), and `lookup` only consults
+    that index (a stat, never a read of the GIF), so it's cheap on the GUI thread.
+    `lookup` never transcodes; it hands back the optimized GIF if one has been built
+    for the source as it is now, and the source path otherwise, so the scoreboard runs
+    the same with or without a build.
+    """
+
+    def __init__(self, cache_dir=GIF_CACHE_DIR, fps=MAX_GIF_FPS, colors=GIF_COLORS):
+        self.cache_dir = cache_dir
+        self.fps = fps
+        self.colors = colors
+
+        # abspath -> [mtime, size, sha1 hex], as written by the build
+        self._index = {}
+        self._index_mtime = None
+
+    def index_path(self):
+        return os.path.join(self.cache_dir, GIF_INDEX_NAME)
+
+    def source_hash(self, path):
+        """hashes a source GIF (build only) and records it in the index"""
+        abspath = os.path.abspath(path)
+        st = os.stat(abspath)
+        entry = self._index.get(abspath)
+        if entry is not None and entry[:2] == [st.st_mtime, st.st_size]:
+            return entry[2]
+        digest = file_sha1(abspath).hex()
+        self._index[abspath] = [st.st_mtime, st.st_size, digest]
+        return digest
+
+    def cache_path(self, digest, size):
+        key = "{}@{}@{}fps@{}".format(digest, size, self.fps, self.colors)
+        return os.path.join(self.cache_dir, hashlib.sha1(key.encode()).hexdigest() + ".gif")
+
+    def lookup(self, path, size):
+        """returns the optimized GIF for `path` at `size` if built, else `path`"""
+        if not path.lower().endswith(".gif"):
+            return path
+        abspath = os.path.abspath(path)
+        try:
+            st = os.stat(abspath)
+        except OSError:
+            return path
+        self._load_index()
+        entry = self._index.get(abspath)
+        if entry is None or entry[:2] != [st.st_mtime, st.st_size]:
+            return path
+        cache_path = self.cache_path(entry[2], size)
+        return cache_path if os.path.isfile(cache_path) else path
+
+    def build(self, gif_paths, size):
+        """transcodes every GIF without a cache entry at `size`"""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        built = 0
+        self._load_index()
+        for path in gif_paths:
+            try:
+                cache_path = self.cache_path(self.source_hash(path), size)
+                if os.path.isfile(cache_path):
+                    continue
+                (src_frames, frames) = transcode(path, cache_path, size, self.fps,
+                    self.colors)
+            except (OSError, ValueError) as e:
+                logging.warning("couldn't transcode {}: {}".format(path, str(e)))
+                continue
+            logging.info("{}: {} -> {} frames, {:.1f} MB -> {:.1f} MB".format(path,
+                src_frames, frames, os.path.getsize(path) / (1024 * 1024),
+                os.path.getsize(cache_path) / (1024 * 1024)))
+            built += 1
+        self._write_index()
+        return built
+
+    def _load_index(self):
+        # re-read only when a build has rewritten the index
+        try:
+            mtime = os.path.getmtime(self.index_path())
+        except OSError:
+            return
+        if mtime == self._index_mtime:
+            return
+        try:
+            with open(self.index_path()) as f:
+                self._index = json.load(f)
+        except (OSError, ValueError) as e:
+            logging.warning("couldn't read the GIF cache index: {}".format(str(e)))
+            self._index = {}
+        self._index_mtime = mtime
+
+    def _write_index(self):
+        tmp_path = "{}.{}.tmp".format(self.index_path(), os.getpid())
+        with open(tmp_path, "w") as f:
+            json.dump(self._index, f)
+        os.replace(tmp_path, self.index_path())
+
+
+# the shared cache the overlay windows play reactions from
+GIF_CACHE = GifCache()
+
+
+if __name__ == '__main__':
+    # construct the argument parser and parse the arguments
+    ap = argparse.ArgumentParser(
+        description="transcode reaction GIFs to size-capped, frame-optimized copies")
+    ap.add_argument("dirs", nargs="*", default=["animations"],
+        help="directories to search for GIFs")
+    ap.add_argument("-s", "--size", type=int, default=None,
+        help="animation size in screen pixels (default: the overlay size on a 1080p "
+             "screen)")
+    args = vars(ap.parse_args())
+
+    # make the games package imports work when run from the repo root
+    sys.path.append(os.getcwd())
+    logging.basicConfig(level=logging.INFO)
+
+    from views.media.overlay import ANIMATION_SIZE
+    size = args["size"] or ANIMATION_SIZE
+    gif_paths = sorted(p for d in args["dirs"]
+        for p in paths.list_files(d, validExts=(".gif",)))
+
+    built = GIF_CACHE.build(gif_paths, size)
+    logging.info("transcoded {} of {} GIFs into {}".format(built, len(gif_paths),
+        GIF_CACHE.cache_dir))
@@ -0,0 +1,331 @@
+# imports
+import os
+
+# PyQt imports
+from PyQt5.QtCore import QSize, QTimer, QUrl, Qt, pyqtSignal
+from PyQt5.QtGui import QMovie
+from PyQt5.QtMultimedia import QMediaContent, QMediaPlayer
+from PyQt5.QtMultimediaWidgets import QVideoWidget
+from PyQt5.QtWidgets import QLabel, QStackedLayout, QWidget
+
+# scale of the screen the scoreboard is shown on
+from views.media.screen import SCREEN_PROFILE
+
+# size-capped reaction GIFs built ahead of time
+from views.media.giftranscode import GIF_CACHE
+
+# decoded frames of recently played reactions
+from views.media.framecache import FRAME_CACHE
+
+# decoded media accounting
+from views.media.budget import MEDIA_BUDGET
+
+# logging
+import logging
+
+# ANIMATION WINDOW SIZE (square, in 1920x1080 design pixels)
+ANIMATION_SIZE = 800
+
+# persistent overlay windows shared by every reaction and announcement
+OVERLAY_WINDOWS = 2
+
+# VIDEO CLIP TYPES (played with QMediaPlayer instead of QMovie)
+VIDEO_TYPES = (".mp4", ".m4v", ".mov", ".webm", ".mkv")
+
+# frames a loaded (playing or paused) video player is assumed to keep decoded
+PRELOADED_VIDEO_FRAMES = 3
+
+# media players kept with a clip loaded: one per reaction directory, which at three
+# 1080p frames each fits the "videos" budget
+CLIP_PLAYERS = 6
+
+
+def is_video(path):
+    return path.lower().endswith(VIDEO_TYPES)
+
+
+class ClipPlayer(QMediaPlayer):
+    """a media player that keeps one video clip loaded, paused on its first frame"""
+
+    def __init__(self):
+        super().__init__(None, QMediaPlayer.VideoSurface)
+        self.loaded = None
+        self._charged = 0
+
+        # the overlay window showing the clip, told when it ends
+        self.window = None
+        self.error.connect(self._error)
+        self.mediaStatusChanged.connect(self._status_changed)
+
+    def load(self, path):
+        if self.loaded == path:
+            return
+        self.setMedia(QMediaContent(QUrl.fromLocalFile(os.path.abspath(path))))
+        self.pause()
+        self.loaded = path
+        if not self._charged:
+            size = SCREEN_PROFILE.device(ANIMATION_SIZE)
+            self._charged = PRELOADED_VIDEO_FRAMES * size * size * 4
+            MEDIA_BUDGET.charge("videos", self._charged)
+
+    def unload(self):
+        self.stop()
+        self.setMedia(QMediaContent())
+        self.loaded = None
+        MEDIA_BUDGET.release("videos", self._charged)
+        self._charged = 0
+
+    def rewind(self):
+        # keep the clip loaded, paused on its first frame, for the next play
+        self.window = None
+        if self.loaded is not None:
+            self.pause()
+            self.setPosition(0)
+
+    def _status_changed(self, status):
+        if status == QMediaPlayer.EndOfMedia and self.window is not None:
+            self.window.ended.emit()
+
+    def _error(self, error):
+        logging.warning("couldn't play video {}: {}".format(self.loaded,
+            self.errorString()))
+
+        # drop the clip, so the next take() loads it again instead of reusing this
+        # player as a hit (a clip that failed while warming has nobody to end)
+        window = self.window
+        self.unload()
+        if window is not None:
+            window.ended.emit()
+
+
+class ClipPlayerPool:
+    """
+    Media players with the upcoming reaction clips loaded, shared by the overlay windows
+
+    `warm()` loads a clip in the least recently used player nobody is showing, and
+    `take()` hands back the player holding a clip (loading it first on a miss), so
+    starting a warmed clip is a seek and play.  The players outlive the windows they're
+    shown in; a window points its video output at the player it plays.
+    """
+
+    def __init__(self, count=CLIP_PLAYERS):
+        self.players = [ClipPlayer() for i in range(count)]
+
+    def warm(self, path):
+        if any(p.loaded == path for p in self.players):
+            return
+        idle = [p for p in self.players if p.window is None]
+        if idle:
+            self._use(idle[0]).load(path)
+
+    def take(self, path):
+        player = next((p for p in self.players if p.loaded == path and p.window is None),
+            None)
+        if player is None:
+            # the least recently used idle player (the oldest one if none are idle)
+            idle = [p for p in self.players if p.window is None]
+            player = idle[0] if idle else self.players[0]
+            player.load(path)
+        return self._use(player)
+
+    def close(self):
+        for player in self.players:
+            player.unload()
+
+    def _use(self, player):
+        # move it to the back of the line
+        self.players.remove(player)
+        self.players.append(player)
+        return player
+
+
+class OverlayWindow(QWidget):
+    """
+    a frameless always-on-top window that plays one animation at a time: GIFs from the
+    frame cache when they're there and with QMovie otherwise, video clips with a player
+    from the clip pool; `ended` is emitted when a clip reaches its end (or fails)
+    """
+    ended = pyqtSignal()
+
+    def __init__(self, name, clips):
+        super().__init__(None, Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint | Qt.Tool)
+        self.setWindowTitle(name)
+        self.setAttribute(Qt.WA_ShowWithoutActivating)
+        self.owner = None
+
+        # cached frames are at the window's size (keeping their aspect ratio), centered
+        self.label = QLabel()
+        self.label.setAlignment(Qt.AlignCenter)
+
+        # clips play in a player borrowed from the pool
+        self.video = QVideoWidget()
+        self.clips = clips
+        self.player = None
+        self.stack = QStackedLayout(self)
+        self.stack.setContentsMargins(0, 0, 0, 0)
+        self.stack.addWidget(self.label)
+        self.stack.addWidget(self.video)
+
+        # the movie is reused; only its source changes
+        self.movie = QMovie(self)
+        self.label.setMovie(self.movie)
+
+        # steps through cached frames
+        self.frames = None
+        self.frame_idx = 0
+        self.frame_timer = QTimer(self)
+        self.frame_timer.setSingleShot(True)
+        self.frame_timer.timeout.connect(self._next_frame)
+        self.resize_to_screen()
+
+    def resize_to_screen(self):
+        size = SCREEN_PROFILE.logical(ANIMATION_SIZE)
+        self.setFixedSize(size, size)
+        self.label.setFixedSize(size, size)
+        self.movie.setScaledSize(QSize(size, size))
+
+        # centered on the scoreboard's screen
+        if SCREEN_PROFILE.screen is not None:
+            geometry = SCREEN_PROFILE.screen.geometry()
+            self.move(geometry.x() + int((geometry.width() - size) / 2),
+                geometry.y() + int((geometry.height() - size) / 2))
+
+    def play(self, path):
+        if is_video(path):
+            self._play_video(path)
+            return
+
+        # play the transcoded copy if one was built for this screen
+        size = SCREEN_PROFILE.device(ANIMATION_SIZE)
+        path = GIF_CACHE.lookup(path, size)
+        self._reset()
+
+        # play from memory on a hit; a miss plays with QMovie while the frames decode
+        self.frames = FRAME_CACHE.get(path, size)
+        if self.frames is not None:
+            self.frame_idx = 0
+            self._show_frame()
+        else:
+            self.label.setMovie(self.movie)
+            self.movie.setFileName(path)
+            self.movie.start()
+        self.stack.setCurrentWidget(self.label)
+        self.show()
+        self.raise_()
+
+    def stop(self):
+        self._reset()
+        self.hide()
+
+    def frame_bytes(self):
+        # a loaded video is accounted for under "videos"
+        if self.stack.currentWidget() is self.video:
+            return 0
+
+        # cached frames are accounted for by the frame cache
+        if self.frames is not None:
+            return 0
+        scaled = self.movie.scaledSize()
+        return scaled.width() * scaled.height() * 4
+
+    def _play_video(self, path):
+        self._reset()
+
+        # a preloaded clip only needs a seek
+        self.player = self.clips.take(path)
+        self.player.window = self
+        self.player.setVideoOutput(self.video)
+        self.player.setPosition(0)
+        self.player.play()
+        self.stack.setCurrentWidget(self.video)
+        self.show()
+        self.raise_()
+
+    def _reset(self):
+        # the clip goes back to the pool loaded, paused and rewound
+        if self.player is not None:
+            self.player.rewind()
+            self.player = None
+        self.movie.stop()
+        self.frame_timer.stop()
+        self.frames = None
+
+        # drop the decoded frame while the window sits idle
+        self.movie.setFileName("")
+        self.label.clear()
+
+    def _show_frame(self):
+        self.label.setPixmap(self.frames.pixmap(self.frame_idx, SCREEN_PROFILE.dpr))
+        self.frame_timer.start(self.frames.delays[self.frame_idx])
+
+    def _next_frame(self):
+        if self.frames is None:
+            return
+        self.frame_idx = (self.frame_idx + 1) % len(self.frames.frames)
+        self._show_frame()
+
+
+class OverlayPool:
+    """
+    The overlay windows reaction animations play in, created once at startup
+
+    Showing a reaction borrows a window and swaps its movie source (or the clip player
+    it shows), so no windows or players are created or destroyed after startup.
+    Windows are handed out least recently used first; when every window is busy the
+    oldest one is taken over.
+    """
+
+    def __init__(self, count=OVERLAY_WINDOWS, clip_players=CLIP_PLAYERS):
+        self.clips = ClipPlayerPool(clip_players)
+        self.windows = [OverlayWindow("animation {}".format(i + 1), self.clips)
+            for i in range(count)]
+        SCREEN_PROFILE.add_listener(self.resize_to_screen)
+
+    def warm(self, path):
+        """
+        gets an upcoming animation ready: a GIF's frames are decoded into the frame
+        cache (and kept there until it plays), a video clip is loaded (paused) in the
+        least recently used idle clip player
+        """
+        if not is_video(path):
+            size = SCREEN_PROFILE.device(ANIMATION_SIZE)
+            FRAME_CACHE.request(GIF_CACHE.lookup(path, size), size, pin=True)
+            return
+        self.clips.warm(path)
+
+    def unwarm(self, path):
+        """lets the frame cache evict a warmed GIF that isn't going to play after all"""
+        if not is_video(path):
+            size = SCREEN_PROFILE.device(ANIMATION_SIZE)
+            FRAME_CACHE.unpin(GIF_CACHE.lookup(path, size), size)
+
+    def acquire(self, owner):
+        # the least recently used idle window
+        idle = [w for w in self.windows if w.owner is None]
+        window = idle[0] if idle else self.windows[0]
+        if window.owner is not None:
+            logging.info("every overlay window is busy, taking over the oldest")
+            window.stop()
+
+        # move it to the back of the line
+        self.windows.remove(window)
+        self.windows.append(window)
+        window.owner = owner
+        return window
+
+    def release(self, window, owner):
+        """hides the window unless it has since been handed to someone else"""
+        if window.owner is not owner:
+            return
+        window.stop()
+        window.owner = None
+
+    def resize_to_screen(self):
+        for window in self.windows:
+            window.resize_to_screen()
+
+    def close(self):
+        for window in self.windows:
+            window.stop()
+            window.close()
+        self.clips.close()
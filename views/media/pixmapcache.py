@@ -0,0 +1,207 @@
+# imports
+import os
+from collections import OrderedDict
+
+# PyQt imports
+from PyQt5.QtCore import QSize, Qt
+from PyQt5.QtGui import QImage, QImageIOHandler, QImageReader, QPixmap
+
+# pre-scaled on-disk asset cache
+from views.media.assetcache import ASSET_CACHE
+
+# scale of the screen the scoreboard is shown on
+from views.media.screen import SCREEN_PROFILE
+
+# decoded media accounting
+from views.media.budget import MEDIA_BUDGET
+
+# logging
+import logging
+
+# DEFAULT PIXMAP CACHE BUDGET (bytes of decoded pixels kept in memory)
+DEFAULT_PIXMAP_CACHE_BYTES = 64 * 1024 * 1024
+
+
+def pixmap_nbytes(pixmap):
+    """number of bytes a decoded pixmap occupies"""
+    return pixmap.width() * pixmap.height() * max(pixmap.depth(), 8) // 8
+
+
+def decode_image(path, width):
+    """
+    grabs an RGBA QImage of an image file resized to a known width; pre-scaled buffers
+    come straight from the on-disk asset cache, otherwise the source is decoded and
+    written through to it (QImage is safe to build off the GUI thread, QPixmap is not)
+    """
+    qImg = ASSET_CACHE.load(path, width)
+    if qImg is not None:
+        return qImg
+
+    qImg = decode_source_image(path, width)
+    ASSET_CACHE.store(path, width, qImg)
+    return qImg
+
+
+def decode_source_image(path, width):
+    """
+    decodes an image file straight to a known width (maintaining aspect ratio) with
+    QImageReader, so jpgs are DCT-scaled while decoding and the full-size image is never
+    converted or resized in Python
+    """
+    reader = QImageReader(path)
+    reader.setAutoTransform(True)
+
+    # the stored size is read from the header without decoding any pixels
+    size = reader.size()
+    if size.isValid():
+        # portrait photos may be stored sideways with an EXIF rotation
+        rotated = bool(reader.transformation() & QImageIOHandler.TransformationRotate90)
+        (w, h) = (size.height(), size.width()) if rotated else (size.width(), size.height())
+
+        # the same rounding imutils.resize uses, so widgets keep their size
+        height = max(1, int(h * (width / float(w))))
+        reader.setScaledSize(QSize(height, width) if rotated else QSize(width, height))
+
+    qImg = reader.read()
+    if qImg.isNull():
+        raise FileNotFoundError("could not decode image at {}: {}".format(
+            path, reader.errorString()))
+
+    # formats without a size in the header are scaled after decoding
+    if not size.isValid():
+        qImg = qImg.scaledToWidth(width, Qt.SmoothTransformation)
+
+    # use the alpha transparency format
+    return qImg.convertToFormat(QImage.Format_RGBA8888)
+
+
+class PixmapCache:
+    """
+    Process-wide LRU cache of decoded and scaled QPixmaps keyed by (path, width, mtime)
+
+    Widths are design pixels; each asset is decoded at the physical width for the current
+    screen profile and cached per (device width, device pixel ratio), so every screen
+    geometry gets its own crisp variant.  Lookups are made from the GUI thread.  The
+    cache reports into the media budget, which evicts least recently used entries once
+    the decoded pixels exceed `max_bytes` (or the global media budget needs room).
+    """
+
+    def __init__(self, max_bytes=DEFAULT_PIXMAP_CACHE_BYTES, category="pixmaps"):
+        self.max_bytes = max_bytes
+        self.category = category
+        self.bytes_used = 0
+        self.hits = 0
+        self.misses = 0
+
+        # (abspath, device width, dpr) -> (mtime, pixmap), least -> most recently used
+        self._entries = OrderedDict()
+
+        # pixmap cacheKey -> (path, design width) of every cached pixmap, so a pixmap on
+        # screen can be drawn again at a new screen scale
+        self._sources = {}
+        MEDIA_BUDGET.register(category, limit=max_bytes, evict=self.trim)
+
+    def key(self, path, width):
+        """returns the cache key and the current modification time of the file"""
+        path = os.path.abspath(path)
+        key = (path, SCREEN_PROFILE.device(width), SCREEN_PROFILE.dpr)
+        return key, os.path.getmtime(path)
+
+    def contains(self, path, width):
+        """true if a current (not stale) pixmap is cached"""
+        key, mtime = self.key(path, width)
+        entry = self._entries.get(key)
+        return entry is not None and entry[0] == mtime
+
+    def get(self, path, width):
+        """returns a ready QPixmap for the image, decoding it only on a cache miss"""
+        key, mtime = self.key(path, width)
+        entry = self._entries.get(key)
+
+        # cache hit
+        if entry is not None and entry[0] == mtime:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return entry[1]
+
+        # cache miss (or the file changed on disk)
+        self.misses += 1
+        logging.debug("pixmap cache miss: {} @ {}px".format(path, key[1]))
+        return self._store(key, mtime, decode_image(path, key[1]), width)
+
+    def insert(self, path, width, qImg):
+        """
+        caches an already decoded QImage (e.g. from a worker thread) as a QPixmap; images
+        decoded for a previous screen profile are dropped
+        """
+        key, mtime = self.key(path, width)
+        if qImg.width() != key[1]:
+            return None
+        return self._store(key, mtime, qImg, width)
+
+    def rescaled(self, pixmap):
+        """
+        the image a cached pixmap shows, at the current screen scale (None if the pixmap
+        isn't from the cache)
+        """
+        source = self._sources.get(pixmap.cacheKey())
+        if source is None:
+            return None
+        return self.get(*source)
+
+    def set_max_bytes(self, max_bytes):
+        """changes the byte budget, evicting entries if needed"""
+        self.max_bytes = max_bytes
+        MEDIA_BUDGET.set_limit(self.category, max_bytes)
+
+    def clear(self):
+        self._entries.clear()
+        self._sources.clear()
+        MEDIA_BUDGET.release(self.category, self.bytes_used)
+        self.bytes_used = 0
+
+    def trim(self, nbytes):
+        """evicts least recently used pixmaps until `nbytes` are freed (keeps the newest)"""
+        freed = 0
+        while freed < nbytes and len(self._entries) > 1:
+            key, (mtime, pixmap) = self._entries.popitem(last=False)
+            self._sources.pop(pixmap.cacheKey(), None)
+            freed += self._account(-pixmap_nbytes(pixmap))
+            logging.debug("pixmap cache evicted {} @ {}px".format(key[0], key[1]))
+        return freed
+
+    def _store(self, key, mtime, qImg, width):
+        # replace a stale entry
+        self._discard(key)
+
+        # convert on the GUI thread and account for the new pixels
+        pixmap = QPixmap.fromImage(qImg)
+        pixmap.setDevicePixelRatio(key[2])
+        self._entries[key] = (mtime, pixmap)
+        self._sources[pixmap.cacheKey()] = (key[0], width)
+        self._account(pixmap_nbytes(pixmap))
+        return pixmap
+
+    def _discard(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._sources.pop(entry[1].cacheKey(), None)
+            self._account(-pixmap_nbytes(entry[1]))
+
+    def _account(self, nbytes):
+        # the budget may call back into trim() when charged
+        self.bytes_used += nbytes
+        if nbytes > 0:
+            MEDIA_BUDGET.charge(self.category, nbytes)
+        else:
+            MEDIA_BUDGET.release(self.category, -nbytes)
+        return abs(nbytes)
+
+
+# the shared cache used by every scoreboard view
+PIXMAP_CACHE = PixmapCache()
+
+
+def load_pixmap(path, width):
+    """grabs a decoded and scaled QPixmap from the shared cache"""
+    return PIXMAP_CACHE.get(path, width)
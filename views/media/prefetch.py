@@ -0,0 +1,115 @@
+# imports
+import os
+import random
+import threading
+
+# in-memory index of the sound and animation files
+from views.media.catalog import MEDIA_CATALOG
+
+# logging
+import logging
+
+
+class ShuffleBag:
+    """
+    Draws items in a random order without repeats until every item has come up
+
+    Each refill is a fresh shuffle; if it would start with the item just drawn, that
+    item is swapped to the back so nothing plays twice in a row (with two or more items).
+    A draw is a list pop.
+    """
+
+    def __init__(self, items):
+        self.items = list(items)
+        self.last = None
+        self._bag = []
+
+    def draw(self):
+        if len(self.items) == 0:
+            return None
+        if len(self._bag) == 0:
+            self._bag = list(self.items)
+            random.shuffle(self._bag)
+
+            # items are popped from the end
+            if len(self._bag) > 1 and self._bag[-1] == self.last:
+                self._bag[0], self._bag[-1] = self._bag[-1], self._bag[0]
+        self.last = self._bag.pop()
+        return self.last
+
+
+def _read_file(path):
+    try:
+        with open(path, "rb") as f:
+            while f.read(1024 * 1024):
+                pass
+    except OSError as e:
+        logging.debug("couldn't prefetch {}: {}".format(path, str(e)))
+
+
+def warm_sound(path):
+    """reads a sound file into the OS page cache on a background thread"""
+    threading.Thread(target=_read_file, args=(path,), daemon=True).start()
+
+
+class MediaPrefetcher:
+    """
+    Picks the next random item of each media directory ahead of time and warms it
+
+    `take(dir)` hands back the item chosen (and warmed) after the previous press, then
+    chooses and warms the one after it, so a press plays media that is already decoded
+    or in the page cache.  Picks come from a shuffle bag per directory, rebuilt when the
+    media catalog's list for the directory changes; `unwarm` (if given) is called with a
+    pick that was dropped that way without being taken.
+    """
+
+    def __init__(self, exts, warm, unwarm=None):
+        self.exts = exts
+        self.warm = warm
+        self.unwarm = unwarm
+
+        # abspath -> [catalog list the bag was built from, ShuffleBag, next item]
+        self._dirs = {}
+        self.hits = 0
+        self.misses = 0
+
+    def prime(self, dirs):
+        """chooses and warms the first item of each directory"""
+        for path in dirs:
+            self._state(path)
+
+    def take(self, path):
+        """the next item of a directory (None if it's empty)"""
+        state = self._state(path)
+        item = state[2]
+        if item is None:
+            return None
+
+        # an item that was chosen before the file was removed is skipped
+        if not os.path.isfile(item):
+            self.misses += 1
+            item = state[1].draw()
+        else:
+            self.hits += 1
+        state[2] = state[1].draw()
+        if state[2] is not None:
+            self.warm(state[2])
+        return item
+
+    def log_stats(self):
+        logging.info("prefetched {} picks, {} misses".format(self.hits, self.misses))
+
+    def _state(self, path):
+        path = os.path.abspath(path)
+        files = MEDIA_CATALOG.files(path, self.exts)
+        state = self._dirs.get(path)
+        if state is None or state[0] is not files:
+            bag = ShuffleBag(files)
+            dropped = state[2] if state is not None else None
+            state = [files, bag, bag.draw()]
+            self._dirs[path] = state
+            if dropped is not None and dropped != state[2] and self.unwarm is not None:
+                self.unwarm(dropped)
+            if state[2] is not None:
+                self.warm(state[2])
+        return state
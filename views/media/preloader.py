@@ -0,0 +1,111 @@
+# imports
+import os
+import time
+
+# PyQt imports
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, QThread, pyqtSignal
+
+# shared decoded pixmap cache
+from views.media.pixmapcache import PIXMAP_CACHE, decode_image
+
+# scale of the screen the scoreboard is shown on
+from views.media.screen import SCREEN_PROFILE
+
+# logging
+import logging
+
+
+class DecodeSignals(QObject):
+    """signals emitted by decode tasks (QRunnable can't emit signals itself)"""
+    # the QImage is passed as a python object so a memory-mapped image keeps its mapping
+    decoded = pyqtSignal(str, int, object)
+    failed = pyqtSignal(str, int, str)
+
+
+class DecodeTask(QRunnable):
+    """decodes and scales one image on a QThreadPool worker"""
+
+    def __init__(self, path, width, signals):
+        super().__init__()
+        self.path = path
+        self.width = width
+        self.signals = signals
+
+    def run(self):
+        try:
+            qImg = decode_image(self.path, SCREEN_PROFILE.device(self.width))
+        except Exception as e:
+            self.signals.failed.emit(self.path, self.width, str(e))
+            return
+        self.signals.decoded.emit(self.path, self.width, qImg)
+
+
+class AssetPreloader(QObject):
+    """
+    Decodes a list of (path, width) assets on a thread pool and fills the pixmap cache
+
+    Decoding happens on worker threads and the QImage -> QPixmap conversion happens back
+    on the GUI thread (via queued signals), so the window keeps accepting input while the
+    cache fills.
+    """
+    # emitted as (assets done, assets total)
+    progress = pyqtSignal(int, int)
+    # emitted once every asset has been decoded (or failed)
+    ready = pyqtSignal()
+
+    def __init__(self, assets, cache=PIXMAP_CACHE, parent=None):
+        super().__init__(parent)
+        self.cache = cache
+
+        # skip duplicates and files that aren't on this box (e.g. a missing media dir)
+        self.assets = []
+        for path, width in assets:
+            if (path, width) in self.assets:
+                continue
+            if not os.path.isfile(path):
+                logging.debug("preloader skipping missing asset {}".format(path))
+                continue
+            self.assets.append((path, width))
+
+        self.total = len(self.assets)
+        self.done = 0
+        self._started = None
+
+        # leave a core free for the GUI thread
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(max(1, QThread.idealThreadCount() - 1))
+
+        # signals are created on the GUI thread so decoded images are delivered here
+        self.signals = DecodeSignals()
+        self.signals.decoded.connect(self._on_decoded)
+        self.signals.failed.connect(self._on_failed)
+
+    def start(self):
+        logging.info("preloading {} graphics in the background".format(self.total))
+        self._started = time.perf_counter()
+        if self.total == 0:
+            self.ready.emit()
+            return
+        for path, width in self.assets:
+            self.pool.start(DecodeTask(path, width, self.signals))
+
+    def is_ready(self):
+        return self.done >= self.total
+
+    def _on_decoded(self, path, width, qImg):
+        # the GUI thread may have needed (and decoded) this asset already
+        if not self.cache.contains(path, width):
+            self.cache.insert(path, width, qImg)
+        self._advance()
+
+    def _on_failed(self, path, width, error):
+        logging.warning("couldn't preload {} @ {}px: {}".format(path, width, error))
+        self._advance()
+
+    def _advance(self):
+        self.done += 1
+        self.progress.emit(self.done, self.total)
+        if self.is_ready():
+            logging.info("preloaded {} graphics in {:.2f}s".format(
+                self.total, time.perf_counter() - self._started))
+            self.ready.emit()
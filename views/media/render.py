@@ -0,0 +1,194 @@
+# PyQt imports
+from PyQt5.QtCore import QEvent, QObject
+
+# scale of the screen the scoreboard is shown on (for its refresh rate)
+from views.media.screen import SCREEN_PROFILE
+
+# logging
+import logging
+
+# other imports
+import time
+
+# refresh rate assumed until the window is on a screen
+DEFAULT_REFRESH_RATE = 60
+
+
+class PaintTimer(QObject):
+    """
+    times each backing store sync of a top level window (the event Qt paints every
+    widget with a pending update in, together)
+    """
+
+    def __init__(self, scheduler):
+        super().__init__()
+        self.scheduler = scheduler
+        self.windows = set()
+
+    def watch(self, window):
+        if window in self.windows:
+            return
+        self.windows.add(window)
+        window.installEventFilter(self)
+
+    def eventFilter(self, obj, event):
+        if event.type() != QEvent.UpdateRequest:
+            return False
+
+        # deliver it here so the paint can be timed end to end
+        start = time.perf_counter()
+        obj.event(event)
+        self.scheduler.painted(obj, time.perf_counter() - start)
+        return True
+
+
+class RenderScheduler:
+    """
+    Keeps track of the widgets waiting to be painted and how long Qt takes to paint them
+
+    Changing a label posts a Qt update, and Qt paints every pending update of a window
+    together in one frame.  A burst of label updates (e.g. locking in a frame score)
+    marks each widget dirty; the frame that paints them is timed from its paint event,
+    and frames that overrun the frame budget are logged.  `flush()` is called right
+    before nested waits (animations, announcements) and posts an update for anything
+    still dirty, which Qt coalesces with the update already pending, so nothing is
+    painted twice.
+    """
+
+    def __init__(self):
+        # widget -> None, ordered by when the widget was first marked dirty
+        self._dirty = {}
+        self._paint_timer = None
+
+        # frame stats
+        self.frames = 0
+        self.widgets_painted = 0
+        self.marks = 0
+        self.overruns = 0
+        self.paint_seconds = 0.0
+        self.max_paint_seconds = 0.0
+
+    def frame_interval(self):
+        """returns the display frame interval in milliseconds"""
+        refresh_rate = DEFAULT_REFRESH_RATE
+        if SCREEN_PROFILE.screen is not None and SCREEN_PROFILE.screen.refreshRate() > 0:
+            refresh_rate = SCREEN_PROFILE.screen.refreshRate()
+        return int(1000 / refresh_rate)
+
+    def mark_dirty(self, widget):
+        """records a widget that has changed and will be painted at the next frame"""
+        self.marks += 1
+        self._dirty[widget] = None
+
+        # the paint timer is created lazily so it belongs to the running application
+        if self._paint_timer is None:
+            self._paint_timer = PaintTimer(self)
+        self._paint_timer.watch(widget.window())
+
+    def flush(self):
+        """posts an update for every widget that hasn't been painted yet"""
+        for widget in list(self._dirty):
+            try:
+                widget.update()
+            except RuntimeError:
+                # the widget was deleted before the frame was drawn
+                del self._dirty[widget]
+
+    def painted(self, window, elapsed):
+        """called with how long a window took to paint its pending updates"""
+        dirty = []
+        for widget in list(self._dirty):
+            try:
+                if widget.window() is not window:
+                    continue
+            except RuntimeError:
+                pass
+            dirty.append(widget)
+            del self._dirty[widget]
+
+        # frame stats
+        self.frames += 1
+        self.widgets_painted += len(dirty)
+        self.paint_seconds += elapsed
+        self.max_paint_seconds = max(self.max_paint_seconds, elapsed)
+        if elapsed * 1000 > self.frame_interval():
+            self.overruns += 1
+            logging.warning("frame painted {} widgets in {:.1f} ms (over budget)".format(
+                len(dirty), elapsed * 1000))
+        else:
+            logging.debug("frame painted {} widgets in {:.1f} ms".format(
+                len(dirty), elapsed * 1000))
+
+    def log_stats(self):
+        average = self.paint_seconds / self.frames if self.frames else 0.0
+        logging.info("frames painted: {} ({} marked widgets for {} updates), "
+            "paint time avg {:.1f} ms, max {:.1f} ms, over budget: {}".format(
+            self.frames, self.widgets_painted, self.marks, average * 1000,
+            self.max_paint_seconds * 1000, self.overruns))
+
+
+# the shared scheduler used by every scoreboard view
+RENDER_SCHEDULER = RenderScheduler()
+
+
+class RedrawTracker:
+    """
+    Skips label redraws when the label already shows the same asset at the same size
+
+    What a label shows is identified by its pixmap's cacheKey and size.  Cached pixmaps
+    are shared per (path, width), so drawing the same cached asset twice yields the same
+    key.  The label's own pixmap is the record of what is on screen, so a label changed
+    behind the tracker's back (e.g. `setText`) is never skipped by mistake.  Changed labels
+    are painted by Qt at the next frame and recorded with the render scheduler.
+    """
+
+    def __init__(self):
+        self.performed = 0
+        self.avoided = 0
+
+    def shown(self, label):
+        """returns (cacheKey, width, height) of what a label shows, or None if it's empty"""
+        pixmap = label.pixmap()
+        if pixmap is None or pixmap.isNull():
+            return None
+        return (pixmap.cacheKey(), pixmap.width(), pixmap.height())
+
+    def draw(self, label, pixmap):
+        """sets a label's pixmap and schedules a repaint unless it's already showing it"""
+        if self.shown(label) == (pixmap.cacheKey(), pixmap.width(), pixmap.height()):
+            self.avoided += 1
+            logging.debug("skipped redundant redraw of {}".format(label.objectName()))
+            return False
+        label.setPixmap(pixmap)
+        RENDER_SCHEDULER.mark_dirty(label)
+        self.performed += 1
+        return True
+
+    def clear(self, label):
+        """clears a label and schedules a repaint unless it's already empty"""
+        if self.shown(label) is None and not label.text():
+            self.avoided += 1
+            logging.debug("skipped redundant clear of {}".format(label.objectName()))
+            return False
+        label.clear()
+        RENDER_SCHEDULER.mark_dirty(label)
+        self.performed += 1
+        return True
+
+    def log_stats(self):
+        logging.info("label redraws performed: {}, avoided: {}".format(
+            self.performed, self.avoided))
+
+
+# the shared tracker used by every scoreboard view
+REDRAW_TRACKER = RedrawTracker()
+
+
+def draw_pixmap(label, pixmap):
+    """draws a pixmap in a label, skipping the redraw if nothing changed"""
+    return REDRAW_TRACKER.draw(label, pixmap)
+
+
+def clear_label(label):
+    """clears a label, skipping the redraw if it's already empty"""
+    return REDRAW_TRACKER.clear(label)
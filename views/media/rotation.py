@@ -0,0 +1,164 @@
+# imports
+import os
+
+# PyQt imports
+from PyQt5.QtCore import QObject, QPoint, QTimer, Qt
+from PyQt5.QtGui import QPainter, QPixmap
+
+# shared decoded pixmap cache and background preloader
+from views.media.pixmapcache import load_pixmap
+from views.media.preloader import AssetPreloader
+
+# label redraws that skip unchanged content
+from views.media.render import draw_pixmap
+
+# scale of the screen the scoreboard is shown on
+from views.media.screen import SCREEN_PROFILE
+
+# logging
+import logging
+
+# ROTATION TIMING
+SPONSOR_ROTATION_SECONDS = 15
+CROSSFADE_MS = 600
+CROSSFADE_STEPS = 12
+
+
+class RotationSlot:
+    """one sponsor label and the logos it cycles through"""
+
+    def __init__(self, label, paths, width):
+        self.label = label
+        self.paths = paths
+        self.width = width
+        self.idx = 0
+
+        # resolved from the pixmap cache once the set is preloaded
+        self.pixmaps = []
+
+        # crossfade in progress: (from pixmap, to pixmap)
+        self.fade = None
+
+    def current(self):
+        return self.pixmaps[self.idx] if self.pixmaps else None
+
+
+class SponsorRotation(QObject):
+    """
+    Cycles sponsor labels through their logos on a timer with a short crossfade
+
+    Each slot's rotation set is decoded into the pixmap cache in the background and the
+    resulting pixmaps are held by the slot, so a swap never touches the disk.  The
+    rotation pauses (finishing any crossfade at once) while animations play, so it never
+    competes with them for the CPU.
+    """
+
+    def __init__(self, parent=None, seconds=SPONSOR_ROTATION_SECONDS):
+        super().__init__(parent)
+        self.slots = []
+        self.preloader = None
+        self._paused = 0
+
+        # rotation and crossfade timers
+        self.timer = QTimer(self)
+        self.timer.setInterval(int(seconds * 1000))
+        self.timer.timeout.connect(self.rotate)
+        self.fade_timer = QTimer(self)
+        self.fade_timer.setInterval(int(CROSSFADE_MS / CROSSFADE_STEPS))
+        self.fade_timer.timeout.connect(self._fade_step)
+        self._fade_step_idx = 0
+
+        # screen changes re-resolve the pixmaps at the new scale
+        SCREEN_PROFILE.add_listener(self._resolve)
+
+    def add_slot(self, label, paths, width):
+        """registers a label and its rotation set (missing files are left out)"""
+        paths = [path for path in paths if os.path.isfile(path)]
+        if not paths:
+            logging.warning("no sponsor logos found for {}".format(label.objectName()))
+            return
+        self.slots.append(RotationSlot(label, paths, width))
+
+    def manifest(self):
+        """lists every (path, width) logo in every rotation set"""
+        return [(path, slot.width) for slot in self.slots for path in slot.paths]
+
+    def show_first(self):
+        """draws each slot's first logo right away (decoding it if it isn't cached)"""
+        for slot in self.slots:
+            draw_pixmap(slot.label, load_pixmap(slot.paths[0], slot.width))
+
+    def start(self):
+        """preloads every rotation set, shows each slot's first logo, then rotates"""
+        self.preloader = AssetPreloader(self.manifest(), parent=self)
+        self.preloader.ready.connect(self._on_ready)
+        self.preloader.start()
+
+    def pause(self):
+        """stops rotating (nestable) and snaps any crossfade to its final logo"""
+        self._paused += 1
+        self.timer.stop()
+        if self.fade_timer.isActive():
+            self._fade_step_idx = CROSSFADE_STEPS
+            self._fade_step()
+
+    def resume(self):
+        self._paused = max(0, self._paused - 1)
+        if self._paused == 0 and self.slots and self.slots[0].pixmaps:
+            self.timer.start()
+
+    def rotate(self):
+        """starts a crossfade to the next logo in every slot with more than one"""
+        for slot in self.slots:
+            if len(slot.pixmaps) < 2:
+                continue
+            previous = slot.current()
+            slot.idx = (slot.idx + 1) % len(slot.pixmaps)
+            slot.fade = (previous, slot.current())
+        self._fade_step_idx = 0
+        self.fade_timer.start()
+
+    def _on_ready(self):
+        self._resolve()
+        if self._paused == 0:
+            self.timer.start()
+
+    def _resolve(self):
+        # every logo is in the pixmap cache by now, so these are all cache hits
+        for slot in self.slots:
+            slot.pixmaps = [load_pixmap(path, slot.width) for path in slot.paths]
+            slot.idx = min(slot.idx, len(slot.pixmaps) - 1)
+            slot.fade = None
+            draw_pixmap(slot.label, slot.current())
+
+    def _fade_step(self):
+        self._fade_step_idx += 1
+        opacity = min(1.0, self._fade_step_idx / float(CROSSFADE_STEPS))
+        for slot in self.slots:
+            if slot.fade is None:
+                continue
+            if opacity >= 1.0:
+                draw_pixmap(slot.label, slot.current())
+                slot.fade = None
+            else:
+                draw_pixmap(slot.label, crossfade(slot.fade[0], slot.fade[1], opacity))
+        if opacity >= 1.0:
+            self.fade_timer.stop()
+
+
+def crossfade(old, new, opacity):
+    """blends two pixmaps (centered on each other) with `new` drawn at `opacity`"""
+    dpr = new.devicePixelRatio()
+    size = old.size().expandedTo(new.size())
+    frame = QPixmap(size)
+    frame.setDevicePixelRatio(dpr)
+    frame.fill(Qt.transparent)
+
+    # positions are in logical pixels because the frame has the logos' pixel ratio
+    painter = QPainter(frame)
+    for pixmap, alpha in ((old, 1.0 - opacity), (new, opacity)):
+        painter.setOpacity(alpha)
+        painter.drawPixmap(QPoint(int((size.width() - pixmap.width()) / (2 * dpr)),
+            int((size.height() - pixmap.height()) / (2 * dpr))), pixmap)
+    painter.end()
+    return frame
@@ -0,0 +1,164 @@
+# imports
+import time
+
+# PyQt imports
+from PyQt5.QtCore import QObject, QTimer
+
+# logging
+import logging
+
+# PRIORITY CLASSES (higher wins)
+REACTION = 0
+GAME_STATUS = 1
+ANNOUNCEMENT = 2
+PRIORITY_NAMES = {REACTION: "reaction", GAME_STATUS: "game status",
+    ANNOUNCEMENT: "announcement"}
+
+# waiting requests (four player announcements plus a couple of game status calls)
+MAX_QUEUED = 6
+
+# a repeat of the same request within this many seconds is dropped
+COALESCE_SECONDS = 1.5
+
+
+class MediaRequest:
+    """
+    One sound / animation to show: `play()` starts it and returns the Animation it
+    started (or None for sound-only media, which is treated as lasting `duration`
+    seconds).  `gap` seconds are left before whatever is queued behind it.
+    """
+
+    def __init__(self, priority, key, play, gap=0, duration=0):
+        self.priority = priority
+        self.key = key
+        self.play = play
+        self.gap = gap
+        self.duration = duration
+        self.submitted = time.monotonic()
+
+    def __str__(self):
+        return "{} {}".format(PRIORITY_NAMES.get(self.priority, self.priority), self.key)
+
+
+class AnimationScheduler(QObject):
+    """
+    Decides what the overlay shows when more than one thing wants it
+
+    - the same request pressed again while it's showing (or waiting) is coalesced
+    - a higher priority request preempts what's on screen; a reaction replaces a
+      reaction, so the latest press wins instead of stacking
+    - announcements and game status calls queue (in priority, then submission order)
+      and play one after another without a nested wait; reactions never queue, they're
+      dropped while something more important is showing
+    - the queue holds at most `max_queued` requests; the lowest priority, newest one is
+      dropped beyond that
+    """
+
+    def __init__(self, max_queued=MAX_QUEUED, coalesce_seconds=COALESCE_SECONDS,
+                 parent=None):
+        super().__init__(parent)
+        self.max_queued = max_queued
+        self.coalesce_seconds = coalesce_seconds
+        self.current = None
+        self.animation = None
+        self.queue = []
+
+        # the pause after a request (and the length of sound-only requests)
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self._timeout)
+
+        # counters
+        self.played = 0
+        self.coalesced = 0
+        self.preempted = 0
+        self.dropped = 0
+
+    def submit(self, request):
+        """plays, queues or drops a request; returns True unless it was dropped"""
+        now = time.monotonic()
+        for other in [self.current] + self.queue:
+            if other is not None and other.key == request.key and \
+                    now - other.submitted < self.coalesce_seconds:
+                logging.debug("coalescing {}".format(request))
+                self.coalesced += 1
+                return False
+
+        # the current request stays current through its gap
+        if self.current is None:
+            self._play(request)
+            return True
+        if request.priority > self.current.priority or \
+                request.priority == self.current.priority == REACTION:
+            logging.info("{} preempts {}".format(request, self.current))
+            self.preempted += 1
+            self._stop_current()
+            self._play(request)
+            return True
+        if request.priority == REACTION:
+            logging.debug("dropping {} while {} shows".format(request, self.current))
+            self.dropped += 1
+            return False
+        return self._enqueue(request)
+
+    def clear(self):
+        """drops everything queued and stops what's showing"""
+        self.queue = []
+        self._stop_current()
+
+    def log_stats(self):
+        logging.info("animation scheduler: {} played, {} coalesced, {} preempted, "
+                     "{} dropped".format(self.played, self.coalesced, self.preempted,
+                                         self.dropped))
+
+    def _enqueue(self, request):
+        self.queue.append(request)
+
+        # a stable sort keeps submission order within a priority
+        self.queue.sort(key=lambda r: -r.priority)
+        while len(self.queue) > self.max_queued:
+            dropped = self.queue.pop()
+            logging.warning("animation queue is full, dropping {}".format(dropped))
+            self.dropped += 1
+        return request in self.queue
+
+    def _play(self, request):
+        self.current = request
+        self.played += 1
+        logging.info("playing {}".format(request))
+        try:
+            animation = request.play()
+        except Exception as e:
+            # a broken request mustn't hold up everything queued behind it
+            logging.warning("couldn't play {}: {}".format(request, str(e)))
+            animation = None
+        if animation is None:
+            self.timer.start(int((request.duration + request.gap) * 1000))
+            return
+
+        # an animation that couldn't start has already finished
+        if animation.is_done():
+            self.timer.start(int(request.gap * 1000))
+            return
+        self.animation = animation
+        animation.finished.connect(lambda: self._finished(request))
+
+    def _stop_current(self):
+        # forget the request first so its animation's finished signal is ignored
+        self.current = None
+        self.timer.stop()
+        animation = self.animation
+        self.animation = None
+        if animation is not None:
+            animation.quit()
+
+    def _finished(self, request):
+        if request is not self.current:
+            return
+        self.animation = None
+        self.timer.start(int(request.gap * 1000))
+
+    def _timeout(self):
+        self.current = None
+        if self.queue:
+            self._play(self.queue.pop(0))
@@ -0,0 +1,85 @@
+# PyQt imports
+from PyQt5.QtGui import QGuiApplication
+
+# logging
+import logging
+
+# the screen resolution the pixel size constants (logo widths, card widths, etc.) were
+# designed for
+DESIGN_WIDTH = 1920
+DESIGN_HEIGHT = 1080
+
+
+class ScreenProfile:
+    """
+    Scale of the screen the scoreboard is shown on relative to the design resolution
+
+    Sizes in the views are design pixels.  `logical()` converts them to layout pixels for
+    this screen and `device()` to the physical pixels an asset should be decoded at
+    (layout pixels times the device pixel ratio).  Views register listeners to re-render
+    their cached assets when the window moves to another screen or the screen changes.
+    """
+
+    def __init__(self):
+        self.width = DESIGN_WIDTH
+        self.height = DESIGN_HEIGHT
+        self.dpr = 1.0
+        self.scale = 1.0
+        self.screen = None
+        self._listeners = []
+
+    def attach(self, window):
+        """follows the screen a top level window is shown on"""
+        handle = window.windowHandle()
+        if handle is not None:
+            handle.screenChanged.connect(self.update)
+            self.update(handle.screen())
+        else:
+            self.update(QGuiApplication.primaryScreen())
+
+    def add_listener(self, callback):
+        """calls `callback()` whenever the screen profile changes"""
+        self._listeners.append(callback)
+
+    def update(self, screen):
+        if screen is None:
+            return
+
+        # follow resolution / scaling changes of the screen itself too
+        if screen is not self.screen:
+            if self.screen is not None:
+                try:
+                    self.screen.geometryChanged.disconnect(self._geometry_changed)
+                    self.screen.physicalDotsPerInchChanged.disconnect(self._geometry_changed)
+                except TypeError:
+                    pass
+            screen.geometryChanged.connect(self._geometry_changed)
+            screen.physicalDotsPerInchChanged.connect(self._geometry_changed)
+            self.screen = screen
+
+        geometry = screen.geometry()
+        profile = (geometry.width(), geometry.height(), screen.devicePixelRatio())
+        if profile == (self.width, self.height, self.dpr):
+            return
+        (self.width, self.height, self.dpr) = profile
+        self.scale = min(self.width / float(DESIGN_WIDTH), self.height / float(DESIGN_HEIGHT))
+        logging.info("screen is {}x{} @ {}x, scaling graphics by {:.2f}".format(
+            self.width, self.height, self.dpr, self.scale))
+
+        for callback in self._listeners:
+            callback()
+
+    def logical(self, size):
+        """converts a design size to layout pixels on this screen"""
+        return max(1, int(round(size * self.scale)))
+
+    def device(self, size):
+        """converts a design size to the physical pixels an asset should be decoded at"""
+        return max(1, int(round(size * self.scale * self.dpr)))
+
+    def _geometry_changed(self, *args):
+        self.update(self.screen)
+
+
+# the shared profile of the screen the scoreboard window is on
+SCREEN_PROFILE = ScreenProfile()
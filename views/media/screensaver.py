@@ -0,0 +1,219 @@
+# imports
+import os
+
+# PyQt imports
+from PyQt5.QtCore import QEvent, QRunnable, QSize, QThreadPool, QTimer, Qt
+from PyQt5.QtGui import QImageReader, QPainter, QPixmap
+from PyQt5.QtWidgets import QApplication, QWidget
+
+# decode task signals
+from views.media.preloader import DecodeSignals
+
+# scale of the screen the scoreboard is shown on
+from views.media.screen import SCREEN_PROFILE
+
+# decoded media accounting
+from views.media.budget import MEDIA_BUDGET
+
+# logging
+import logging
+
+# other imports
+from imutils import paths
+
+# SCREENSAVER DEFAULTS
+SCREENSAVER_DIR = os.path.join("views", "oddball_graphics", "screensaver")
+SCREENSAVER_IDLE_MINUTES = 5
+SCREENSAVER_SLIDE_SECONDS = 10
+
+
+class SlideDecodeTask(QRunnable):
+    """decodes one slide scaled to fit the screen on a QThreadPool worker"""
+
+    def __init__(self, path, size, generation, signals):
+        super().__init__()
+        self.path = path
+        self.size = size
+        self.generation = generation
+        self.signals = signals
+
+    def run(self):
+        reader = QImageReader(self.path)
+        reader.setAutoTransform(True)
+        source = reader.size()
+        if source.isValid():
+            reader.setScaledSize(source.scaled(self.size, Qt.KeepAspectRatio))
+        qImg = reader.read()
+        if qImg.isNull():
+            self.signals.failed.emit(self.path, self.generation, reader.errorString())
+            return
+        self.signals.decoded.emit(self.path, self.generation, qImg)
+
+
+class Screensaver(QWidget):
+    """
+    Fullscreen photo slideshow shown after the scoreboard sits idle between games
+
+    The next slide is decoded on a worker thread while the current one is shown, so at
+    most two frames are held: the slide on screen and the one decoded after it.  Any
+    key press (keyboard or Sparkfun remote) or `wake()` call (ATI remote) hides the
+    slideshow immediately; a decode still in flight is ignored when it lands.
+    """
+
+    def __init__(self, is_idle, directory=SCREENSAVER_DIR,
+                 idle_minutes=SCREENSAVER_IDLE_MINUTES,
+                 slide_seconds=SCREENSAVER_SLIDE_SECONDS):
+        super().__init__(None, Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint)
+        self.setWindowTitle("screensaver")
+
+        # key presses keep going to the scoreboard (the event filter sees them first)
+        self.setAttribute(Qt.WA_ShowWithoutActivating)
+        self.setFocusPolicy(Qt.NoFocus)
+        self.focus_window = None
+        self.is_idle = is_idle
+        self.directory = directory
+        self.paths = sorted(paths.list_images(directory)) if os.path.isdir(directory) else []
+        self.idx = 0
+
+        # the slide on screen and the next decoded slide (a QImage) if it has landed
+        self.current = None
+        self.next_image = None
+        self._decoding = False
+
+        # decodes from a dismissed slideshow are dropped by generation
+        self.generation = 0
+
+        # one worker is plenty and leaves the rest of the CPU to the scoreboard
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(1)
+        self.signals = DecodeSignals()
+        self.signals.decoded.connect(self._on_decoded)
+        self.signals.failed.connect(self._on_failed)
+
+        # idle and slide timers
+        self.idle_timer = QTimer(self)
+        self.idle_timer.setSingleShot(True)
+        self.idle_timer.setInterval(int(idle_minutes * 60 * 1000))
+        self.idle_timer.timeout.connect(self._idle_timeout)
+        self.slide_timer = QTimer(self)
+        self.slide_timer.setInterval(int(slide_seconds * 1000))
+        self.slide_timer.timeout.connect(self.advance)
+
+        # watch every key press in the application
+        QApplication.instance().installEventFilter(self)
+        if self.paths:
+            self.idle_timer.start()
+        else:
+            logging.info("no screensaver images in {}".format(directory))
+
+    def is_showing(self):
+        return self.isVisible()
+
+    def wake(self):
+        """
+        restarts the idle countdown; returns True if the slideshow was dismissed (the
+        input that woke it shouldn't also drive the scoreboard)
+        """
+        if self.paths:
+            self.idle_timer.start()
+        if not self.is_showing():
+            return False
+        self.dismiss()
+        return True
+
+    def start(self):
+        logging.info("starting the screensaver slideshow")
+        self.generation += 1
+        if SCREEN_PROFILE.screen is not None:
+            self.setGeometry(SCREEN_PROFILE.screen.geometry())
+        self.focus_window = QApplication.activeWindow()
+        self.showFullScreen()
+        self._decode_next()
+        self.slide_timer.start()
+
+    def dismiss(self):
+        logging.info("dismissing the screensaver slideshow")
+        self.generation += 1
+        self.slide_timer.stop()
+        self.hide()
+
+        # in case the window manager activated the slideshow anyway
+        if self.focus_window is not None and self.focus_window is not self:
+            self.focus_window.activateWindow()
+            self.focus_window.setFocus()
+        self.focus_window = None
+
+        # free both frames; the worker's result (if any) is dropped on arrival
+        self.current = None
+        self.next_image = None
+        self._decoding = False
+        self._report()
+
+    def advance(self):
+        """shows the next slide if it has been decoded (otherwise keeps the current one)"""
+        if self.next_image is None:
+            return
+        self.current = QPixmap.fromImage(self.next_image)
+        self.current.setDevicePixelRatio(SCREEN_PROFILE.dpr)
+        self.next_image = None
+        self._report()
+        self.update()
+        self._decode_next()
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.KeyPress:
+            return self.wake()
+        return False
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), Qt.black)
+        if self.current is not None:
+            size = self.current.size() / self.current.devicePixelRatio()
+            x = int((self.width() - size.width()) / 2)
+            y = int((self.height() - size.height()) / 2)
+            painter.drawPixmap(x, y, self.current)
+        painter.end()
+
+    def _report(self):
+        # the slide on screen plus the decoded next slide
+        nbytes = 0
+        if self.current is not None:
+            nbytes += self.current.width() * self.current.height() * 4
+        if self.next_image is not None:
+            nbytes += self.next_image.sizeInBytes()
+        MEDIA_BUDGET.set("screensaver", nbytes)
+
+    def _idle_timeout(self):
+        if self.is_idle():
+            self.start()
+        else:
+            self.idle_timer.start()
+
+    def _decode_next(self):
+        if self._decoding or not self.paths:
+            return
+        path = self.paths[self.idx % len(self.paths)]
+        self.idx += 1
+        size = QSize(int(SCREEN_PROFILE.width * SCREEN_PROFILE.dpr),
+            int(SCREEN_PROFILE.height * SCREEN_PROFILE.dpr))
+        self._decoding = True
+        self.pool.start(SlideDecodeTask(path, size, self.generation, self.signals))
+
+    def _on_decoded(self, path, generation, qImg):
+        if generation != self.generation:
+            return
+        self._decoding = False
+        self.next_image = qImg
+        self._report()
+
+        # the first slide goes up as soon as it's ready
+        if self.current is None:
+            self.advance()
+
+    def _on_failed(self, path, generation, error):
+        if generation != self.generation:
+            return
+        logging.warning("couldn't decode screensaver image {}: {}".format(path, error))
+        self._decoding = False
+        self._decode_next()